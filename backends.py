@@ -0,0 +1,244 @@
+"""
+Pluggable kernel backends for the interpreter-bound loops of the centrality algorithms.
+
+The 'python' backend is the original dict-based code. The 'numba' backend runs the same loops as
+compiled kernels over CSR arrays when Numba is installed; without Numba it falls back to 'python'.
+Select a backend globally with set_backend, or per call with the backend argument of
+betweenness_centrality, closeness_centrality and page_rank_centrality.
+The kernels allocate their work arrays with the dtypes of the arrays they are given, so int32 CSR
+arrays and float32 ranks (see compact.py) stay compact.
+"""
+import warnings
+import numpy as np
+from utils import create_csr
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+BACKENDS = ("python", "numba", "auto")
+DEFAULT_BACKEND = "python"
+_backend = DEFAULT_BACKEND
+
+
+def numba_available() -> bool:
+    return numba is not None
+
+
+def set_backend(name: str) -> None:
+    """
+    Select the backend used when a centrality function is called without a backend argument.
+
+    Args:
+        name (str): 'python', 'numba', or 'auto' (numba when installed, python otherwise).
+
+    Raises:
+        ValueError: If the backend is unknown.
+    """
+    global _backend
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown backend: {name}. Choose one of {BACKENDS}.")
+    _backend = name
+
+
+def get_backend() -> str:
+    return _backend
+
+
+def resolve_backend(name: str=None) -> str:
+    """
+    Resolve a backend argument to the backend that will actually run.
+
+    Args:
+        name (str): Requested backend, or None for the global one.
+
+    Returns:
+        str: 'python' or 'numba'.
+
+    Raises:
+        ValueError: If the backend is unknown.
+    """
+    name = name or _backend
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown backend: {name}. Choose one of {BACKENDS}.")
+    if name == "python":
+        return "python"
+    if numba is None:
+        if name == "numba":
+            warnings.warn("Numba is not installed, falling back to the python backend")
+        return "python"
+    return "numba"
+
+
+def _jit(function):
+    """
+    Compile a kernel with Numba when it is installed; the plain function is kept as the kernel otherwise.
+    """
+    if numba is None:
+        return function
+    return numba.njit(cache=True)(function)
+
+
+@_jit
+def brandes_kernel(indptr, indices, betweenness, edge_scores):
+    """
+    Brandes' algorithm from every source over CSR arrays, accumulating into betweenness in place.
+
+    The backward sweep walks successors (out-neighbors one level further) instead of predecessor lists,
+    so no per-source list allocation is needed. Duplicate neighbor entries count as parallel edges,
+    like in bfs_shortest_paths. Edge dependencies are accumulated into edge_scores, indexed by CSR
+    edge position, unless it is empty.
+    """
+    accumulate_edges = len(edge_scores) > 0
+    n = len(indptr) - 1
+    sigma = np.zeros(n)
+    delta = np.zeros(n)
+    dist = np.full(n, -1, indices.dtype)
+    order = np.empty(n, indices.dtype)
+    for source in range(n):
+        sigma[source] = 1.0
+        dist[source] = 0
+        order[0] = source
+        head = 0
+        tail = 1
+        while head < tail:
+            v = order[head]
+            head += 1
+            for k in range(indptr[v], indptr[v + 1]):
+                w = indices[k]
+                if dist[w] < 0:
+                    dist[w] = dist[v] + 1
+                    order[tail] = w
+                    tail += 1
+                if dist[w] == dist[v] + 1:
+                    sigma[w] += sigma[v]
+
+        for i in range(tail - 1, -1, -1):
+            v = order[i]
+            for k in range(indptr[v], indptr[v + 1]):
+                w = indices[k]
+                if dist[w] == dist[v] + 1:
+                    dependency = sigma[v] / sigma[w] * (1.0 + delta[w])
+                    delta[v] += dependency
+                    if accumulate_edges:
+                        edge_scores[k] += dependency
+            if v != source:
+                betweenness[v] += delta[v]
+
+        # Only the visited nodes need to be reset for the next source
+        for i in range(tail):
+            v = order[i]
+            sigma[v] = 0.0
+            delta[v] = 0.0
+            dist[v] = -1
+
+
+@_jit
+def closeness_kernel(indptr, indices, distance_sums, reachable):
+    """
+    BFS from every source over CSR arrays, storing distance sums and reachable counts per source.
+    """
+    n = len(indptr) - 1
+    dist = np.full(n, -1, indices.dtype)
+    order = np.empty(n, indices.dtype)
+    for source in range(n):
+        dist[source] = 0
+        order[0] = source
+        head = 0
+        tail = 1
+        total = 0
+        while head < tail:
+            v = order[head]
+            head += 1
+            for k in range(indptr[v], indptr[v + 1]):
+                w = indices[k]
+                if dist[w] < 0:
+                    dist[w] = dist[v] + 1
+                    total += dist[w]
+                    order[tail] = w
+                    tail += 1
+        distance_sums[source] = total
+        reachable[source] = tail - 1
+        for i in range(tail):
+            dist[order[i]] = -1
+
+
+@_jit
+def page_rank_kernel(indptr, indices, ranks, damping_factor, max_iterations, convergence_threshold):
+    """
+    PageRank power iteration over CSR arrays, updating ranks in place.
+
+    Dangling nodes spread their rank uniformly, as in page_rank_centrality.
+
+    Returns:
+        tuple: (iterations, residual) with the final L1 difference between two iterations.
+    """
+    n = len(indptr) - 1
+    new_ranks = np.empty(n, ranks.dtype)
+    iteration = 0
+    diff = np.inf
+    while iteration < max_iterations and diff >= convergence_threshold:
+        new_ranks[:] = 0.0
+        dangling = 0.0
+        for v in range(n):
+            degree = indptr[v + 1] - indptr[v]
+            if degree == 0:
+                dangling += ranks[v]
+            else:
+                share = damping_factor * ranks[v] / degree
+                for k in range(indptr[v], indptr[v + 1]):
+                    new_ranks[indices[k]] += share
+        base = damping_factor * dangling / n + (1.0 - damping_factor) / n
+        diff = 0.0
+        for v in range(n):
+            new_ranks[v] += base
+            diff += abs(new_ranks[v] - ranks[v])
+            ranks[v] = new_ranks[v]
+        iteration += 1
+    return iteration, diff
+
+
+def csr_betweenness(graph: dict, edge_betweenness=False):
+    """
+    Unscaled betweenness sums of every node, computed with brandes_kernel.
+
+    Returns:
+        dict: A {node: sum} dictionary, or a tuple (node_sums, edge_sums) with edge_betweenness,
+              edge_sums being indexed by CSR edge position.
+    """
+    nodes, indptr, indices = create_csr(graph)
+    betweenness = np.zeros(len(nodes))
+    edge_scores = np.zeros(len(indices) if edge_betweenness else 0)
+    brandes_kernel(indptr, indices, betweenness, edge_scores)
+    node_sums = {node: float(betweenness[i]) for i, node in enumerate(nodes)}
+    return (node_sums, edge_scores) if edge_betweenness else node_sums
+
+
+def csr_distance_sums(graph: dict) -> tuple:
+    """
+    Distance sums and reachable counts of every node, computed with closeness_kernel.
+
+    Returns:
+        tuple: (nodes, distance_sums, reachable)
+    """
+    nodes, indptr, indices = create_csr(graph)
+    distance_sums = np.zeros(len(nodes), dtype=np.int64)
+    reachable = np.zeros(len(nodes), dtype=np.int64)
+    closeness_kernel(indptr, indices, distance_sums, reachable)
+    return nodes, distance_sums, reachable
+
+
+def csr_page_rank(graph: dict, damping_factor: float, max_iterations: int,
+                  convergence_threshold: float) -> tuple:
+    """
+    PageRank scores of every node, computed with page_rank_kernel.
+
+    Returns:
+        tuple: (ranks, iterations, residual) with ranks as a {node: score} dictionary.
+    """
+    nodes, indptr, indices = create_csr(graph)
+    ranks = np.full(len(nodes), 1 / len(nodes))
+    iterations, residual = page_rank_kernel(indptr, indices, ranks, float(damping_factor),
+                                            max_iterations, float(convergence_threshold))
+    return {node: float(ranks[i]) for i, node in enumerate(nodes)}, int(iterations), float(residual)
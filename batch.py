@@ -0,0 +1,216 @@
+"""
+Batch pipeline computing the centrality measures of many graphs, e.g. the SNAP per-ego edge files.
+
+Graphs come from a directory (every .edges and .txt file) or from a manifest listing one edge file
+per line. Each graph is loaded and scored in a worker process; at most max_pending graphs are in flight,
+and finished graphs are streamed into one CSV table (graph, node, one column per measure) before the next
+ones are submitted, so memory stays bounded however many graphs there are.
+
+Run with `python batch.py facebook_data/ --output results/batch_scores.csv` from root directory.
+"""
+import os
+import csv
+import sys
+import json
+import time
+import argparse
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from concurrent.futures.process import BrokenProcessPool
+from utils import create_adjacency_list
+from server import compute_measure, MEASURES
+from export import METADATA_SUFFIX, CSV_FLOAT_FORMAT
+
+EDGE_EXTENSIONS = (".edges", ".txt")
+DEFAULT_MEASURES = ("degree", "closeness", "betweenness", "pagerank")
+DEFAULT_OUTPUT = "results/batch_scores.csv"
+PENDING_PER_WORKER = 2
+
+
+def discover_graphs(source: str) -> list:
+    """
+    List the graphs of a directory or of a manifest file.
+
+    Args:
+        source (str): A directory, whose .edges and .txt files are taken in name order, or a manifest
+                      with one edge file path per line (blank lines and # comments are skipped,
+                      relative paths are relative to the manifest).
+
+    Returns:
+        list: (name, path) tuples, the name being the file name without its extension.
+
+    Raises:
+        FileNotFoundError: If the source does not exist.
+    """
+    if os.path.isdir(source):
+        paths = [os.path.join(source, name) for name in sorted(os.listdir(source))
+                 if name.endswith(EDGE_EXTENSIONS) and os.path.isfile(os.path.join(source, name))]
+    else:
+        try:
+            with open(source) as file:
+                entries = [line.strip() for line in file]
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File not found: {source}")
+        base = os.path.dirname(source)
+        paths = [os.path.join(base, entry) for entry in entries if entry and not entry.startswith("#")]
+    return [(os.path.splitext(os.path.basename(path))[0], path) for path in paths]
+
+
+def analyze_graph(name: str, edges_file_path: str, measures) -> dict:
+    """
+    Load one graph and compute every measure; runs in a worker process.
+
+    Returns:
+        dict: "graph" name, number of "nodes" and "edges", "seconds" spent and the "scores" of each measure.
+    """
+    start = time.perf_counter()
+    graph = create_adjacency_list(edges_file_path)
+    scores = {measure: compute_measure(measure, graph) for measure in measures}
+    return {
+        "graph": name,
+        "nodes": len(graph),
+        "edges": sum(len(neighbors) for neighbors in graph.values()) // 2,
+        "seconds": time.perf_counter() - start,
+        "scores": scores,
+    }
+
+
+def _write_rows(writer, result: dict, measures) -> None:
+    scores = result["scores"]
+    for node in scores[measures[0]] if measures else []:
+        writer.writerow([result["graph"], node] + [CSV_FLOAT_FORMAT % scores[measure][node] for measure in measures])
+
+
+def run_batch(graphs: list, output_path: str=DEFAULT_OUTPUT, measures=DEFAULT_MEASURES, workers: int=None,
+              max_pending: int=None) -> dict:
+    """
+    Compute the measures of every graph and aggregate the scores into one CSV table.
+
+    Args:
+        graphs (list): (name, path) tuples, see discover_graphs.
+        output_path (str): Destination CSV file; a summary is written next to it as <path>.meta.json.
+        measures (iterable): Measures to compute, among server.MEASURES.
+        workers (int): Number of worker processes; None or 1 computes in this process.
+        max_pending (int): Maximum number of graphs submitted but not yet written; defaults to
+                           PENDING_PER_WORKER per worker.
+
+    Returns:
+        dict: Summary with the per-graph "graphs" records (or their "error"), the number of "completed"
+              and "failed" graphs, the total "seconds" and the "graphs_per_second" throughput. A graph fails
+              when it raises, or when it is in flight while a worker process dies; the batch goes on.
+
+    Raises:
+        ValueError: If a measure is unknown.
+    """
+    measures = list(measures)
+    for measure in measures:
+        if measure not in MEASURES:
+            raise ValueError(f"Unknown measure: {measure}. Choose one of {MEASURES}.")
+    directory = os.path.dirname(output_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    records = []
+    start = time.perf_counter()
+    try:
+        with open(output_path, "w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(["graph", "node"] + measures)
+
+            def collect(name, result=None, error=None):
+                if error is not None:
+                    records.append({"graph": name, "error": str(error)})
+                    return
+                _write_rows(writer, result, measures)
+                records.append({key: value for key, value in result.items() if key != "scores"})
+
+            if workers is None or workers <= 1:
+                for name, path in graphs:
+                    try:
+                        collect(name, analyze_graph(name, path, measures))
+                    except Exception as error:  # recorded like the failures of the worker processes
+                        collect(name, error=error)
+            else:
+                _run_pool(graphs, measures, workers, max_pending or PENDING_PER_WORKER * workers, collect)
+    finally:
+        # Written even when the batch is interrupted, for the graphs finished so far
+        seconds = time.perf_counter() - start
+        completed = sum("error" not in record for record in records)
+        summary = {
+            "measures": measures,
+            "graphs": records,
+            "completed": completed,
+            "failed": len(records) - completed,
+            "seconds": seconds,
+            "graphs_per_second": completed / seconds if seconds > 0 else float("inf"),
+        }
+        with open(output_path + METADATA_SUFFIX, "w") as file:
+            json.dump(summary, file, indent=2)
+    return summary
+
+
+def _run_pool(graphs: list, measures: list, workers: int, max_pending: int, collect) -> None:
+    """
+    Score the graphs in a process pool with at most max_pending in flight, passing each result to collect.
+
+    When a worker process dies (e.g. killed for running out of memory), the pool is broken and every graph
+    in flight is recorded as failed, since the one that killed it cannot be told apart; the remaining
+    graphs go to a new pool.
+    """
+    queue = deque(graphs)
+    pending = {}
+    executor = ProcessPoolExecutor(max_workers=workers)
+    try:
+        while queue or pending:
+            broken = None
+            # Keep at most max_pending graphs in flight so their scores never pile up in memory
+            while queue and len(pending) < max_pending:
+                name, path = queue[0]
+                try:
+                    future = executor.submit(analyze_graph, name, path, measures)
+                except BrokenProcessPool as error:
+                    broken = error
+                    break
+                queue.popleft()
+                pending[future] = name
+            if broken is None and pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = pending.pop(future)
+                    if isinstance(future.exception(), BrokenProcessPool):
+                        broken = future.exception()
+                        collect(name, error=broken)
+                    elif future.exception() is not None:
+                        collect(name, error=future.exception())
+                    else:
+                        collect(name, future.result())
+            if broken is not None:
+                for name in pending.values():
+                    collect(name, error=broken)
+                pending.clear()
+                executor.shutdown(wait=True, cancel_futures=True)
+                executor = ProcessPoolExecutor(max_workers=workers)
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Compute centrality measures for many graphs.")
+    parser.add_argument("source", help="directory of edge files, or manifest with one edge file per line")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT)
+    parser.add_argument("--measures", nargs="+", default=list(DEFAULT_MEASURES), choices=MEASURES)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--max-pending", type=int, help="graphs in flight at once (bounds memory)")
+    args = parser.parse_args(argv)
+
+    summary = run_batch(discover_graphs(args.source), args.output, args.measures, args.workers, args.max_pending)
+    for record in summary["graphs"]:
+        if "error" in record:
+            print(f"Failed {record['graph']}: {record['error']}")
+    print(f"Scored {summary['completed']} graphs in {summary['seconds']:.2f}s "
+          f"({summary['graphs_per_second']:.1f} graphs/s), saved as {args.output}")
+    return 1 if summary["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
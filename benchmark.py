@@ -0,0 +1,426 @@
+"""
+Benchmark suite for the centrality algorithms, loaders and plotting functions.
+
+Run with `python benchmark.py` from the root directory, e.g.
+    python benchmark.py --graphs facebook erdos_renyi --sizes 1000 10000
+    python benchmark.py --save-baseline
+    python benchmark.py --baseline benchmark_baseline.json
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+import subprocess
+import tracemalloc
+import numpy as np
+
+import visualization
+from utils import create_adjacency_list, create_adjacency_matrix, get_top_centrality
+from visualization import plot_social_network, plot_social_network_with_centrality
+from betweenness_centrality import betweenness_centrality
+from closeness import closeness_centrality
+from eigenvector import eigenvector_centrality
+from page_rank import page_rank_centrality
+from multi_source_bfs import bit_parallel_closeness_centrality
+from sparse_betweenness import sparse_betweenness_centrality
+from hyperball import approximate_closeness_centrality
+from monte_carlo import monte_carlo_page_rank
+from reorder import reorder_graph, DEFAULT_ORDERING
+
+DATA_FILE = "facebook_data/facebook_combined.txt"
+BASELINE_FILE = "benchmark_baseline.json"
+DEFAULT_SIZES = [1_000, 10_000, 100_000, 1_000_000]
+DEFAULT_GRAPHS = ["facebook", "erdos_renyi", "barabasi_albert", "grid"]
+AVERAGE_DEGREE = 10
+ATTACHMENT_EDGES = 5
+RANDOM_SEED = 42
+DEFAULT_REPEAT = 1
+REGRESSION_THRESHOLD = 1.25
+# Modules whose import time is measured in a fresh interpreter; utils and main must not pull in plotting
+IMPORT_MODULES = ["utils", "page_rank", "main", "visualization"]
+# All-sources measures are O(nm) and the dense matrix is O(n^2), so they are skipped above these sizes
+MAX_NODES = {
+    "create_adjacency_list": None,
+    "create_adjacency_matrix": 5_000,
+    "closeness_centrality": 5_000,
+    "bit_parallel_closeness_centrality": 100_000,
+    "approximate_closeness_centrality": None,
+    "betweenness_centrality": 5_000,
+    "sparse_betweenness_centrality": 10_000,
+    "eigenvector_centrality": 5_000,
+    "page_rank_centrality": None,
+    "monte_carlo_page_rank": None,
+    "reorder_graph": None,
+    "closeness_centrality_reordered": 5_000,
+    "page_rank_centrality_reordered": None,
+    "plot_social_network": 5_000,
+    "plot_social_network_with_centrality": 5_000,
+}
+
+
+def _unique_undirected_edges(edges: np.ndarray) -> np.ndarray:
+    """
+    Drop self-loops and duplicate undirected edges from an (m, 2) edge array.
+    """
+    edges = edges[edges[:, 0] != edges[:, 1]]
+    edges = np.sort(edges, axis=1)
+    return np.unique(edges, axis=0)
+
+
+def erdos_renyi_edges(num_nodes: int, average_degree: int=AVERAGE_DEGREE, seed: int=RANDOM_SEED) -> np.ndarray:
+    """
+    Generate the edges of a G(n, m) Erdős–Rényi graph with the given average degree.
+
+    Args:
+        num_nodes (int): Number of nodes.
+        average_degree (int): Expected average degree.
+        seed (int): Random seed.
+
+    Returns:
+        np.ndarray: (m, 2) array of undirected edges.
+    """
+    rng = np.random.default_rng(seed)
+    num_edges = num_nodes * average_degree // 2
+    return _unique_undirected_edges(rng.integers(0, num_nodes, size=(num_edges, 2)))
+
+
+def barabasi_albert_edges(num_nodes: int, attachment_edges: int=ATTACHMENT_EDGES,
+                          seed: int=RANDOM_SEED) -> np.ndarray:
+    """
+    Generate the edges of a Barabási–Albert preferential attachment graph.
+
+    Args:
+        num_nodes (int): Number of nodes.
+        attachment_edges (int): Number of edges each new node attaches with.
+        seed (int): Random seed.
+
+    Returns:
+        np.ndarray: (m, 2) array of undirected edges.
+    """
+    rng = np.random.default_rng(seed)
+    # Every endpoint is written to `repeated`, so sampling from it is sampling proportional to degree
+    repeated = np.empty(2 * num_nodes * attachment_edges, dtype=np.int64)
+    edges = np.empty((num_nodes * attachment_edges, 2), dtype=np.int64)
+    size = 0
+    num_edges = 0
+    targets = np.arange(attachment_edges)
+    for node in range(attachment_edges, num_nodes):
+        count = len(targets)
+        edges[num_edges:num_edges + count, 0] = node
+        edges[num_edges:num_edges + count, 1] = targets
+        num_edges += count
+        repeated[size:size + count] = targets
+        repeated[size + count:size + 2 * count] = node
+        size += 2 * count
+        targets = np.unique(repeated[rng.integers(0, size, size=attachment_edges)])
+    return _unique_undirected_edges(edges[:num_edges])
+
+
+def grid_edges(num_nodes: int) -> np.ndarray:
+    """
+    Generate the edges of a square 2D grid with about num_nodes nodes.
+
+    Args:
+        num_nodes (int): Approximate number of nodes (rounded down to a square).
+
+    Returns:
+        np.ndarray: (m, 2) array of undirected edges.
+    """
+    side = max(int(np.sqrt(num_nodes)), 2)
+    ids = np.arange(side * side).reshape(side, side)
+    horizontal = np.column_stack([ids[:, :-1].ravel(), ids[:, 1:].ravel()])
+    vertical = np.column_stack([ids[:-1, :].ravel(), ids[1:, :].ravel()])
+    return np.concatenate([horizontal, vertical])
+
+
+GENERATORS = {
+    "erdos_renyi": erdos_renyi_edges,
+    "barabasi_albert": barabasi_albert_edges,
+    "grid": grid_edges,
+}
+
+
+def write_edges(edges: np.ndarray, edges_file_path: str) -> None:
+    """
+    Write an edge array in the "u v" per line format read by the loaders.
+    """
+    np.savetxt(edges_file_path, edges, fmt="%d")
+
+
+def measure(function, *args, repeat: int=DEFAULT_REPEAT, trace_memory: bool=True, **kwargs) -> dict:
+    """
+    Time a function call and record its peak traced memory.
+
+    tracemalloc slows allocation-heavy code down considerably, so the timed runs are untraced
+    and the peak memory comes from one extra traced run.
+
+    Args:
+        function (callable): Function to benchmark.
+        repeat (int): Number of timed runs; the fastest wall time is reported.
+        trace_memory (bool): Whether to do the extra traced run for the peak memory.
+
+    Returns:
+        dict: {"wall_time": seconds, "peak_memory": bytes, "result": last return value}
+    """
+    wall_times = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function(*args, **kwargs)
+        wall_times.append(time.perf_counter() - start)
+
+    peak_memory = 0
+    if trace_memory:
+        tracemalloc.start()
+        try:
+            function(*args, **kwargs)
+            peak_memory = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return {"wall_time": min(wall_times), "peak_memory": peak_memory, "result": result}
+
+
+def import_time(module: str) -> dict:
+    """
+    Time the import of a module in a fresh interpreter, and list the heavy plotting modules it loads.
+
+    Args:
+        module (str): Name of the module to import.
+
+    Returns:
+        dict: {"wall_time": seconds, "loaded": names of networkx/matplotlib modules imported}
+    """
+    code = ("import sys, time; start = time.perf_counter(); import {0}; "
+            "elapsed = time.perf_counter() - start; "
+            "print(elapsed, *(name for name in ('networkx', 'matplotlib', 'matplotlib.pyplot') "
+            "if name in sys.modules))").format(module)
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True,
+                            cwd=os.path.dirname(os.path.abspath(__file__))).stdout.split()
+    return {"wall_time": float(output[0]), "loaded": output[1:]}
+
+
+def benchmark_imports(modules=None, repeat: int=DEFAULT_REPEAT) -> list:
+    """
+    Benchmark the import time of the modules, fastest of repeat fresh interpreters each.
+
+    Returns:
+        list: One record per module, named import_<module>/startup/0.
+    """
+    records = []
+    for module in modules or IMPORT_MODULES:
+        measurements = [import_time(module) for _ in range(repeat)]
+        fastest = min(measurements, key=lambda measurement: measurement["wall_time"])
+        record = _record(f"import_{module}", "startup", 0, 0, {"peak_memory": 0, **fastest})
+        record["loaded"] = fastest["loaded"]
+        records.append(record)
+        print(f"import {module}: {fastest['wall_time']:.3f}s, loads {fastest['loaded'] or 'no plotting modules'}")
+    return records
+
+
+def _record(name: str, graph_name: str, num_nodes: int, num_edges: int, measurement: dict) -> dict:
+    wall_time = measurement["wall_time"]
+    return {
+        "name": f"{name}/{graph_name}/{num_nodes}",
+        "function": name,
+        "graph": graph_name,
+        "nodes": num_nodes,
+        "edges": num_edges,
+        "wall_time": wall_time,
+        "peak_memory": measurement["peak_memory"],
+        "edges_per_second": num_edges / wall_time if wall_time > 0 else float("inf"),
+    }
+
+
+def _allowed(function_name: str, num_nodes: int, functions) -> bool:
+    if functions and function_name not in functions:
+        return False
+    limit = MAX_NODES.get(function_name)
+    return limit is None or num_nodes <= limit
+
+
+def benchmark_graph(graph_name: str, edges_file_path: str, functions=None,
+                    repeat: int=DEFAULT_REPEAT, output_dir: str=None, trace_memory: bool=True) -> list:
+    """
+    Benchmark every loader, centrality measure and plotting function on one edge file.
+
+    Args:
+        graph_name (str): Label of the graph used in the records.
+        edges_file_path (str): Path to the edge file.
+        functions (list): Names of the functions to run (default: all).
+        repeat (int): Number of runs per function.
+        output_dir (str): Directory the plotting functions save their figures to.
+        trace_memory (bool): Whether to record the peak memory of each function.
+
+    Returns:
+        list: One record dictionary per benchmarked function.
+    """
+    records = []
+    loaded = measure(create_adjacency_list, edges_file_path, repeat=repeat, trace_memory=trace_memory)
+    adjacency_list = loaded["result"]
+    num_nodes = len(adjacency_list)
+    num_edges = sum(len(neighbors) for neighbors in adjacency_list.values()) // 2
+    if _allowed("create_adjacency_list", num_nodes, functions):
+        records.append(_record("create_adjacency_list", graph_name, num_nodes, num_edges, loaded))
+
+    adjacency_matrix = None
+    if any(_allowed(name, num_nodes, functions)
+           for name in ("create_adjacency_matrix", "eigenvector_centrality")):
+        loaded = measure(create_adjacency_matrix, edges_file_path, repeat=repeat, trace_memory=trace_memory)
+        adjacency_matrix = loaded["result"]
+        if _allowed("create_adjacency_matrix", num_nodes, functions):
+            records.append(_record("create_adjacency_matrix", graph_name, num_nodes, num_edges, loaded))
+
+    cases = [
+        ("closeness_centrality", closeness_centrality, (adjacency_list,)),
+        ("bit_parallel_closeness_centrality", bit_parallel_closeness_centrality, (adjacency_list,)),
+        ("approximate_closeness_centrality", approximate_closeness_centrality, (adjacency_list,)),
+        ("betweenness_centrality", betweenness_centrality, (adjacency_list,)),
+        ("sparse_betweenness_centrality", sparse_betweenness_centrality, (adjacency_list,)),
+        ("eigenvector_centrality", eigenvector_centrality, (adjacency_matrix,)),
+        ("page_rank_centrality", page_rank_centrality, (adjacency_list,)),
+        ("monte_carlo_page_rank", monte_carlo_page_rank, (adjacency_list,)),
+    ]
+    centrality = None
+    for name, function, args in cases:
+        if _allowed(name, num_nodes, functions):
+            measurement = measure(function, *args, repeat=repeat, trace_memory=trace_memory)
+            centrality = measurement["result"]
+            records.append(_record(name, graph_name, num_nodes, num_edges, measurement))
+            print(f"{name} on {graph_name} ({num_nodes} nodes): {measurement['wall_time']:.3f}s")
+
+    # The same traversals on the relabeled graph, to report the gain of the cache-friendly ordering
+    if any(_allowed(name, num_nodes, functions)
+           for name in ("reorder_graph", "closeness_centrality_reordered", "page_rank_centrality_reordered")):
+        reordered = measure(reorder_graph, adjacency_list, DEFAULT_ORDERING, repeat=repeat, trace_memory=trace_memory)
+        if _allowed("reorder_graph", num_nodes, functions):
+            records.append(_record("reorder_graph", graph_name, num_nodes, num_edges, reordered))
+        relabeled, _ = reordered["result"]
+        for name, function in (("closeness_centrality_reordered", closeness_centrality),
+                               ("page_rank_centrality_reordered", page_rank_centrality)):
+            if _allowed(name, num_nodes, functions):
+                measurement = measure(function, relabeled, repeat=repeat, trace_memory=trace_memory)
+                records.append(_record(name, graph_name, num_nodes, num_edges, measurement))
+                print(f"{name} on {graph_name} ({num_nodes} nodes): {measurement['wall_time']:.3f}s")
+
+    plot_cases = []
+    if _allowed("plot_social_network", num_nodes, functions):
+        plot_cases.append(("plot_social_network", plot_social_network, (adjacency_list, set())))
+    if _allowed("plot_social_network_with_centrality", num_nodes, functions):
+        if centrality is None or set(centrality) != set(adjacency_list):
+            centrality = page_rank_centrality(adjacency_list)
+        top_nodes = get_top_centrality(centrality)
+        plot_cases.append(("plot_social_network_with_centrality", plot_social_network_with_centrality,
+                           (adjacency_list, centrality, "benchmark", top_nodes)))
+    if plot_cases:
+        import matplotlib.pyplot as plt
+        graph_path = visualization.GARPH_PATH
+        # Keep the figures in graphs/ untouched while benchmarking
+        visualization.GARPH_PATH = (output_dir or tempfile.gettempdir()) + os.sep
+        try:
+            for name, function, args in plot_cases:
+                measurement = measure(function, *args, repeat=repeat, trace_memory=trace_memory)
+                plt.close("all")
+                records.append(_record(name, graph_name, num_nodes, num_edges, measurement))
+        finally:
+            visualization.GARPH_PATH = graph_path
+
+    return records
+
+
+def run_benchmarks(graphs=None, sizes=None, functions=None, repeat: int=DEFAULT_REPEAT,
+                   trace_memory: bool=True) -> list:
+    """
+    Benchmark all functions on the Facebook dataset and on generated synthetic graphs,
+    after the import time of IMPORT_MODULES.
+
+    Args:
+        graphs (list): Graph names among 'facebook' and the keys of GENERATORS.
+        sizes (list): Node counts of the synthetic graphs.
+        functions (list): Names of the functions to run (default: all).
+        repeat (int): Number of runs per function.
+        trace_memory (bool): Whether to record the peak memory of each function.
+
+    Returns:
+        list: Record dictionaries of all benchmarks.
+    """
+    graphs = graphs or DEFAULT_GRAPHS
+    sizes = sizes or DEFAULT_SIZES
+    modules = [module for module in IMPORT_MODULES if not functions or f"import_{module}" in functions]
+    records = benchmark_imports(modules, repeat) if modules else []
+    with tempfile.TemporaryDirectory() as directory:
+        for graph_name in graphs:
+            if graph_name == "facebook":
+                records += benchmark_graph(graph_name, DATA_FILE, functions, repeat, directory, trace_memory)
+                continue
+            if graph_name not in GENERATORS:
+                raise ValueError(f"Unknown graph: {graph_name}. Choose 'facebook' or one of {list(GENERATORS)}.")
+            for size in sizes:
+                edges_file_path = os.path.join(directory, f"{graph_name}_{size}.txt")
+                write_edges(GENERATORS[graph_name](size), edges_file_path)
+                records += benchmark_graph(graph_name, edges_file_path, functions, repeat, directory, trace_memory)
+    return records
+
+
+def compare_with_baseline(records: list, baseline: list, threshold: float=REGRESSION_THRESHOLD) -> list:
+    """
+    Flag benchmarks whose wall time grew by more than the threshold factor over the baseline.
+
+    Args:
+        records (list): Current benchmark records.
+        baseline (list): Baseline benchmark records.
+        threshold (float): Allowed slowdown factor (1.25 means 25% slower).
+
+    Returns:
+        list: (name, baseline_time, current_time) tuples of the regressions.
+    """
+    baseline_times = {record["name"]: record["wall_time"] for record in baseline}
+    regressions = []
+    for record in records:
+        previous = baseline_times.get(record["name"])
+        if previous is not None and record["wall_time"] > previous * threshold:
+            regressions.append((record["name"], previous, record["wall_time"]))
+    return regressions
+
+
+def print_records(records: list) -> None:
+    print(f"{'benchmark':<60} {'time (s)':>10} {'peak MB':>10} {'edges/s':>14}")
+    for record in records:
+        print(f"{record['name']:<60} {record['wall_time']:>10.4f} "
+              f"{record['peak_memory'] / 1e6:>10.2f} {record['edges_per_second']:>14.0f}")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the centrality algorithms.")
+    parser.add_argument("--graphs", nargs="+", default=DEFAULT_GRAPHS)
+    parser.add_argument("--sizes", nargs="+", type=int, default=DEFAULT_SIZES)
+    parser.add_argument("--functions", nargs="+", default=None)
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument("--baseline", default=BASELINE_FILE)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD)
+    parser.add_argument("--no-memory", action="store_true", help="skip the traced run measuring peak memory")
+    args = parser.parse_args(argv)
+
+    records = run_benchmarks(args.graphs, args.sizes, args.functions, args.repeat,
+                             not args.no_memory)
+    print_records(records)
+
+    if args.save_baseline:
+        with open(args.baseline, "w") as file:
+            json.dump(records, file, indent=2)
+        print(f"Baseline saved as {args.baseline}")
+        return 0
+
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as file:
+            regressions = compare_with_baseline(records, json.load(file), args.threshold)
+        for name, previous, current in regressions:
+            print(f"Regression: {name} took {current:.4f}s (baseline {previous:.4f}s)")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,13 +1,69 @@
 from collections import deque
+import numpy as np
+from progress import ProgressReporter, CHECKPOINT_INTERVAL, graph_signature, \
+    save_checkpoint, load_checkpoint, remove_checkpoint
+from backends import resolve_backend, csr_betweenness
 
 
-def bfs_shortest_paths(graph: dict, source):
+def edge_offsets(graph: dict) -> dict:
+    """
+    CSR position of the first neighbor of each node, as laid out by utils.create_csr.
+
+    Edge positions number the entries of the adjacency lists in order: the k-th neighbor
+    of node v is edge offsets[v] + k.
+
+    Args:
+        graph (dict): Adjacency list representation of the graph.
+
+    Returns:
+        dict: A dictionary mapping each node to the position of its first edge.
+    """
+    offsets = {}
+    position = 0
+    for node, neighbors in graph.items():
+        offsets[node] = position
+        position += len(neighbors)
+    return offsets
+
+
+def edge_betweenness_dict(graph: dict, edge_scores, directed=False) -> dict:
+    """
+    Map edge betweenness scores indexed by CSR edge position to a {(u, v): score} dictionary.
+
+    For undirected graphs, the scores of both directions of an edge are summed under the
+    orientation found first in the adjacency list. Duplicate entries (parallel edges) are summed.
+
+    Args:
+        graph (dict): Adjacency list representation of the graph.
+        edge_scores (np.ndarray): Scores returned by betweenness_centrality with edge_betweenness=True.
+        directed (bool): Whether the graph is directed. Default is False.
+
+    Returns:
+        dict: A dictionary mapping each edge to its betweenness centrality score.
+    """
+    scores = {}
+    position = 0
+    for u, neighbors in graph.items():
+        for v in neighbors:
+            edge = (u, v)
+            if not directed and (v, u) in scores:
+                edge = (v, u)
+            scores[edge] = scores.get(edge, 0.0) + float(edge_scores[position])
+            position += 1
+    return scores
+
+
+def bfs_shortest_paths(graph: dict, source, offsets: dict=None, pred_edges: dict=None):
     """
     Perform BFS to compute shortest paths in an unweighted graph.
 
     Args:
         graph (dict): Adjacency list representation of the graph.
         source: The source node.
+        offsets (dict): CSR position of the first neighbor of each node, see edge_offsets.
+                        Required with pred_edges.
+        pred_edges (dict): Optional dictionary filled with, for each node, the CSR positions of
+                           the edges from its predecessors, aligned with pred.
 
     Returns:
         tuple: (stack, pred, sigma)
@@ -22,22 +78,28 @@ def bfs_shortest_paths(graph: dict, source):
     dist = dict.fromkeys(graph, -1)
     dist[source] = 0
 
+    if pred_edges is not None:
+        pred_edges.clear()
+        pred_edges.update((v, []) for v in graph)
+
     queue = deque([source])
     while queue:
         v = queue.popleft()
         stack.append(v)
-        for w in graph[v]:
+        for k, w in enumerate(graph[v]):
             if dist[w] < 0:  # Found for the first time
                 queue.append(w)
                 dist[w] = dist[v] + 1
             if dist[w] == dist[v] + 1:  # Shortest path to w via v
                 sigma[w] += sigma[v]
                 pred[w].append(v)
+                if pred_edges is not None:
+                    pred_edges[w].append(offsets[v] + k)
 
     return stack, pred, sigma
 
 
-def accumulate_dependencies(stack, pred, sigma, source):
+def accumulate_dependencies(stack, pred, sigma, source, pred_edges=None, edge_scores=None):
     """
     Accumulate dependencies to compute betweenness centrality.
 
@@ -46,6 +108,9 @@ def accumulate_dependencies(stack, pred, sigma, source):
         pred (dict): Dictionary of predecessors for each node.
         sigma (dict): Dictionary of the number of shortest paths to each node.
         source: The source node.
+        pred_edges (dict): CSR positions of the predecessor edges, as filled by bfs_shortest_paths.
+        edge_scores (np.ndarray): Optional array indexed by CSR edge position; the dependency
+                                  carried by each predecessor edge is added to it.
 
     Returns:
         dict: Dictionary of dependency values for each node.
@@ -53,48 +118,129 @@ def accumulate_dependencies(stack, pred, sigma, source):
     delta = dict.fromkeys(pred, 0.0)
     while stack:
         w = stack.pop()
-        for v in pred[w]:
-            delta[v] += (sigma[v] / sigma[w]) * (1 + delta[w])
+        for i, v in enumerate(pred[w]):
+            dependency = (sigma[v] / sigma[w]) * (1 + delta[w])
+            delta[v] += dependency
+            if edge_scores is not None:
+                edge_scores[pred_edges[w][i]] += dependency
         if w != source:
             yield w, delta[w]
 
 
-def betweenness_centrality(graph: dict, normalized=True, directed=False):
+def betweenness_scale(num_nodes: int, normalized=True, directed=False) -> float:
     """
-    Computes the betweenness centrality for all nodes in a graph using Brandes' algorithm.
+    Factor applied to the summed dependencies of Brandes' algorithm.
 
     Args:
-        graph (dict): Adjacency list representation of the graph.
-                      Keys are nodes, values are lists of neighboring nodes.
-        normalized (bool): Whether to normalize the centrality scores. Default is True.
-        directed (bool): Whether the graph is directed. Default is False.
-        weight (dict): Optional dictionary of edge weights with (u, v) as keys and weights as values.
+        num_nodes (int): Number of nodes in the graph.
+        normalized (bool): Whether to normalize for the size of the graph.
+        directed (bool): Whether the graph is directed.
 
     Returns:
-        dict: A dictionary mapping each node to its betweenness centrality score.
+        float: The scale of the betweenness scores.
     """
-    betweenness = dict.fromkeys(graph, 0.0)
-
-    for source in graph:
-
-        stack, pred, sigma = bfs_shortest_paths(graph, source)
-
-        for w, delta_w in accumulate_dependencies(stack, pred, sigma, source):
-            betweenness[w] += delta_w
-
     scale = 1.0
     # normalize for the size of the graph
-    if normalized and len(graph) > 2:
-        scale = 2 / ((len(graph) - 1) * (len(graph) - 2))
+    if normalized and num_nodes > 2:
+        scale = 2 / ((num_nodes - 1) * (num_nodes - 2))
         if directed:
             scale /= 2
 
     # the centrality scores need to be divided by two if the graph is undirected
-    if not directed: 
+    if not directed:
         scale /= 2
-    
+    return scale
+
+
+def betweenness_centrality(graph: dict, normalized=True, directed=False, stats=None,
+                           progress=False, checkpoint_path=None, checkpoint_interval=CHECKPOINT_INTERVAL,
+                           backend=None, edge_betweenness=False):
+    """
+    Computes the betweenness centrality for all nodes in a graph using Brandes' algorithm.
+
+    Args:
+        graph (dict): Adjacency list representation of the graph.
+                      Keys are nodes, values are lists of neighboring nodes.
+        normalized (bool): Whether to normalize the centrality scores. Default is True.
+        directed (bool): Whether the graph is directed. Default is False.
+        weight (dict): Optional dictionary of edge weights with (u, v) as keys and weights as values.
+        stats (dict): Optional dictionary filled with the number of BFS "sources" processed.
+        progress (bool): Whether to print progress and ETA while processing sources. Default is False.
+        checkpoint_path (str): Optional file where the partial scores and completed sources are saved
+                               every checkpoint_interval sources. An existing checkpoint is resumed,
+                               and the file is removed once the computation finishes.
+        checkpoint_interval (int): Number of sources processed between two checkpoints.
+        backend (str): Kernel backend ('python', 'numba' or 'auto'); None uses the global backend.
+                       The numba kernel processes all sources at once, without progress or checkpoints.
+        edge_betweenness (bool): Whether to also compute edge betweenness in the same traversals.
+                                 Default is False.
+
+    Returns:
+        dict: A dictionary mapping each node to its betweenness centrality score.
+              With edge_betweenness, a tuple (node_scores, edge_scores) where edge_scores is an array
+              indexed by CSR edge position (see edge_offsets and edge_betweenness_dict), scaled like
+              networkx.edge_betweenness_centrality.
+    """
+    edge_scores = None
+    if resolve_backend(backend) == "numba":
+        if edge_betweenness:
+            betweenness, edge_scores = csr_betweenness(graph, edge_betweenness=True)
+        else:
+            betweenness = csr_betweenness(graph)
+    else:
+        betweenness = dict.fromkeys(graph, 0.0)
+        completed = set()
+        offsets, pred_edges = None, None
+        if edge_betweenness:
+            offsets, pred_edges = edge_offsets(graph), {}
+            edge_scores = np.zeros(sum(len(neighbors) for neighbors in graph.values()))
+        params = {"edge_betweenness": True} if edge_betweenness else {}
+        state = load_checkpoint(checkpoint_path, "betweenness", graph, params)
+        if state is not None:
+            betweenness, completed = state["accumulator"], state["completed"]
+            if edge_betweenness:
+                edge_scores = state["edge_accumulator"]
+        reporter = ProgressReporter(len(graph), "Betweenness", initial=len(completed)) if progress else None
+        signature = graph_signature(graph) if checkpoint_path else None
+
+        for source in graph:
+            if source in completed:
+                continue
+
+            stack, pred, sigma = bfs_shortest_paths(graph, source, offsets, pred_edges)
+
+            for w, delta_w in accumulate_dependencies(stack, pred, sigma, source, pred_edges, edge_scores):
+                betweenness[w] += delta_w
+
+            completed.add(source)
+            if reporter:
+                reporter.update(len(completed))
+            if checkpoint_path and len(completed) % checkpoint_interval == 0:
+                save_checkpoint(checkpoint_path, {"measure": "betweenness", "graph": signature,
+                                                  "params": params, "completed": completed,
+                                                  "accumulator": betweenness,
+                                                  "edge_accumulator": edge_scores})
+
+        if reporter:
+            reporter.update(len(completed), force=True)
+        remove_checkpoint(checkpoint_path)
+
+    if stats is not None:
+        stats["sources"] = len(graph)
+
+    scale = betweenness_scale(len(graph), normalized, directed)
     if scale != 1.0:
         for v in betweenness:
             betweenness[v] *= scale
 
-    return betweenness
+    if edge_scores is None:
+        return betweenness
+
+    # edges lie on paths between n * (n - 1) ordered pairs, each unordered pair is counted twice if undirected
+    edge_scale = 1.0
+    if normalized and len(graph) > 1:
+        edge_scale = 1 / (len(graph) * (len(graph) - 1))
+    elif not directed:
+        edge_scale = 0.5
+    edge_scores *= edge_scale
+    return betweenness, edge_scores
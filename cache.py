@@ -0,0 +1,167 @@
+import os
+import json
+import hashlib
+import tempfile
+import numpy as np
+
+CACHE_DIR = ".centrality_cache/"
+MAX_CACHE_BYTES = 512 * 1024 * 1024
+READ_BLOCK_SIZE = 1 << 20
+CACHE_VERSION = 2  # bumped when create_adjacency_list started deduplicating edges
+CACHE_SUFFIX = ".npz"
+
+
+def graph_fingerprint(edges_file_path: str) -> str:
+    """
+    Compute a content fingerprint of an edge file.
+
+    Args:
+        edges_file_path (str): Path to the file containing edges.
+
+    Returns:
+        str: Hex SHA-256 digest of the file contents.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+    """
+    digest = hashlib.sha256()
+    try:
+        with open(edges_file_path, 'rb') as file:
+            for block in iter(lambda: file.read(READ_BLOCK_SIZE), b""):
+                digest.update(block)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"File not found: {edges_file_path}")
+    return digest.hexdigest()
+
+
+def cache_key(fingerprint: str, measure: str, params: dict=None) -> str:
+    """
+    Build the cache key of a centrality result.
+
+    Args:
+        fingerprint (str): Graph fingerprint returned by graph_fingerprint.
+        measure (str): Name of the centrality measure.
+        params (dict): Parameters the measure was computed with (e.g. damping_factor, tol, normalized).
+
+    Returns:
+        str: Hex digest identifying the (graph, measure, parameters) combination.
+    """
+    payload = json.dumps({
+        "version": CACHE_VERSION,
+        "graph": fingerprint,
+        "measure": measure,
+        "params": params or {},
+    }, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _cache_path(key: str, cache_dir: str) -> str:
+    return os.path.join(cache_dir, key + CACHE_SUFFIX)
+
+
+def load_cached_centrality(key: str, cache_dir: str=CACHE_DIR):
+    """
+    Load a cached centrality result and mark it as recently used.
+
+    Args:
+        key (str): Cache key returned by cache_key.
+        cache_dir (str): Directory holding the cache entries.
+
+    Returns:
+        dict or None: The cached {node: score} dictionary, or None on a cache miss.
+    """
+    path = _cache_path(key, cache_dir)
+    try:
+        with np.load(path) as entry:
+            nodes, scores = entry["nodes"], entry["scores"]
+    except (FileNotFoundError, OSError, ValueError, KeyError):
+        return None
+    # Touch the entry so that eviction removes the least recently used results first
+    os.utime(path)
+    return {node.item(): float(score) for node, score in zip(nodes, scores)}
+
+
+def store_cached_centrality(key: str, centrality: dict, cache_dir: str=CACHE_DIR,
+                            max_bytes: int=MAX_CACHE_BYTES) -> None:
+    """
+    Store a centrality result in the cache, then evict old entries above max_bytes.
+
+    Results whose node ids cannot be stored in a plain NumPy array (mixed types) are not cached.
+
+    Args:
+        key (str): Cache key returned by cache_key.
+        centrality (dict): Dictionary mapping nodes to scores.
+        cache_dir (str): Directory holding the cache entries.
+        max_bytes (int): Maximum total size of the cache directory.
+    """
+    nodes = np.asarray(list(centrality))
+    if nodes.dtype == object:
+        return
+    scores = np.fromiter(centrality.values(), dtype=np.float64, count=len(centrality))
+
+    os.makedirs(cache_dir, exist_ok=True)
+    # Write to a temporary file first so that a crash never leaves a partial entry behind
+    file_descriptor, temp_path = tempfile.mkstemp(dir=cache_dir, suffix=CACHE_SUFFIX)
+    with os.fdopen(file_descriptor, 'wb') as file:
+        np.savez(file, nodes=nodes, scores=scores)
+    os.replace(temp_path, _cache_path(key, cache_dir))
+    evict_cache(cache_dir, max_bytes)
+
+
+def evict_cache(cache_dir: str=CACHE_DIR, max_bytes: int=MAX_CACHE_BYTES) -> int:
+    """
+    Remove least recently used entries until the cache fits in max_bytes.
+
+    Args:
+        cache_dir (str): Directory holding the cache entries.
+        max_bytes (int): Maximum total size of the cache directory.
+
+    Returns:
+        int: Number of evicted entries.
+    """
+    if not os.path.isdir(cache_dir):
+        return 0
+    entries = []
+    for name in os.listdir(cache_dir):
+        if name.endswith(CACHE_SUFFIX):
+            stat = os.stat(os.path.join(cache_dir, name))
+            entries.append((stat.st_mtime, stat.st_size, name))
+
+    total = sum(size for _, size, _ in entries)
+    evicted = 0
+    for _, size, name in sorted(entries):
+        if total <= max_bytes:
+            break
+        os.remove(os.path.join(cache_dir, name))
+        total -= size
+        evicted += 1
+    return evicted
+
+
+def cached_centrality(edges_file_path: str, measure: str, params: dict, compute,
+                      cache_dir: str=CACHE_DIR, max_bytes: int=MAX_CACHE_BYTES) -> dict:
+    """
+    Return a centrality result from the cache, computing and storing it on a miss.
+
+    The key is derived from the contents of the edge file, so editing the file invalidates every result.
+
+    Args:
+        edges_file_path (str): Path to the file the graph was loaded from.
+        measure (str): Name of the centrality measure.
+        params (dict): Parameters the measure is computed with.
+        compute (callable): Function without arguments returning the {node: score} dictionary.
+        cache_dir (str): Directory holding the cache entries.
+        max_bytes (int): Maximum total size of the cache directory.
+
+    Returns:
+        dict: Dictionary mapping each node to its centrality score.
+    """
+    key = cache_key(graph_fingerprint(edges_file_path), measure, params)
+    centrality = load_cached_centrality(key, cache_dir)
+    if centrality is not None:
+        print(f"Loaded {measure} centrality from cache")
+        return centrality
+
+    centrality = compute()
+    store_cached_centrality(key, centrality, cache_dir, max_bytes)
+    return centrality
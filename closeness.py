@@ -1,11 +1,23 @@
 from collections import deque
+from progress import ProgressReporter, CHECKPOINT_INTERVAL, graph_signature, \
+    save_checkpoint, load_checkpoint, remove_checkpoint
+from backends import resolve_backend, csr_distance_sums
 
-def closeness_centrality(graph):
+def closeness_centrality(graph, stats=None, progress=False, checkpoint_path=None,
+                         checkpoint_interval=CHECKPOINT_INTERVAL, backend=None):
     """
     Compute closeness centrality for all nodes in an unweighted undirected graph.
 
     Args:
         graph (dict): Adjacency list representation of the graph (e.g., {0: [1, 2], 1: [0], 2: [0]}).
+        stats (dict): Optional dictionary filled with the number of BFS "sources" processed.
+        progress (bool): Whether to print progress and ETA while processing sources. Default is False.
+        checkpoint_path (str): Optional file where the scores of the completed sources are saved
+                               every checkpoint_interval sources. An existing checkpoint is resumed,
+                               and the file is removed once the computation finishes.
+        checkpoint_interval (int): Number of sources processed between two checkpoints.
+        backend (str): Kernel backend ('python', 'numba' or 'auto'); None uses the global backend.
+                       The numba kernel processes all sources at once, without progress or checkpoints.
 
     Returns:
         dict: A dictionary mapping each node to its closeness centrality.
@@ -14,7 +26,25 @@ def closeness_centrality(graph):
     nodes = list(graph.keys())
     n = len(nodes)
 
+    if resolve_backend(backend) == "numba":
+        _, distance_sums, reachable = csr_distance_sums(graph)
+        if stats is not None:
+            stats["sources"] = n
+        return {
+            node: (n - 1) / float(distance_sums[i]) if reachable[i] > 0 else 0.0
+            for i, node in enumerate(nodes)
+        }
+
+    state = load_checkpoint(checkpoint_path, "closeness", graph)
+    if state is not None:
+        centrality = state["accumulator"]
+    reporter = ProgressReporter(n, "Closeness", initial=len(centrality)) if progress else None
+    signature = graph_signature(graph) if checkpoint_path else None
+
     for node in nodes:
+        if node in centrality:
+            continue
+
         # Compute shortest paths using BFS
         distances = {n: -1 for n in nodes}  # -1 means unreachable
         distances[node] = 0
@@ -45,4 +75,17 @@ def closeness_centrality(graph):
             # where n is the number of nodes in the graph
             centrality[node] = (n - 1) / total_distance if total_distance > 0 else 0.0
 
+        if reporter:
+            reporter.update(len(centrality))
+        if checkpoint_path and len(centrality) % checkpoint_interval == 0:
+            save_checkpoint(checkpoint_path, {"measure": "closeness", "graph": signature, "params": {},
+                                              "accumulator": centrality})
+
+    if reporter:
+        reporter.update(len(centrality), force=True)
+    remove_checkpoint(checkpoint_path)
+
+    if stats is not None:
+        stats["sources"] = n
+
     return centrality
\ No newline at end of file
@@ -0,0 +1,132 @@
+"""
+Compact numeric mode: int32 CSR indices, uint8 adjacency matrices and float32 score arrays.
+
+A score stored in a {node: float} dictionary costs about 100 bytes; a float32 array entry costs 4.
+The graph itself shrinks by half with int32 CSR arrays, and the dense matrix of eigenvector centrality
+by eight with uint8 entries. The functions return (nodes, scores) with scores a float32 array aligned
+with nodes, and run the kernels of backends.py, which are fast with Numba installed.
+
+Precision is reduced only where it does not accumulate: shortest path counts and the betweenness sums
+stay float64 in the kernel scratch arrays (O(n) per run), since path counts overflow float32 and the
+sums over all sources lose digits. accuracy_report compares every measure with the float64 path;
+float32 scores agree with it to a relative error of about 1e-6, well within COMPACT_RTOL.
+"""
+import numpy as np
+from utils import create_csr, create_adjacency_matrix
+from backends import brandes_kernel, closeness_kernel, page_rank_kernel
+from eigenvector import eigenvector_scores, DEFLAUT_ITERATIONS, TOLERANCE
+from page_rank import page_rank_centrality, DEFAULT_FACTOR, DEFAULT_MAX_ITERATIONS, \
+    DEFAULT_CONVERGENCE_THRESHOLD
+from closeness import closeness_centrality
+from betweenness_centrality import betweenness_centrality, betweenness_scale
+
+SCORE_DTYPE = np.float32
+MATRIX_DTYPE = np.uint8
+COMPACT_RTOL = 1e-4  # documented bound on the relative error of the compact scores
+
+
+def compact_page_rank(graph: dict, damping_factor: float=DEFAULT_FACTOR,
+                      max_iterations: int=DEFAULT_MAX_ITERATIONS,
+                      convergence_threshold: float=DEFAULT_CONVERGENCE_THRESHOLD, stats: dict=None) -> tuple:
+    """
+    Compute PageRank over int32 CSR arrays with float32 ranks.
+
+    Args:
+        graph (dict): Adjacency list representation of the graph.
+        damping_factor (float): Probability of following a link (default: 0.85).
+        max_iterations (int): Maximum number of iterations for power iteration (default: 100).
+        convergence_threshold (float): Threshold for convergence (default: 1e-06).
+        stats (dict): Optional dictionary filled with the number of "iterations" and the final L1 "residual".
+
+    Returns:
+        tuple: (nodes, ranks) with ranks a float32 array aligned with nodes.
+    """
+    nodes, indptr, indices = create_csr(graph, compact=True)
+    if len(nodes) == 0:
+        return nodes, np.zeros(0, dtype=SCORE_DTYPE)
+    ranks = np.full(len(nodes), 1 / len(nodes), dtype=SCORE_DTYPE)
+    iterations, residual = page_rank_kernel(indptr, indices, ranks, float(damping_factor),
+                                            max_iterations, float(convergence_threshold))
+    if stats is not None:
+        stats["iterations"] = int(iterations)
+        stats["residual"] = float(residual)
+    return nodes, ranks
+
+
+def compact_closeness(graph: dict) -> tuple:
+    """
+    Compute closeness centrality over int32 CSR arrays, with int32 BFS distances.
+
+    Returns:
+        tuple: (nodes, closeness) with closeness a float32 array aligned with nodes.
+    """
+    nodes, indptr, indices = create_csr(graph, compact=True)
+    n = len(nodes)
+    distance_sums = np.zeros(n, dtype=np.int64)
+    reachable = np.zeros(n, dtype=np.int64)
+    closeness_kernel(indptr, indices, distance_sums, reachable)
+    closeness = np.zeros(n, dtype=SCORE_DTYPE)
+    np.divide(n - 1, distance_sums, out=closeness, where=reachable > 0, casting="unsafe")
+    return nodes, closeness
+
+
+def compact_betweenness(graph: dict, normalized: bool=True, directed: bool=False) -> tuple:
+    """
+    Compute betweenness centrality over int32 CSR arrays, scaled like betweenness_centrality.
+
+    Returns:
+        tuple: (nodes, betweenness) with betweenness a float32 array aligned with nodes.
+    """
+    nodes, indptr, indices = create_csr(graph, compact=True)
+    n = len(nodes)
+    sums = np.zeros(n)
+    brandes_kernel(indptr, indices, sums, np.zeros(0))
+    return nodes, (sums * betweenness_scale(n, normalized, directed)).astype(SCORE_DTYPE)
+
+
+def compact_eigenvector(edges_file_path: str, max_iter: int=DEFLAUT_ITERATIONS, tol: float=TOLERANCE,
+                        stats: dict=None) -> tuple:
+    """
+    Compute eigenvector centrality over a uint8 adjacency matrix with a float32 score vector.
+
+    Returns:
+        tuple: (nodes, scores) with nodes the row indices of the matrix and scores a float32 array.
+    """
+    matrix = create_adjacency_matrix(edges_file_path, dtype=MATRIX_DTYPE)
+    scores = eigenvector_scores(matrix, max_iter, tol, stats, dtype=SCORE_DTYPE)
+    return list(range(len(scores))), scores
+
+
+def _relative_error(nodes: list, compact_scores: np.ndarray, reference: dict) -> float:
+    expected = np.fromiter((reference[node] for node in nodes), dtype=np.float64, count=len(nodes))
+    scale = np.abs(expected).max() if len(expected) else 0.0
+    if scale == 0:
+        return 0.0
+    return float(np.abs(compact_scores.astype(np.float64) - expected).max() / scale)
+
+
+def accuracy_report(graph: dict, edges_file_path: str=None) -> dict:
+    """
+    Compare the compact scores of every measure with the float64 path.
+
+    The error of a measure is the largest absolute difference over all nodes, relative to the largest
+    float64 score. Compact scores should stay below COMPACT_RTOL.
+
+    Args:
+        graph (dict): Adjacency list representation of the graph.
+        edges_file_path (str): Edge file of the graph, needed for the eigenvector check.
+
+    Returns:
+        dict: A dictionary mapping each measure to its relative error.
+    """
+    report = {
+        "pagerank": _relative_error(*compact_page_rank(graph), page_rank_centrality(graph)),
+        "closeness": _relative_error(*compact_closeness(graph), closeness_centrality(graph)),
+        "betweenness": _relative_error(*compact_betweenness(graph), betweenness_centrality(graph)),
+    }
+    if edges_file_path is not None:
+        matrix = create_adjacency_matrix(edges_file_path)
+        expected = eigenvector_scores(matrix)
+        nodes, scores = compact_eigenvector(edges_file_path)
+        report["eigenvector"] = _relative_error(nodes, scores, dict(enumerate(expected)))
+    return report
@@ -0,0 +1,176 @@
+import numpy as np
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import connected_components as csgraph_components
+from concurrent.futures import ProcessPoolExecutor
+from utils import create_csr
+from closeness import closeness_centrality
+from betweenness_centrality import betweenness_centrality
+from eigenvector import eigenvector_centrality
+
+TRIVIAL_COMPONENT_SIZE = 2
+MEASURES = ("closeness", "betweenness", "eigenvector")
+CLOSENESS_NORMALIZATIONS = ("graph", "component", "wasserman_faust")
+
+
+def connected_components(graph: dict) -> list:
+    """
+    Split a graph into its (weakly) connected components.
+
+    The labeling runs over the CSR arrays of the graph, so it is linear in the number of edges.
+
+    Args:
+        graph (dict): Adjacency list representation of the graph.
+
+    Returns:
+        list: Lists of nodes, one per component, sorted from the largest component to the smallest.
+    """
+    nodes, indptr, indices = create_csr(graph)
+    if not nodes:
+        return []
+    adjacency = csr_matrix((np.ones(len(indices), dtype=np.int8), indices, indptr),
+                           shape=(len(nodes), len(nodes)))
+    num_components, labels = csgraph_components(adjacency, directed=True, connection="weak")
+
+    # Group node indices by label with one stable sort instead of a Python loop per node
+    order = np.argsort(labels, kind="stable")
+    sizes = np.bincount(labels, minlength=num_components)
+    groups = np.split(order, np.cumsum(sizes)[:-1])
+    groups.sort(key=len, reverse=True)
+    return [[nodes[i] for i in group] for group in groups]
+
+
+def _trivial_component_scores(measure: str, graph: dict, component: list) -> dict:
+    """
+    Scores of a component with at most TRIVIAL_COMPONENT_SIZE nodes, computed in O(1).
+
+    Closeness is returned in the per-component normalization and rescaled by the caller.
+    """
+    size = len(component)
+    match measure:
+        case "closeness":
+            # A node of a 2-node component reaches the other one at distance 1 only if it has an edge
+            return {node: 1.0 if size == 2 and any(neighbor != node for neighbor in graph[node]) else 0.0
+                    for node in component}
+        case "betweenness":
+            return dict.fromkeys(component, 0.0)
+        case "eigenvector":
+            if size == 1:
+                return {component[0]: 1.0 if component[0] in graph[component[0]] else 0.0}
+            return dict.fromkeys(component, 1 / np.sqrt(2))
+
+
+def _component_matrix(subgraph: dict) -> np.ndarray:
+    """
+    Dense adjacency matrix of a component plus the identity, indexed by the order of subgraph's keys.
+    """
+    nodes, indptr, indices = create_csr(subgraph)
+    matrix = np.zeros((len(nodes), len(nodes)))
+    rows = np.repeat(np.arange(len(nodes)), np.diff(indptr))
+    matrix[rows, indices] = 1
+    matrix[np.diag_indices(len(nodes))] += 1
+    return matrix
+
+
+def _component_scores(measure: str, subgraph: dict, directed: bool) -> dict:
+    """
+    Scores of one component; runs in a worker process, so it must stay a module-level function.
+    """
+    match measure:
+        case "closeness":
+            return closeness_centrality(subgraph)
+        case "betweenness":
+            return betweenness_centrality(subgraph, normalized=False, directed=directed)
+        case "eigenvector":
+            scores = eigenvector_centrality(_component_matrix(subgraph))
+            return {node: scores[i] for i, node in enumerate(subgraph)}
+
+
+def component_centrality(graph: dict, measure: str, workers: int=None, normalized: bool=True,
+                         directed: bool=False, closeness_normalization: str="graph") -> dict:
+    """
+    Compute a centrality measure component by component.
+
+    Components with at most TRIVIAL_COMPONENT_SIZE nodes are scored in O(1). The other components
+    are scheduled largest first, either in this process or across a process pool, so each BFS only
+    touches the nodes of its own component.
+
+    Normalization:
+        - betweenness: no shortest path crosses two components, so the per-component scores are exact
+          and are rescaled with the size of the whole graph, exactly like betweenness_centrality.
+        - closeness: 'graph' reproduces closeness_centrality, (n - 1) / sum of distances;
+          'component' uses the component size r instead, (r - 1) / sum of distances;
+          'wasserman_faust' scales the component value by (r - 1) / (n - 1).
+        - eigenvector: every component gets its own principal eigenvector with unit norm, scaled by
+          sqrt(r / n) so the whole vector has unit norm (isolated nodes without a self-loop score 0).
+          Power iteration on the full matrix would otherwise only converge to the component with the
+          largest eigenvalue. Iterating on A + I keeps the eigenvectors of A but no longer oscillates
+          on bipartite components such as paths and stars.
+
+    Args:
+        graph (dict): Adjacency list representation of the graph.
+        measure (str): One of 'closeness', 'betweenness', 'eigenvector'.
+        workers (int): Number of worker processes; None or 1 computes in this process.
+        normalized (bool): Whether to normalize the betweenness scores. Default is True.
+        directed (bool): Whether the graph is directed (betweenness only). Default is False.
+        closeness_normalization (str): One of 'graph', 'component', 'wasserman_faust'.
+
+    Returns:
+        dict: A dictionary mapping each node to its centrality score.
+
+    Raises:
+        TypeError: If graph is not a dictionary.
+        ValueError: If the measure or the closeness normalization is unknown.
+    """
+    if not isinstance(graph, dict):
+        raise TypeError("Graph must be a dictionary")
+    if measure not in MEASURES:
+        raise ValueError(f"Unknown centrality measure: {measure}. Choose one of {MEASURES}.")
+    if closeness_normalization not in CLOSENESS_NORMALIZATIONS:
+        raise ValueError(f"Unknown closeness normalization: {closeness_normalization}. "
+                         f"Choose one of {CLOSENESS_NORMALIZATIONS}.")
+
+    n = len(graph)
+    components = connected_components(graph)
+    component_scores = []
+    large_components = []
+    for component in components:
+        if len(component) <= TRIVIAL_COMPONENT_SIZE:
+            component_scores.append((component, _trivial_component_scores(measure, graph, component)))
+        else:
+            large_components.append(component)
+
+    # Components are sorted largest first, so the longest jobs start first
+    subgraphs = [{node: graph[node] for node in component} for component in large_components]
+    if workers is None or workers <= 1 or len(subgraphs) <= 1:
+        results = [_component_scores(measure, subgraph, directed) for subgraph in subgraphs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(_component_scores, measure, subgraph, directed) for subgraph in subgraphs]
+            results = [future.result() for future in futures]
+    component_scores += zip(large_components, results)
+
+    centrality = {}
+    for component, scores in component_scores:
+        size = len(component)
+        match measure:
+            case "closeness":
+                match closeness_normalization:
+                    case "graph":
+                        scale = (n - 1) / (size - 1) if size > 1 else 0.0
+                    case "component":
+                        scale = 1.0
+                    case "wasserman_faust":
+                        scale = (size - 1) / (n - 1) if n > 1 else 0.0
+            case "betweenness":
+                scale = 1.0
+                if normalized and n > 2:
+                    scale = 2 / ((n - 1) * (n - 2))
+                    if directed:
+                        scale /= 2
+            case "eigenvector":
+                scale = np.sqrt(size / n)
+        for node in component:
+            centrality[node] = scores[node] * scale
+
+    # Keep the node order of the input graph
+    return {node: centrality[node] for node in graph}
@@ -1,35 +1,68 @@
 import numpy as np
+from block_parallel import block_eigenvector
 
 NORM_THRESHOLD = 1e-10
 DEFLAUT_ITERATIONS = 100
 TOLERANCE = 1e-6
 
 
-def eigenvector_centrality(matrix, max_iter=DEFLAUT_ITERATIONS, tol=TOLERANCE):
+def eigenvector_scores(matrix, max_iter=DEFLAUT_ITERATIONS, tol=TOLERANCE, stats=None, dtype=np.float64):
     """
-    Calculate the eigenvector centrality of a graph given by its adjacency matrix.
-    
+    Run the power iteration of eigenvector centrality and return the score vector.
+
     Parameters:
     - matrix (numpy.ndarray): Square adjacency matrix.
     - max_iter (int): Maximum number of iterations.
     - tol (float): Convergence tolerance.
-    
+    - stats (dict): Optional dictionary filled with the number of "iterations" and the final L2 "residual".
+    - dtype: Floating point dtype of the score vector; np.float32 halves its memory.
+
     Returns:
-    - centrality (dict): Dictionary mapping node indices to centrality scores.
+    - centrality (numpy.ndarray): Score of each row of the matrix.
     """
     n = matrix.shape[0]
-    centrality = np.ones(n)  # Initialize with all ones
+    centrality = np.ones(n, dtype=dtype)  # Initialize with all ones
     
     iteration = 0
     tolerance = np.inf
     while iteration < max_iter and tolerance > tol:
-        new_centrality = matrix @ centrality  # Matrix-vector multiplication
+        new_centrality = (matrix @ centrality).astype(dtype, copy=False)  # Matrix-vector multiplication
         new_centrality = new_centrality / np.linalg.norm(new_centrality)  # Normalize
         
         # Update tolerance and centrality
         tolerance = np.linalg.norm(new_centrality - centrality)           
         centrality = new_centrality
         iteration += 1
+
+    if stats is not None:
+        stats["iterations"] = iteration
+        stats["residual"] = float(tolerance)
+
+    return centrality
+
+
+def eigenvector_centrality(matrix, max_iter=DEFLAUT_ITERATIONS, tol=TOLERANCE, stats=None, threads=None):
+    """
+    Calculate the eigenvector centrality of a graph given by its adjacency matrix.
+    
+    Parameters:
+    - matrix (numpy.ndarray): Square adjacency matrix.
+    - max_iter (int): Maximum number of iterations.
+    - tol (float): Convergence tolerance.
+    - stats (dict): Optional dictionary filled with the number of "iterations" and the final L2 "residual".
+    - threads (int): Number of threads of the block-parallel iteration over row blocks of the matrix;
+      None or 1 keeps the single-threaded path.
+    
+    Returns:
+    - centrality (dict): Dictionary mapping node indices to centrality scores.
+    """
+    if threads is not None and threads > 1:
+        centrality, iteration, tolerance = block_eigenvector(matrix, max_iter, tol, threads)
+        if stats is not None:
+            stats["iterations"] = iteration
+            stats["residual"] = tolerance
+    else:
+        centrality = eigenvector_scores(matrix, max_iter, tol, stats)
     
     # Convert the numpy array to a dictionary
     return {i: float(score) for i, score in enumerate(centrality)}
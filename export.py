@@ -0,0 +1,224 @@
+import os
+import json
+import time
+import numpy as np
+
+CHUNK_SIZE = 1_000_000
+NODE_COLUMN = "node"
+METADATA_SUFFIX = ".meta.json"
+SUPPORTED_FORMATS = ("npy", "csv", "parquet")
+CSV_FLOAT_FORMAT = "%.17g"
+
+
+def _node_column(nodes: list) -> np.ndarray:
+    """
+    Convert a list of node ids into a NumPy column.
+
+    Integer ids are stored as int64, anything else is stored as a unicode string.
+    """
+    column = np.asarray(nodes)
+    if column.dtype.kind in "iub":
+        return column.astype(np.int64)
+    return np.asarray([str(node) for node in nodes])
+
+
+def _collect_nodes(centralities: dict) -> list:
+    """
+    Collect the union of nodes over all measures, keeping first-seen order.
+    """
+    nodes = {}
+    for scores in centralities.values():
+        nodes.update(dict.fromkeys(scores))
+    return list(nodes)
+
+
+def _export_format(output_path: str) -> str:
+    extension = os.path.splitext(output_path)[1].lstrip(".").lower()
+    if extension not in SUPPORTED_FORMATS:
+        raise ValueError(f"Unsupported export format '{extension}'. Choose one of {SUPPORTED_FORMATS}.")
+    return extension
+
+
+def _iter_chunks(nodes: list, centralities: dict, chunk_size: int):
+    """
+    Yield (start, node_chunk, {measure: score_chunk}) tuples of at most chunk_size rows.
+
+    Nodes missing from a measure get NaN so that every column has the same length.
+    """
+    for start in range(0, len(nodes), chunk_size):
+        chunk = nodes[start:start + chunk_size]
+        columns = {
+            measure: np.fromiter((scores.get(node, np.nan) for node in chunk),
+                                 dtype=np.float64, count=len(chunk))
+            for measure, scores in centralities.items()
+        }
+        yield start, chunk, columns
+
+
+def _table_dtype(nodes: list, centralities: dict) -> np.dtype:
+    """
+    Build the structured dtype of the exported table: the node column followed by one column per measure.
+    """
+    if all(isinstance(node, (int, np.integer)) for node in nodes):
+        node_dtype = np.dtype(np.int64)
+    else:
+        node_dtype = np.dtype(f"U{max(len(str(node)) for node in nodes)}")
+    return np.dtype([(NODE_COLUMN, node_dtype)] + [(measure, np.float64) for measure in centralities])
+
+
+def _write_npy(output_path, nodes, centralities, chunk_size):
+    dtype = _table_dtype(nodes, centralities)
+    table = np.lib.format.open_memmap(output_path, mode="w+", dtype=dtype, shape=(len(nodes),))
+    for start, chunk, columns in _iter_chunks(nodes, centralities, chunk_size):
+        end = start + len(chunk)
+        table[NODE_COLUMN][start:end] = _node_column(chunk)
+        for measure, column in columns.items():
+            table[measure][start:end] = column
+    table.flush()
+    del table
+
+
+def _write_csv(output_path, nodes, centralities, chunk_size):
+    dtype = _table_dtype(nodes, centralities)
+    node_format = "%d" if dtype[NODE_COLUMN].kind == "i" else "%s"
+    row_format = [node_format] + [CSV_FLOAT_FORMAT] * len(centralities)
+    with open(output_path, "w") as file:
+        file.write(",".join(dtype.names) + "\n")
+        for _, chunk, columns in _iter_chunks(nodes, centralities, chunk_size):
+            rows = np.empty(len(chunk), dtype=dtype)
+            rows[NODE_COLUMN] = _node_column(chunk)
+            for measure, column in columns.items():
+                rows[measure] = column
+            np.savetxt(file, rows, fmt=row_format, delimiter=",")
+
+
+def _write_parquet(output_path, nodes, centralities, chunk_size, metadata):
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError("Parquet export requires pyarrow. Install it with `pip install pyarrow`.")
+
+    writer = None
+    try:
+        for _, chunk, columns in _iter_chunks(nodes, centralities, chunk_size):
+            arrays = {NODE_COLUMN: _node_column(chunk)}
+            arrays.update(columns)
+            table = pa.table(arrays)
+            if writer is None:
+                schema = table.schema.with_metadata({"centrality": json.dumps(metadata)})
+                writer = pq.ParquetWriter(output_path, schema)
+            writer.write_table(table.cast(writer.schema))
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+def export_centrality(centralities: dict, output_path: str, metadata: dict=None,
+                      chunk_size: int=CHUNK_SIZE) -> str:
+    """
+    Write the full score vector of every centrality measure to a columnar file.
+
+    The table has one node id column followed by one float64 column per measure.
+    The format is chosen from the file extension:
+        - .npy: NumPy structured array, readable with np.load(path, mmap_mode='r').
+        - .csv: Plain text with a header row.
+        - .parquet: Apache Parquet (requires pyarrow), one row group per chunk.
+    Rows are written in chunks of chunk_size so huge graphs never need a second full copy in memory.
+    Run metadata is embedded in the Parquet schema, and written next to .npy/.csv files as <path>.meta.json.
+
+    Args:
+        centralities (dict): Mapping of measure name to a {node: score} dictionary.
+        output_path (str): Destination file path.
+        metadata (dict): Optional run metadata (data file, parameters, ...) stored with the scores.
+        chunk_size (int): Number of rows written per chunk.
+
+    Returns:
+        str: The path of the written file.
+
+    Raises:
+        TypeError: If centralities is not a dictionary.
+        ValueError: If the format is unsupported, no measures are given or chunk_size is not positive.
+    """
+    if not isinstance(centralities, dict):
+        raise TypeError("centralities must be a dictionary")
+    if not centralities:
+        raise ValueError("centralities must contain at least one measure")
+    if not isinstance(chunk_size, int) or chunk_size <= 0:
+        raise ValueError("chunk_size must be a positive integer")
+    export_format = _export_format(output_path)
+
+    nodes = _collect_nodes(centralities)
+    run_metadata = {
+        "measures": list(centralities),
+        "num_nodes": len(nodes),
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+    run_metadata.update(metadata or {})
+
+    directory = os.path.dirname(output_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    match export_format:
+        case "npy":
+            _write_npy(output_path, nodes, centralities, chunk_size)
+        case "csv":
+            _write_csv(output_path, nodes, centralities, chunk_size)
+        case "parquet":
+            _write_parquet(output_path, nodes, centralities, chunk_size, run_metadata)
+
+    if export_format != "parquet":
+        with open(output_path + METADATA_SUFFIX, "w") as file:
+            json.dump(run_metadata, file, indent=2)
+
+    print(f"Centrality scores saved as {output_path}")
+    return output_path
+
+
+def load_centrality(path: str) -> tuple:
+    """
+    Load a table written by export_centrality.
+
+    Args:
+        path (str): Path to a .npy, .csv or .parquet file.
+
+    Returns:
+        tuple: (columns, metadata)
+            - columns: Dictionary mapping the node column and each measure to a NumPy array.
+              .npy columns are memory-mapped views, so loading is independent of the table size.
+            - metadata: Dictionary of run metadata (empty if none was stored).
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        ValueError: If the format is unsupported.
+    """
+    export_format = _export_format(path)
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"File not found: {path}")
+
+    metadata = {}
+    match export_format:
+        case "npy":
+            table = np.load(path, mmap_mode="r")
+            columns = {name: table[name] for name in table.dtype.names}
+        case "csv":
+            table = np.genfromtxt(path, delimiter=",", names=True, dtype=None, encoding=None)
+            table = np.atleast_1d(table)
+            columns = {name: table[name] for name in table.dtype.names}
+        case "parquet":
+            try:
+                import pyarrow.parquet as pq
+            except ImportError:
+                raise ImportError("Parquet export requires pyarrow. Install it with `pip install pyarrow`.")
+            table = pq.read_table(path)
+            columns = {name: table.column(name).to_numpy() for name in table.column_names}
+            schema_metadata = table.schema.metadata or {}
+            if b"centrality" in schema_metadata:
+                metadata = json.loads(schema_metadata[b"centrality"])
+
+    if os.path.exists(path + METADATA_SUFFIX):
+        with open(path + METADATA_SUFFIX) as file:
+            metadata = json.load(file)
+
+    return columns, metadata
@@ -0,0 +1,194 @@
+from collections import deque, defaultdict
+from components import connected_components
+
+
+def simple_neighbors(graph: dict) -> dict:
+    """
+    Neighbor sets of an undirected graph without self-loops or duplicate edges.
+    """
+    return {v: set(neighbors) - {v} for v, neighbors in graph.items()}
+
+
+def fold_degree_one_nodes(neighbors: dict) -> tuple:
+    """
+    Repeatedly fold degree-1 nodes into their only neighbor, removing them from neighbors in place.
+
+    Every remaining node v stands for the tree of folded nodes hanging from it.
+
+    Args:
+        neighbors (dict): Neighbor sets of the graph; modified in place.
+
+    Returns:
+        tuple: (weight, internal, folded)
+            - weight: Number of original nodes represented by each node (itself plus its folded trees).
+            - internal: Number of unordered pairs of nodes lying in two different trees folded into
+              each node; the shortest path of every such pair goes through the node.
+            - folded: Set of removed nodes; their weight and internal values are final.
+    """
+    weight = dict.fromkeys(neighbors, 1)
+    internal = dict.fromkeys(neighbors, 0)
+    folded = set()
+    queue = [v for v, adjacent in neighbors.items() if len(adjacent) == 1]
+    while queue:
+        u = queue.pop()
+        # The last two nodes of a tree are both in the queue; the second one has no neighbor left
+        if len(neighbors[u]) != 1:
+            continue
+        parent = neighbors[u].pop()
+        neighbors[parent].remove(u)
+        internal[parent] += weight[u] * (weight[parent] - 1)
+        weight[parent] += weight[u]
+        folded.add(u)
+        if len(neighbors[parent]) == 1:
+            queue.append(parent)
+    return weight, internal, folded
+
+
+def merge_identical_nodes(neighbors: dict, weight: dict) -> tuple:
+    """
+    Merge structurally equivalent nodes of equal weight, removing the copies from neighbors in place.
+
+    Two nodes are equivalent when they have the same open neighborhood (non-adjacent twins) or the same
+    closed neighborhood (adjacent twins). Equivalent nodes have the same betweenness, and a shortest
+    path never goes through a twin of its own endpoint.
+
+    Args:
+        neighbors (dict): Neighbor sets of the graph; modified in place.
+        weight (dict): Weight of each node, see fold_degree_one_nodes.
+
+    Returns:
+        tuple: (multiplicity, representative, open_twins)
+            - multiplicity: Number of equivalent nodes represented by each remaining node.
+            - representative: Remaining node standing for each node (itself if it was not merged).
+            - open_twins: Set of representatives of non-adjacent twin classes.
+    """
+    classes = defaultdict(list)
+    for v, adjacent in neighbors.items():
+        if adjacent:
+            classes[("open", frozenset(adjacent), weight[v])].append(v)
+            classes[("closed", frozenset(adjacent | {v}), weight[v])].append(v)
+
+    multiplicity = dict.fromkeys(neighbors, 1)
+    representative = {v: v for v in neighbors}
+    open_twins = set()
+    for (kind, _, _), members in classes.items():
+        if len(members) < 2:
+            continue
+        head = members[0]
+        multiplicity[head] = len(members)
+        if kind == "open":
+            open_twins.add(head)
+        for copy in members[1:]:
+            representative[copy] = head
+            for adjacent in neighbors.pop(copy):
+                neighbors[adjacent].discard(copy)
+            del multiplicity[copy]
+    return multiplicity, representative, open_twins
+
+
+def weighted_dependencies(neighbors: dict, weight: dict, multiplicity: dict) -> dict:
+    """
+    Brandes' algorithm on a reduced graph, summed over ordered pairs of original nodes.
+
+    Each remaining node stands for multiplicity[v] equivalent copies, each being the root of a tree of
+    weight[v] original nodes. Shortest path counts go through every copy of a predecessor, and every
+    source and target is weighted by the number of original nodes it stands for.
+
+    Returns:
+        dict: Ordered-pair betweenness of one copy of each remaining node.
+    """
+    betweenness = dict.fromkeys(neighbors, 0.0)
+    for source in neighbors:
+        stack = []
+        pred = {source: []}
+        sigma = {source: 1.0}
+        dist = {source: 0}
+        queue = deque([source])
+        while queue:
+            v = queue.popleft()
+            stack.append(v)
+            # Paths start at one copy of the source, but continue through every copy of v
+            paths = sigma[v] if v == source else sigma[v] * multiplicity[v]
+            for w in neighbors[v]:
+                if w not in dist:
+                    queue.append(w)
+                    dist[w] = dist[v] + 1
+                    sigma[w] = 0.0
+                    pred[w] = []
+                if dist[w] == dist[v] + 1:
+                    sigma[w] += paths
+                    pred[w].append(v)
+
+        delta = dict.fromkeys(stack, 0.0)
+        source_weight = weight[source] * multiplicity[source]
+        while stack:
+            w = stack.pop()
+            coefficient = multiplicity[w] * (weight[w] + delta[w]) / sigma[w]
+            for v in pred[w]:
+                delta[v] += sigma[v] * coefficient
+            if w != source:
+                betweenness[w] += source_weight * delta[w]
+    return betweenness
+
+
+def reduced_betweenness_centrality(graph: dict, normalized=True, merge_twins=True) -> dict:
+    """
+    Computes exact betweenness centrality of an undirected graph on a reduced graph.
+
+    Degree-1 trees are folded into their attachment points and structurally equivalent nodes are merged
+    before running Brandes' algorithm, so BFS runs only from the remaining representatives. The pairs of
+    nodes lost by the reduction are added back in closed form:
+        - a folded or attachment node v of weight w(v) in a component of size n_c lies on the path of
+          every pair between its folded trees and the rest of the component, (w(v) - 1) * (n_c - w(v)),
+          and of every pair between two of its own folded trees;
+        - the m copies of a non-adjacent twin class with neighborhood N are at distance 2, so the
+          m * (m - 1) ordered pairs between them split evenly over the copies of N.
+    On graphs without duplicate edges, the result equals betweenness_centrality(graph, normalized).
+
+    Args:
+        graph (dict): Adjacency list representation of an undirected graph.
+        normalized (bool): Whether to normalize the centrality scores. Default is True.
+        merge_twins (bool): Whether to merge structurally equivalent nodes. Default is True.
+
+    Returns:
+        dict: A dictionary mapping each node to its betweenness centrality score.
+    """
+    if not isinstance(graph, dict):
+        raise TypeError("Graph must be a dictionary")
+
+    component_size = {}
+    for component in connected_components(graph):
+        component_size.update(dict.fromkeys(component, len(component)))
+
+    neighbors = simple_neighbors(graph)
+    weight, internal, folded = fold_degree_one_nodes(neighbors)
+    if merge_twins:
+        multiplicity, representative, open_twins = merge_identical_nodes(neighbors, weight)
+    else:
+        multiplicity = dict.fromkeys(neighbors, 1)
+        representative = {v: v for v in neighbors}
+        open_twins = set()
+
+    ordered = weighted_dependencies(neighbors, weight, multiplicity)
+    for twin in open_twins:
+        copies = multiplicity[twin]
+        paths = sum(multiplicity[adjacent] for adjacent in neighbors[twin])
+        share = copies * (copies - 1) * weight[twin] ** 2 / paths
+        for adjacent in neighbors[twin]:
+            ordered[adjacent] += share
+
+    betweenness = {}
+    for v in graph:
+        size = component_size[v]
+        pairs = internal[v] + (weight[v] - 1) * (size - weight[v])
+        if v in folded:
+            betweenness[v] = float(pairs)
+        else:
+            betweenness[v] = pairs + ordered[representative[v]] / 2
+
+    if normalized and len(graph) > 2:
+        scale = 2 / ((len(graph) - 1) * (len(graph) - 2))
+        for v in betweenness:
+            betweenness[v] *= scale
+
+    return betweenness
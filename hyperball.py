@@ -0,0 +1,203 @@
+"""
+HyperBall: approximate neighborhood function, closeness and harmonic centrality for large graphs.
+
+Every node keeps a HyperLogLog counter of the nodes within distance t of it. The counter of radius
+t + 1 of a node is the register-wise maximum of its own counter and those of its out-neighbors at
+radius t, so each iteration is one linear pass over the CSR arrays, and the number of iterations is
+the diameter of the graph (Boldi and Vigna, In-Core Computation of Geometric Centralities with HyperBall).
+Memory is one uint8 register array of shape (n, registers), twice.
+"""
+import numpy as np
+from utils import create_csr
+
+DEFAULT_REGISTERS = 64  # relative standard error of each count is about 1.04 / sqrt(registers)
+MIN_REGISTERS = 16
+MAX_REGISTERS = 1 << 16
+EDGE_CHUNK = 1 << 18  # gathered neighbor counters per block, in edges
+ROW_CHUNK = 1 << 16
+SPLITMIX_GAMMA = np.uint64(0x9E3779B97F4A7C15)
+
+
+def _splitmix64(values: np.ndarray) -> np.ndarray:
+    """
+    SplitMix64 finalizer, a cheap and well-mixed 64-bit hash of each value.
+    """
+    with np.errstate(over="ignore"):
+        z = values.astype(np.uint64) * SPLITMIX_GAMMA + SPLITMIX_GAMMA
+        z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+        z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+        return z ^ (z >> np.uint64(31))
+
+
+def initial_counters(n: int, registers: int=DEFAULT_REGISTERS, seed: int=0) -> np.ndarray:
+    """
+    HyperLogLog counters holding only the node itself, one row per node.
+
+    The top bits of the hash of a node pick its register, and the register stores the position of
+    the lowest set bit of the remaining bits.
+
+    Args:
+        n (int): Number of nodes.
+        registers (int): Number of registers per counter, a power of two.
+        seed (int): Seed of the node hashes.
+
+    Returns:
+        np.ndarray: uint8 array of shape (n, registers).
+    """
+    p = registers.bit_length() - 1
+    hashes = _splitmix64(np.arange(n, dtype=np.uint64) + np.uint64(seed) * np.uint64(n + 1))
+    register = (hashes >> np.uint64(64 - p)).astype(np.int64)
+    rest = hashes & np.uint64((1 << (64 - p)) - 1)
+    with np.errstate(over="ignore"):
+        lowest_bit = rest & (~rest + np.uint64(1))
+    # A power of two converts to float64 exactly, so log2 gives the bit position without rounding
+    rank = np.where(rest > 0, np.log2(lowest_bit.astype(np.float64)) + 1, 64 - p + 1).astype(np.uint8)
+
+    counters = np.zeros((n, registers), dtype=np.uint8)
+    counters[np.arange(n), register] = rank
+    return counters
+
+
+def estimate_counts(counters: np.ndarray) -> np.ndarray:
+    """
+    HyperLogLog cardinality estimate of each counter, with linear counting for small cardinalities.
+
+    Args:
+        counters (np.ndarray): uint8 array of shape (n, registers).
+
+    Returns:
+        np.ndarray: float64 array of length n.
+    """
+    registers = counters.shape[1]
+    alpha = {16: 0.673, 32: 0.697, 64: 0.709}.get(registers, 0.7213 / (1 + 1.079 / registers))
+    powers = np.ldexp(1.0, -np.arange(256))
+    estimates = np.empty(len(counters))
+    for start in range(0, len(counters), ROW_CHUNK):
+        chunk = counters[start:start + ROW_CHUNK]
+        raw = alpha * registers ** 2 / powers[chunk].sum(axis=1)
+        zeros = np.count_nonzero(chunk == 0, axis=1)
+        small = (raw <= 2.5 * registers) & (zeros > 0)
+        raw[small] = registers * np.log(registers / zeros[small])
+        estimates[start:start + len(chunk)] = raw
+    return estimates
+
+
+def _edge_blocks(indptr: np.ndarray):
+    """
+    Split the node range into consecutive blocks of about EDGE_CHUNK edges each.
+    """
+    n = len(indptr) - 1
+    start = 0
+    while start < n:
+        end = int(np.searchsorted(indptr, indptr[start] + EDGE_CHUNK, side="right")) - 1
+        end = min(max(end, start + 1), n)
+        yield start, end
+        start = end
+
+
+def hyperball(indptr: np.ndarray, indices: np.ndarray, registers: int=DEFAULT_REGISTERS, seed: int=0,
+              max_iterations: int=None, stats: dict=None) -> tuple:
+    """
+    Run HyperBall over CSR arrays until no counter changes.
+
+    Args:
+        indptr (np.ndarray): CSR row pointers of the out-neighbor lists.
+        indices (np.ndarray): CSR column indices of the out-neighbor lists.
+        registers (int): Registers per counter, a power of two between 16 and 65536.
+        seed (int): Seed of the node hashes.
+        max_iterations (int): Optional limit on the radius; None runs to the diameter.
+        stats (dict): Optional dictionary filled with the number of "iterations".
+
+    Returns:
+        tuple: (distance_sums, reachable, harmonic_sums), estimated float64 arrays aligned with the nodes
+            - distance_sums: Sum of the distances from each node to the nodes it reaches.
+            - reachable: Number of nodes reached from each node, excluding itself.
+            - harmonic_sums: Sum of the inverse distances from each node to the nodes it reaches.
+
+    Raises:
+        ValueError: If registers is not a power of two in range.
+    """
+    if (not isinstance(registers, int) or not MIN_REGISTERS <= registers <= MAX_REGISTERS
+            or registers & (registers - 1)):
+        raise ValueError(f"registers must be a power of two between {MIN_REGISTERS} and {MAX_REGISTERS}")
+    n = len(indptr) - 1
+    counters = initial_counters(n, registers, seed)
+    next_counters = np.empty_like(counters)
+    previous = estimate_counts(counters)
+    base = previous.copy()
+
+    distance_sums = np.zeros(n)
+    harmonic_sums = np.zeros(n)
+    radius = 0
+    while max_iterations is None or radius < max_iterations:
+        next_counters[:] = counters
+        for start, end in _edge_blocks(indptr):
+            first, last = indptr[start], indptr[end]
+            if first == last:
+                continue
+            rows = np.flatnonzero(np.diff(indptr[start:end + 1]) > 0)
+            segment_starts = indptr[start:end][rows] - first
+            merged = np.maximum.reduceat(counters[indices[first:last]], segment_starts, axis=0)
+            np.maximum(next_counters[start + rows], merged, out=merged)
+            next_counters[start + rows] = merged
+
+        if np.array_equal(next_counters, counters):
+            break
+        radius += 1
+        counters, next_counters = next_counters, counters
+
+        # Counters only grow, but their estimates can dip at the linear counting switch
+        current = np.maximum(estimate_counts(counters), previous)
+        added = current - previous
+        distance_sums += radius * added
+        harmonic_sums += added / radius
+        previous = current
+
+    if stats is not None:
+        stats["iterations"] = radius
+    return distance_sums, previous - base, harmonic_sums
+
+
+def approximate_closeness_centrality(graph: dict, registers: int=DEFAULT_REGISTERS, seed: int=0,
+                                     stats: dict=None) -> dict:
+    """
+    Estimate closeness centrality of every node with HyperBall.
+
+    Uses the formula of closeness_centrality: (n - 1) / sum of distances to the reachable nodes,
+    and 0 for nodes that reach no other node.
+
+    Args:
+        graph (dict): Adjacency list representation of the graph.
+        registers (int): Registers per counter; more registers are more accurate and use more memory.
+        seed (int): Seed of the node hashes.
+        stats (dict): Optional dictionary filled with the number of "iterations".
+
+    Returns:
+        dict: A dictionary mapping each node to its estimated closeness centrality.
+    """
+    nodes, indptr, indices = create_csr(graph)
+    n = len(nodes)
+    distance_sums, reachable, _ = hyperball(indptr, indices, registers, seed, stats=stats)
+    return {
+        node: (n - 1) / float(distance_sums[i]) if reachable[i] > 0 and distance_sums[i] > 0 else 0.0
+        for i, node in enumerate(nodes)
+    }
+
+
+def approximate_harmonic_centrality(graph: dict, registers: int=DEFAULT_REGISTERS, seed: int=0,
+                                    stats: dict=None) -> dict:
+    """
+    Estimate harmonic centrality, the sum of the inverse distances to all other nodes, with HyperBall.
+
+    Args:
+        graph (dict): Adjacency list representation of the graph.
+        registers (int): Registers per counter; more registers are more accurate and use more memory.
+        seed (int): Seed of the node hashes.
+        stats (dict): Optional dictionary filled with the number of "iterations".
+
+    Returns:
+        dict: A dictionary mapping each node to its estimated harmonic centrality.
+    """
+    nodes, indptr, indices = create_csr(graph)
+    _, _, harmonic_sums = hyperball(indptr, indices, registers, seed, stats=stats)
+    return {node: float(harmonic_sums[i]) for i, node in enumerate(nodes)}
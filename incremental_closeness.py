@@ -0,0 +1,148 @@
+"""
+Closeness centrality kept up to date under edge insertions, for live leaderboards.
+
+Every node keeps the sum of its distances and the number of nodes it reaches. When the undirected edge
+(u, v) is added, a source s whose distances to u and v differ by at most one keeps all its distances:
+the new edge gives no shorter path from s. The distances from u and from v before the insertion (two BFS
+traversals) identify the sources whose distances to u and v differ by two or more; only these run a BFS
+again. When u and v were in different components, every new shortest path crosses (u, v), so the sums
+of both components are updated from the two BFS traversals alone.
+"""
+from collections import deque
+from utils import get_top_centrality, DEFLAULT_NODES
+from backends import resolve_backend, csr_distance_sums
+
+
+def bfs_distances(graph: dict, source) -> dict:
+    """
+    Distances from a source to every node it reaches, itself included at distance 0.
+
+    Args:
+        graph (dict): Adjacency list representation of the graph.
+        source: The source node.
+
+    Returns:
+        dict: A dictionary mapping each reachable node to its distance from the source.
+    """
+    distances = {source: 0}
+    queue = deque([source])
+    while queue:
+        current = queue.popleft()
+        for neighbor in graph[current]:
+            if neighbor not in distances:
+                distances[neighbor] = distances[current] + 1
+                queue.append(neighbor)
+    return distances
+
+
+class IncrementalCloseness:
+    """
+    Closeness centrality of an unweighted undirected graph under edge insertions.
+
+    Args:
+        graph (dict): Adjacency list representation of the graph; it is copied, not modified.
+        backend (str): Kernel backend for the initial all-sources BFS ('python', 'numba' or 'auto');
+                       None uses the global backend.
+
+    Attributes:
+        graph (dict): The current adjacency list.
+        distance_sums (dict): Sum of the distances from each node to the nodes it reaches.
+        reachable (dict): Number of nodes reached from each node, excluding itself.
+        stats (dict): Counts of "insertions", component "merges", BFS "sources" run again and
+                      sources "skipped" by the level filter.
+    """
+
+    def __init__(self, graph: dict, backend: str=None):
+        self.graph = {node: list(neighbors) for node, neighbors in graph.items()}
+        self.distance_sums = {}
+        self.reachable = {}
+        if resolve_backend(backend) == "numba":
+            nodes, distance_sums, reachable = csr_distance_sums(self.graph)
+            self.distance_sums = dict(zip(nodes, distance_sums.tolist()))
+            self.reachable = dict(zip(nodes, reachable.tolist()))
+        else:
+            for node in self.graph:
+                self._set_source(node, bfs_distances(self.graph, node))
+        self.stats = {"insertions": 0, "merges": 0, "sources": 0, "skipped": 0}
+
+    def _set_source(self, source, distances: dict) -> None:
+        self.distance_sums[source] = sum(distances.values())
+        self.reachable[source] = len(distances) - 1
+
+    def add_node(self, node) -> None:
+        """
+        Add an isolated node; existing nodes are left as they are.
+        """
+        if node not in self.graph:
+            self.graph[node] = []
+            self.distance_sums[node] = 0
+            self.reachable[node] = 0
+
+    def add_edge(self, u, v) -> set:
+        """
+        Insert the undirected edge (u, v), adding its endpoints if needed, and update the distance sums.
+
+        Self-loops and edges already present change no distance and are ignored.
+
+        Returns:
+            set: The sources whose distance sums changed.
+        """
+        self.add_node(u)
+        self.add_node(v)
+        if u == v or v in self.graph[u]:
+            return set()
+
+        from_u = bfs_distances(self.graph, u)
+        from_v = bfs_distances(self.graph, v)
+        self.graph[u].append(v)
+        self.graph[v].append(u)
+        self.stats["insertions"] += 1
+
+        if v not in from_u:
+            # Joining two components: s on u's side reaches w on v's side at d(s, u) + 1 + d(v, w)
+            self.stats["merges"] += 1
+            for near, far, far_sum in ((from_u, from_v, self.distance_sums[v]),
+                                       (from_v, from_u, self.distance_sums[u])):
+                for source, distance in near.items():
+                    self.distance_sums[source] += len(far) * (distance + 1) + far_sum
+                    self.reachable[source] += len(far)
+            return set(from_u) | set(from_v)
+
+        # In an undirected graph d(s, u) = d(u, s), so the two traversals give every source's level of u and v
+        affected = {source for source, distance in from_u.items() if abs(distance - from_v[source]) >= 2}
+        for source in affected:
+            self._set_source(source, bfs_distances(self.graph, source))
+        self.stats["sources"] += len(affected)
+        self.stats["skipped"] += len(from_u) - len(affected)
+        return affected
+
+    def add_edges(self, edges) -> set:
+        """
+        Insert edges one at a time, see add_edge.
+
+        Returns:
+            set: The sources whose distance sums changed.
+        """
+        updated = set()
+        for u, v in edges:
+            updated |= self.add_edge(u, v)
+        return updated
+
+    def centrality(self) -> dict:
+        """
+        Closeness centrality of every node, as computed by closeness_centrality on the current graph.
+
+        Returns:
+            dict: A dictionary mapping each node to its closeness centrality.
+        """
+        n = len(self.graph)
+        return {
+            node: (n - 1) / self.distance_sums[node] if self.reachable[node] > 0 else 0.0
+            for node in self.graph
+        }
+
+    def top(self, top_n: int=DEFLAULT_NODES) -> list:
+        """
+        The top_n nodes by closeness centrality, see utils.get_top_centrality.
+        """
+        return get_top_centrality(self.centrality(), top_n)
@@ -0,0 +1,183 @@
+"""
+k-core decomposition, degree centrality and a cheap-score prefilter for the expensive measures.
+
+Top nodes by closeness or betweenness almost always sit in the dense cores of the graph, so the exact
+measures only need to refine the nodes above a core number or degree threshold. Check the recall of the
+prefilter on a graph before relying on it: the densest core can be a tight community far from the hubs.
+"""
+import math
+import numpy as np
+from utils import create_csr, get_top_centrality, DEFLAULT_NODES
+from subset import subset_closeness_centrality, subset_betweenness_centrality
+
+PREFILTER_MEASURES = ("closeness", "betweenness")
+PREFILTER_SCORES = ("core", "degree")
+DEFAULT_CANDIDATE_FRACTION = 0.1
+
+
+def _simple_csr(graph: dict) -> tuple:
+    """
+    CSR arrays of the simple undirected graph: edges symmetrized, self-loops and duplicates removed.
+    """
+    nodes, indptr, indices = create_csr(graph)
+    n = len(nodes)
+    rows = np.repeat(np.arange(n), np.diff(indptr))
+    keep = rows != indices
+    rows, cols = rows[keep], indices[keep]
+    keys = np.unique(np.concatenate([rows * n + cols, cols * n + rows]))
+    rows, cols = np.divmod(keys, n)
+    simple_indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows, minlength=n), out=simple_indptr[1:])
+    return nodes, simple_indptr, cols
+
+
+def core_numbers(graph: dict) -> dict:
+    """
+    Compute the core number of every node with the bucket algorithm of Batagelj and Zaversnik.
+
+    Nodes are kept in an array sorted by current degree, with the start of each degree bucket, so
+    removing the node of lowest degree and decrementing its neighbors is O(1) per edge: O(n + m) overall.
+    Edges are treated as undirected; self-loops and parallel edges are ignored.
+
+    Args:
+        graph (dict): Adjacency list representation of the graph.
+
+    Returns:
+        dict: A dictionary mapping each node to its core number.
+    """
+    nodes, indptr, indices = _simple_csr(graph)
+    n = len(nodes)
+    if n == 0:
+        return {}
+    degree = np.diff(indptr)
+
+    # Bucket sort the nodes by degree: order holds the nodes, position the index of each node in order
+    order = np.argsort(degree, kind="stable")
+    position = np.empty(n, dtype=np.int64)
+    position[order] = np.arange(n)
+    counts = np.bincount(degree)
+    bucket_start = np.zeros(len(counts) + 1, dtype=np.int64)
+    np.cumsum(counts, out=bucket_start[1:])
+
+    # Plain lists are much faster than NumPy scalars in the sequential peeling loop
+    degree, order, position = degree.tolist(), order.tolist(), position.tolist()
+    bucket_start, indptr, indices = bucket_start.tolist(), indptr.tolist(), indices.tolist()
+    for i in range(n):
+        v = order[i]
+        for u in indices[indptr[v]:indptr[v + 1]]:
+            if degree[u] > degree[v]:
+                # Move u to the front of its bucket, then shift the bucket boundary past it
+                du = degree[u]
+                first = bucket_start[du]
+                w = order[first]
+                if u != w:
+                    order[position[u]], order[first] = w, u
+                    position[w], position[u] = position[u], first
+                bucket_start[du] += 1
+                degree[u] -= 1
+
+    return {node: degree[i] for i, node in enumerate(nodes)}
+
+
+def degree_centrality(graph: dict) -> dict:
+    """
+    Compute degree centrality, the fraction of the other nodes a node is connected to.
+
+    Args:
+        graph (dict): Adjacency list representation of the graph.
+
+    Returns:
+        dict: A dictionary mapping each node to its degree divided by n - 1.
+    """
+    if len(graph) <= 1:
+        return dict.fromkeys(graph, 1.0)
+    scale = 1 / (len(graph) - 1)
+    return {node: len(neighbors) * scale for node, neighbors in graph.items()}
+
+
+def select_candidates(scores: dict, min_score=None, fraction: float=DEFAULT_CANDIDATE_FRACTION,
+                      minimum: int=0) -> list:
+    """
+    Select the nodes whose cheap score passes the prefilter.
+
+    Args:
+        scores (dict): Cheap scores, e.g. core numbers or degree centrality.
+        min_score: Keep the nodes scoring at least this; None keeps the top fraction of the nodes instead.
+        fraction (float): Fraction of the nodes to keep when min_score is None; ties at the cut are kept.
+        minimum (int): Minimum number of candidates, e.g. k for a top-k query.
+
+    Returns:
+        list: Candidate nodes, from the highest cheap score to the lowest.
+
+    Raises:
+        ValueError: If fraction is not in (0, 1].
+    """
+    if not 0 < fraction <= 1:
+        raise ValueError("fraction must be in (0, 1]")
+    ranked = sorted(scores, key=scores.get, reverse=True)
+    if not ranked:
+        return []
+    if min_score is None:
+        count = max(math.ceil(fraction * len(ranked)), minimum)
+        min_score = scores[ranked[min(count, len(ranked)) - 1]]
+    candidates = [node for node in ranked if scores[node] >= min_score]
+    if len(candidates) < minimum:
+        candidates = ranked[:minimum]
+    return candidates
+
+
+def prefilter_recall(candidates, reference: dict, k: int=DEFLAULT_NODES) -> float:
+    """
+    Fraction of the exact top-k nodes of reference that the prefilter kept as candidates.
+    """
+    top = [node for node, _ in get_top_centrality(reference, top_n=k)]
+    return len(set(top) & set(candidates)) / len(top)
+
+
+def prefiltered_top_k(graph: dict, measure: str, k: int=DEFLAULT_NODES, by: str="degree", min_score=None,
+                      fraction: float=DEFAULT_CANDIDATE_FRACTION, reference: dict=None,
+                      stats: dict=None) -> list:
+    """
+    Top-k nodes by closeness or betweenness, refining only the candidates of a core or degree prefilter.
+
+    Closeness of the candidates is exact, at the cost of one BFS per candidate. Exact betweenness of
+    any node needs a traversal from every node, so candidates are ranked by the betweenness estimate
+    of the paths starting at the candidates (scaled by n / candidates) instead.
+
+    Args:
+        graph (dict): Adjacency list representation of the graph.
+        measure (str): 'closeness' or 'betweenness'.
+        k (int): Number of top nodes to return.
+        by (str): Cheap score of the prefilter, 'core' (core numbers) or 'degree'.
+        min_score: Keep the nodes whose cheap score is at least this; None keeps the top fraction.
+        fraction (float): Fraction of the nodes kept when min_score is None.
+        reference (dict): Optional exact scores of measure, used to report the recall of the prefilter.
+        stats (dict): Optional dictionary filled with the number of "candidates", the "candidate_fraction"
+                      and, given reference, the "recall" of the exact top-k among the candidates.
+
+    Returns:
+        list: List of tuples containing the node and its score, as get_top_centrality.
+
+    Raises:
+        ValueError: If measure or by is unknown.
+    """
+    if measure not in PREFILTER_MEASURES:
+        raise ValueError(f"Unknown prefilter measure: {measure}. Choose one of {PREFILTER_MEASURES}.")
+    if by not in PREFILTER_SCORES:
+        raise ValueError(f"Unknown prefilter score: {by}. Choose one of {PREFILTER_SCORES}.")
+    cheap_scores = core_numbers(graph) if by == "core" else degree_centrality(graph)
+    candidates = select_candidates(cheap_scores, min_score, fraction, minimum=k)
+
+    if measure == "closeness":
+        scores = subset_closeness_centrality(graph, candidates)
+    else:
+        betweenness = subset_betweenness_centrality(graph, sources=candidates)
+        scale = len(graph) / len(candidates)
+        scores = {node: betweenness[node] * scale for node in candidates}
+
+    if stats is not None:
+        stats["candidates"] = len(candidates)
+        stats["candidate_fraction"] = len(candidates) / len(graph)
+        if reference is not None:
+            stats["recall"] = prefilter_recall(candidates, reference, k)
+    return get_top_centrality(scores, top_n=k)
@@ -1,44 +1,111 @@
 from utils import create_adjacency_list, create_adjacency_matrix, \
-    get_top_centrality, compare_centrality_with_egos, \
-    plot_social_network_with_centrality, plot_social_network
+    get_top_centrality, compare_centrality_with_egos
+from visualization import plot_social_network_with_centrality, plot_social_network
 from betweenness_centrality import betweenness_centrality
-from eigenvector import eigenvector_centrality
-from page_rank import page_rank_centrality
+from eigenvector import eigenvector_centrality, DEFLAUT_ITERATIONS, TOLERANCE
+from page_rank import page_rank_centrality, DEFAULT_FACTOR, DEFAULT_MAX_ITERATIONS, \
+    DEFAULT_CONVERGENCE_THRESHOLD
 from closeness import closeness_centrality
+from export import export_centrality
+from cache import cached_centrality
+from profiling import PhaseProfiler
+from k_core import core_numbers, degree_centrality
 
 DATA_FILE = "facebook_data/facebook_combined.txt"
 DEFLAULT_NODES = 10
 EGO_VERTICES = {0, 107, 348, 414, 686, 698, 1684, 1912, 3437, 3980}
+RESULTS_FILE = "results/centrality_scores.npy"
+PROFILE_REPORT = "results/profile.json"
+CHECKPOINT_DIR = "results/checkpoints/"
+CPROFILE_DIR = None  # set to e.g. "results/profiles/" to run every phase under cProfile
+PLOTS = True  # set to False for a compute-only run that never imports networkx or matplotlib
+MEASURE_PARAMETERS = {
+    "degree": {},
+    "core": {},
+    "closeness": {},
+    "betweenness": {"normalized": True, "directed": False},
+    "eigenvector": {"max_iter": DEFLAUT_ITERATIONS, "tol": TOLERANCE},
+    "pagerank": {
+        "damping_factor": DEFAULT_FACTOR,
+        "max_iterations": DEFAULT_MAX_ITERATIONS,
+        "convergence_threshold": DEFAULT_CONVERGENCE_THRESHOLD,
+    },
+}
+
+
+def compute_centrality(centrality_measure, adjacency_list, adjacency_matrix, params, stats=None):
+    """
+    Compute one centrality measure with the given parameters.
+
+    Args:
+        centrality_measure (str): One of 'degree', 'core', 'closeness', 'betweenness', 'eigenvector', 'pagerank'.
+        adjacency_list (dict): Adjacency list of the graph.
+        adjacency_matrix (np.ndarray): Adjacency matrix of the graph.
+        params (dict): Keyword arguments passed to the centrality function.
+        stats (dict): Optional dictionary filled with iteration counts by the centrality function.
+
+    Returns:
+        dict: A dictionary mapping each node to its centrality score.
+    """
+    match centrality_measure:
+        case "degree":
+            return degree_centrality(adjacency_list, **params)
+        case "core":
+            return core_numbers(adjacency_list, **params)
+        case "closeness":
+            return closeness_centrality(adjacency_list, stats=stats, progress=True,
+                                        checkpoint_path=CHECKPOINT_DIR + "closeness.pkl", **params)
+        case "betweenness":
+            return betweenness_centrality(adjacency_list, stats=stats, progress=True,
+                                          checkpoint_path=CHECKPOINT_DIR + "betweenness.pkl", **params)
+        case "eigenvector":
+            return eigenvector_centrality(adjacency_matrix, stats=stats, **params)
+        case "pagerank":
+            return page_rank_centrality(adjacency_list, stats=stats, **params)
+        case _:
+            raise ValueError(f"Unknown centrality measure: {centrality_measure}")
 
 
 def main():
+    profiler = PhaseProfiler(cprofile_dir=CPROFILE_DIR)
     try:
         print("Creating Adjacency Matrix and List...")
-        adjacency_matrix = create_adjacency_matrix(DATA_FILE)
-        adjacency_list = create_adjacency_list(DATA_FILE)
-        plot_social_network(adjacency_list, EGO_VERTICES)
+        with profiler.phase("create_adjacency_matrix"):
+            adjacency_matrix = create_adjacency_matrix(DATA_FILE)
+        with profiler.phase("create_adjacency_list"):
+            adjacency_list = create_adjacency_list(DATA_FILE)
+        if PLOTS:
+            with profiler.phase("plot_social_network"):
+                plot_social_network(adjacency_list, EGO_VERTICES)
 
         # change this to run different centrality functions
-        centrality_list = ["closeness", "betweenness", "eigenvector", "pagerank"]
+        centrality_list = ["degree", "core", "closeness", "betweenness", "eigenvector", "pagerank"]
+        results = {}
 
         for centrality_measure in centrality_list:
             print(f"\nCalculating {centrality_measure.capitalize()} Centrality...")
-            match centrality_measure:
-                case "closeness":
-                    centrality = closeness_centrality(adjacency_list)
-                case "betweenness":
-                    centrality = betweenness_centrality(adjacency_list, normalized=True, directed=False)
-                case "eigenvector":
-                    centrality = eigenvector_centrality(adjacency_matrix)
-                case "pagerank":
-                    centrality = page_rank_centrality(adjacency_list)
-                case _:
-                    raise ValueError(f"Unknown centrality measure: {centrality_measure}")
+            params = MEASURE_PARAMETERS.get(centrality_measure, {})
+            with profiler.phase(centrality_measure) as stats:
+                centrality = cached_centrality(
+                    DATA_FILE, centrality_measure, params,
+                    lambda: compute_centrality(centrality_measure, adjacency_list, adjacency_matrix, params, stats)
+                )
 
             top_centrality_nodes = get_top_centrality(centrality, top_n=DEFLAULT_NODES)
             print(f"Top 10 {centrality_measure.capitalize()} Centrality:", top_centrality_nodes)
             compare_centrality_with_egos(top_centrality_nodes, EGO_VERTICES)
-            plot_social_network_with_centrality(adjacency_list, centrality, centrality_measure, top_centrality_nodes)
+            if PLOTS:
+                with profiler.phase(f"plot_{centrality_measure}"):
+                    plot_social_network_with_centrality(adjacency_list, centrality, centrality_measure,
+                                                        top_centrality_nodes)
+            results[centrality_measure] = centrality
+
+        with profiler.phase("export_centrality"):
+            export_centrality(results, RESULTS_FILE, metadata={"data_file": DATA_FILE})
+
+        profiler.print_summary()
+        if PROFILE_REPORT:
+            profiler.save_report(PROFILE_REPORT)
 
     except FileNotFoundError as e:
         print(f"Error: {e}. Please check the file path.")
@@ -0,0 +1,165 @@
+"""
+Monte Carlo PageRank with random walks, for a fast estimate of the top-k nodes.
+
+Every round starts walks_per_round walks from every node. At each step a walk stops with probability
+1 - damping_factor, otherwise it moves to a uniformly random neighbor, or to a uniformly random node
+when it sits on a dangling node, as in page_rank_centrality. The PageRank of a node is estimated by its
+share of all visits. All walks of a batch advance together as NumPy arrays over the CSR offsets.
+
+Rounds run until the top-k set has not changed for stable_rounds consecutive rounds. High PageRank nodes
+collect the most visits, so their order settles long before the power iteration converges on the tail.
+"""
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from utils import create_csr, DEFLAULT_NODES
+from page_rank import DEFAULT_FACTOR
+
+DEFAULT_WALKS_PER_ROUND = 1
+DEFAULT_MAX_ROUNDS = 100
+DEFAULT_STABLE_ROUNDS = 3
+RANDOM_SEED = 0
+
+_worker_csr = None  # (indptr, indices) of the graph in each worker process
+
+
+def random_walk_visits(indptr: np.ndarray, indices: np.ndarray, walks_per_node: int,
+                       damping_factor: float=DEFAULT_FACTOR, rng: np.random.Generator=None) -> tuple:
+    """
+    Run walks_per_node walks with restart from every node and count the visits of every node.
+
+    Args:
+        indptr (np.ndarray): CSR row pointers.
+        indices (np.ndarray): CSR column indices.
+        walks_per_node (int): Number of walks started from each node.
+        damping_factor (float): Probability of taking one more step.
+        rng (np.random.Generator): Random number generator; a fresh unseeded one when None.
+
+    Returns:
+        tuple: (visits, steps) with visits an int64 array of visit counts, start nodes included,
+               and steps the total number of steps taken.
+    """
+    rng = rng or np.random.default_rng()
+    n = len(indptr) - 1
+    degree = np.diff(indptr)
+    visits = np.zeros(n, dtype=np.int64)
+    positions = np.repeat(np.arange(n), walks_per_node)
+    steps = 0
+    while len(positions):
+        visits += np.bincount(positions, minlength=n)
+        positions = positions[rng.random(len(positions)) < damping_factor]
+        steps += len(positions)
+        out_degree = degree[positions]
+        dangling = out_degree == 0
+        offsets = (rng.random(len(positions)) * out_degree).astype(np.int64)
+        moved = indices[np.minimum(indptr[positions] + offsets, len(indices) - 1)] if len(indices) else positions
+        positions = np.where(dangling, rng.integers(0, n, size=len(positions)), moved)
+    return visits, steps
+
+
+def _init_worker(indptr: np.ndarray, indices: np.ndarray):
+    global _worker_csr
+    _worker_csr = (indptr, indices)
+
+
+def _worker_visits(walks_per_node: int, damping_factor: float, seed: np.random.SeedSequence) -> tuple:
+    """
+    random_walk_visits over the graph of the worker process with its own RNG stream.
+    """
+    indptr, indices = _worker_csr
+    return random_walk_visits(indptr, indices, walks_per_node, damping_factor, np.random.default_rng(seed))
+
+
+def _top_k(visits: np.ndarray, k: int) -> frozenset:
+    k = min(k, len(visits))
+    return frozenset(np.argpartition(-visits, k - 1)[:k].tolist())
+
+
+def monte_carlo_page_rank(graph: dict, damping_factor: float=DEFAULT_FACTOR, k: int=DEFLAULT_NODES,
+                          walks_per_round: int=DEFAULT_WALKS_PER_ROUND, max_rounds: int=DEFAULT_MAX_ROUNDS,
+                          stable_rounds: int=DEFAULT_STABLE_ROUNDS, workers: int=None, seed: int=RANDOM_SEED,
+                          stats: dict=None) -> dict:
+    """
+    Estimate PageRank with random walks, stopping once the top-k nodes are stable.
+
+    Args:
+        graph (dict): Adjacency list representation of the graph.
+        damping_factor (float): Probability of following a link (default: 0.85).
+        k (int): Size of the top set whose stability stops the rounds.
+        walks_per_round (int): Walks started from every node per round and per worker.
+        max_rounds (int): Maximum number of rounds.
+        stable_rounds (int): Number of consecutive rounds without a change of the top-k set to stop after.
+        workers (int): Number of worker processes, each with an independent RNG stream spawned from seed;
+                       None or 1 runs in this process.
+        seed (int): Seed of the random walks.
+        stats (dict): Optional dictionary filled with the number of "rounds", "walks" and "steps".
+
+    Returns:
+        dict: A dictionary mapping each node to its estimated PageRank score.
+    """
+    if not isinstance(graph, dict):
+        raise TypeError("Graph must be a dictionary")
+    if not isinstance(damping_factor, (float, int)) or not (0 < damping_factor < 1):
+        raise ValueError("Damping factor must be a float between 0 and 1")
+    for name, value in (("k", k), ("walks_per_round", walks_per_round), ("max_rounds", max_rounds),
+                        ("stable_rounds", stable_rounds)):
+        if not isinstance(value, int) or value <= 0:
+            raise ValueError(f"{name} must be a positive integer")
+
+    nodes, indptr, indices = create_csr(graph)
+    n = len(nodes)
+    if n == 0:
+        return {}
+    seeds = np.random.SeedSequence(seed)
+    workers = workers if workers and workers > 1 else 1
+    executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                   initargs=(indptr, indices)) if workers > 1 else None
+    rng = np.random.default_rng(seeds.spawn(1)[0]) if executor is None else None
+
+    visits = np.zeros(n, dtype=np.int64)
+    steps = 0
+    rounds = 0
+    unchanged = 0
+    top = None
+    try:
+        while rounds < max_rounds and unchanged < stable_rounds:
+            if executor is None:
+                results = [random_walk_visits(indptr, indices, walks_per_round, damping_factor, rng)]
+            else:
+                futures = [executor.submit(_worker_visits, walks_per_round, damping_factor, child)
+                           for child in seeds.spawn(workers)]
+                results = [future.result() for future in futures]
+            for round_visits, round_steps in results:
+                visits += round_visits
+                steps += round_steps
+            rounds += 1
+
+            current = _top_k(visits, k)
+            unchanged = unchanged + 1 if current == top else 0
+            top = current
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    if stats is not None:
+        stats["rounds"] = rounds
+        stats["walks"] = rounds * workers * walks_per_round * n
+        stats["steps"] = steps
+
+    total = visits.sum()
+    return {node: float(visits[i] / total) for i, node in enumerate(nodes)}
+
+
+def monte_carlo_top_k(graph: dict, k: int=DEFLAULT_NODES, **kwargs) -> list:
+    """
+    Estimate the top-k PageRank nodes with monte_carlo_page_rank.
+
+    Args:
+        graph (dict): Adjacency list representation of the graph.
+        k (int): Number of top nodes to return.
+        **kwargs: Keyword arguments passed to monte_carlo_page_rank.
+
+    Returns:
+        list: List of (node, estimated score) tuples, highest score first.
+    """
+    scores = monte_carlo_page_rank(graph, k=k, **kwargs)
+    return sorted(scores.items(), key=lambda item: item[1], reverse=True)[:k]
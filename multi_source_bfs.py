@@ -0,0 +1,149 @@
+import numpy as np
+from utils import create_csr
+
+WORD_BITS = 64
+DEFAULT_WORDS = 1  # sources per batch = DEFAULT_WORDS * 64
+COUNT_CHUNK_ROWS = 1 << 16
+
+
+def transpose_csr(indptr: np.ndarray, indices: np.ndarray) -> tuple:
+    """
+    Transpose CSR arrays, i.e. turn out-neighbor lists into in-neighbor lists.
+
+    Args:
+        indptr (np.ndarray): CSR row pointers.
+        indices (np.ndarray): CSR column indices.
+
+    Returns:
+        tuple: (indptr, indices) of the transposed graph.
+    """
+    n = len(indptr) - 1
+    rows = np.repeat(np.arange(n), np.diff(indptr))
+    order = np.argsort(indices, kind="stable")
+    transposed_indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(indices, minlength=n), out=transposed_indptr[1:])
+    return transposed_indptr, rows[order]
+
+
+def _bit_counts(bits: np.ndarray) -> np.ndarray:
+    """
+    Count, for each bit position of the (rows, words) uint64 array, how many rows have it set.
+
+    Returns:
+        np.ndarray: int64 array of length words * 64; entry j counts bit j % 64 of word j // 64.
+    """
+    counts = np.zeros(bits.shape[1] * WORD_BITS, dtype=np.int64)
+    for start in range(0, len(bits), COUNT_CHUNK_ROWS):
+        chunk = np.ascontiguousarray(bits[start:start + COUNT_CHUNK_ROWS])
+        # Little-endian byte view + little bit order puts bit j of word k at column 64 * k + j
+        unpacked = np.unpackbits(chunk.astype("<u8").view(np.uint8), axis=1, bitorder="little")
+        counts += unpacked.sum(axis=0, dtype=np.int64)
+    return counts
+
+
+def multi_source_bfs(indptr: np.ndarray, indices: np.ndarray, sources, words: int=DEFAULT_WORDS) -> tuple:
+    """
+    Bit-parallel BFS from many sources over CSR arrays.
+
+    Sources are processed in batches of words * 64. Every node keeps one bit per source of the batch
+    in a row of `words` uint64 words, for the nodes already visited and for the current frontier.
+    One level of all BFS traversals of the batch is then a single OR-reduction of the frontier words
+    of each node's in-neighbors, so the graph is scanned once per level instead of once per source.
+
+    Args:
+        indptr (np.ndarray): CSR row pointers of the out-neighbor lists.
+        indices (np.ndarray): CSR column indices of the out-neighbor lists.
+        sources (iterable): Node indices to start a BFS from.
+        words (int): Number of 64-bit words per node, i.e. batch size / 64.
+
+    Returns:
+        tuple: (distance_sums, reachable, harmonic_sums), arrays aligned with sources
+            - distance_sums: Sum of the distances from each source to the nodes it reaches.
+            - reachable: Number of nodes reached from each source, excluding itself.
+            - harmonic_sums: Sum of the inverse distances from each source to the nodes it reaches.
+    """
+    if not isinstance(words, int) or words <= 0:
+        raise ValueError("words must be a positive integer")
+    sources = np.asarray(list(sources), dtype=np.int64)
+    n = len(indptr) - 1
+    in_indptr, in_indices = transpose_csr(indptr, indices)
+    nonempty = np.flatnonzero(np.diff(in_indptr) > 0)
+    segment_starts = in_indptr[:-1][nonempty]
+
+    distance_sums = np.zeros(len(sources), dtype=np.int64)
+    reachable = np.zeros(len(sources), dtype=np.int64)
+    harmonic_sums = np.zeros(len(sources), dtype=np.float64)
+    batch_size = words * WORD_BITS
+
+    for batch_start in range(0, len(sources), batch_size):
+        batch = sources[batch_start:batch_start + batch_size]
+        positions = np.arange(len(batch))
+        visited = np.zeros((n, words), dtype=np.uint64)
+        np.bitwise_or.at(visited, (batch, positions // WORD_BITS),
+                         np.left_shift(np.uint64(1), (positions % WORD_BITS).astype(np.uint64)))
+        frontier = visited.copy()
+
+        batch_distances = np.zeros(batch_size, dtype=np.int64)
+        batch_reachable = np.zeros(batch_size, dtype=np.int64)
+        batch_harmonic = np.zeros(batch_size, dtype=np.float64)
+        level = 0
+        while len(segment_starts):
+            level += 1
+            reached = np.zeros_like(frontier)
+            reached[nonempty] = np.bitwise_or.reduceat(frontier[in_indices], segment_starts, axis=0)
+            reached &= ~visited
+            active = np.flatnonzero(reached.any(axis=1))
+            if len(active) == 0:
+                break
+            visited[active] |= reached[active]
+            counts = _bit_counts(reached[active])
+            batch_distances += level * counts
+            batch_reachable += counts
+            batch_harmonic += counts / level
+            frontier = reached
+
+        end = batch_start + len(batch)
+        distance_sums[batch_start:end] = batch_distances[:len(batch)]
+        reachable[batch_start:end] = batch_reachable[:len(batch)]
+        harmonic_sums[batch_start:end] = batch_harmonic[:len(batch)]
+
+    return distance_sums, reachable, harmonic_sums
+
+
+def bit_parallel_closeness_centrality(graph: dict, words: int=DEFAULT_WORDS) -> dict:
+    """
+    Compute closeness centrality with the bit-parallel multi-source BFS.
+
+    Gives the same scores as closeness_centrality: (n - 1) / sum of distances to the reachable nodes,
+    and 0 for nodes that reach no other node.
+
+    Args:
+        graph (dict): Adjacency list representation of the graph.
+        words (int): Number of 64-bit words per node, i.e. batch size / 64.
+
+    Returns:
+        dict: A dictionary mapping each node to its closeness centrality.
+    """
+    nodes, indptr, indices = create_csr(graph)
+    n = len(nodes)
+    distance_sums, reachable, _ = multi_source_bfs(indptr, indices, range(n), words)
+    return {
+        node: (n - 1) / float(distance_sums[i]) if reachable[i] > 0 else 0.0
+        for i, node in enumerate(nodes)
+    }
+
+
+def bit_parallel_harmonic_centrality(graph: dict, words: int=DEFAULT_WORDS) -> dict:
+    """
+    Compute harmonic centrality, the sum of the inverse distances to all other nodes.
+
+    Args:
+        graph (dict): Adjacency list representation of the graph.
+        words (int): Number of 64-bit words per node, i.e. batch size / 64.
+
+    Returns:
+        dict: A dictionary mapping each node to its harmonic centrality.
+    """
+    nodes, indptr, indices = create_csr(graph)
+    _, _, harmonic_sums = multi_source_bfs(indptr, indices, range(len(nodes)), words)
+    return {node: float(harmonic_sums[i]) for i, node in enumerate(nodes)}
@@ -0,0 +1,279 @@
+"""
+Out-of-core PageRank over edge shards stored on disk.
+
+shard_edge_file streams an edge file, drops its duplicate edges through hash buckets of about shard_size
+lines, and writes each bucket as a binary shard holding both directions of its undirected edges sorted by
+destination, together with the out-degree of every node id. out_of_core_page_rank then keeps only the rank vectors in memory (or memory-mapped) and
+streams the shards with large sequential reads every iteration, reading the next shard on a background
+thread while the current one is accumulated.
+
+Node ids must be non-negative integers; the rank vectors are indexed by id up to the largest one.
+"""
+import os
+import json
+import itertools
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from utils import parse_edge_lines, deduplicate_edges
+from page_rank import DEFAULT_FACTOR, DEFAULT_MAX_ITERATIONS, DEFAULT_CONVERGENCE_THRESHOLD
+
+DEFAULT_SHARD_SIZE = 1 << 22  # edge lines per shard, 128 MiB of int64 pairs once symmetrized
+METADATA_FILE = "shards.json"
+DEGREE_FILE = "degree.npy"
+PRESENT_FILE = "present.npy"
+SHARD_FILE = "shard_{:05d}.npy"
+BUCKET_FILE = "bucket_{:05d}.bin"
+HASH_MULTIPLIER = np.uint64(0x9E3779B97F4A7C15)  # spreads the (min, max) pairs over the buckets
+BLOCK_SIZE = 1 << 22  # entries of the rank vectors compared per block
+
+
+def _parse_lines(lines: list) -> np.ndarray:
+    """
+    Parse "u v" lines into an (m, 2) int64 array of non-negative ids.
+    """
+    edges = parse_edge_lines(lines)
+    if len(edges) and edges.min() < 0:
+        raise ValueError("Node ids must be non-negative integers")
+    return edges
+
+
+def _grow(array: np.ndarray, size: int) -> np.ndarray:
+    if size <= len(array):
+        return array
+    grown = np.zeros(max(size, 2 * len(array)), dtype=array.dtype)
+    grown[:len(array)] = array
+    return grown
+
+
+def _edge_chunks(edges_file_path: str, shard_size: int):
+    """
+    Yield the edges of a file as (m, 2) arrays of at most shard_size lines.
+    """
+    try:
+        file = open(edges_file_path, 'r')
+    except FileNotFoundError:
+        raise FileNotFoundError(f"File not found: {edges_file_path}")
+    with file:
+        while lines := list(itertools.islice(file, shard_size)):
+            yield _parse_lines(lines)
+
+
+def _bucket_edges(edges_file_path: str, bucket_dir: str, shard_size: int) -> list:
+    """
+    Partition the canonical (min, max) edges of a file into binary bucket files by a hash of the pair.
+
+    All copies of an edge, in either direction, land in the same bucket, so each bucket can be
+    deduplicated on its own. There are as many buckets as shard_size chunks in the file, so a bucket
+    holds about shard_size lines.
+
+    Returns:
+        list: Paths of the bucket files, some of which may not exist when no edge hashed to them.
+    """
+    with open(edges_file_path, 'rb') as file:
+        num_lines = sum(1 for _ in file)
+    num_buckets = max(1, -(-num_lines // shard_size))
+    paths = [os.path.join(bucket_dir, BUCKET_FILE.format(i)) for i in range(num_buckets)]
+    for edges in _edge_chunks(edges_file_path, shard_size):
+        canonical = np.sort(edges, axis=1)
+        keys = canonical.astype(np.uint64)
+        buckets = ((keys[:, 0] * HASH_MULTIPLIER) ^ keys[:, 1]) * HASH_MULTIPLIER >> np.uint64(32)
+        buckets = (buckets % np.uint64(num_buckets)).astype(np.int64)
+        # A stable sort keeps the file order of the edges inside each bucket
+        order = np.argsort(buckets, kind="stable")
+        bounds = np.searchsorted(buckets[order], np.arange(num_buckets + 1))
+        for bucket in np.flatnonzero(np.diff(bounds)):
+            with open(paths[bucket], 'ab') as file:
+                canonical[order[bounds[bucket]:bounds[bucket + 1]]].tofile(file)
+    return paths
+
+
+def shard_edge_file(edges_file_path: str, shard_dir: str, shard_size: int=DEFAULT_SHARD_SIZE,
+                    deduplicate: bool=True) -> dict:
+    """
+    Split an undirected edge file into destination-sorted binary shards.
+
+    Every edge "u v" is stored as the directed edges u -> v and v -> u (once for a self-loop), like
+    create_adjacency_list. With deduplicate, repeated and reversed lines are stored once: a first pass
+    partitions the edges into hash buckets of about shard_size lines, and each bucket is deduplicated
+    in memory and written as one shard. Without it, every shard_size lines form a shard and duplicate
+    lines count as parallel edges, like create_adjacency_list with deduplicate=False.
+
+    Args:
+        edges_file_path (str): Path to the file containing edges.
+        shard_dir (str): Directory the shards are written to; created when missing.
+        shard_size (int): Number of edge lines per shard (on average with deduplicate).
+        deduplicate (bool): Whether to store each undirected edge once. Default is True.
+
+    Returns:
+        dict: Shard metadata: "num_ids", "num_nodes", "num_edges" (directed), the number of
+              "duplicate_edges" dropped and the "shards" file names.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        ValueError: If the file contains invalid data.
+    """
+    if not isinstance(shard_size, int) or shard_size <= 0:
+        raise ValueError("shard_size must be a positive integer")
+    os.makedirs(shard_dir, exist_ok=True)
+    degree = np.zeros(0, dtype=np.int64)
+    present = np.zeros(0, dtype=bool)
+    shards = []
+    num_edges = duplicate_edges = 0
+
+    def write_shard(edges):
+        nonlocal degree, present, num_edges
+        loops = edges[:, 0] == edges[:, 1]
+        sources = np.concatenate([edges[:, 0], edges[~loops, 1]])
+        targets = np.concatenate([edges[:, 1], edges[~loops, 0]])
+        if len(sources) == 0:
+            return
+        size = int(max(sources.max(), targets.max())) + 1
+        degree, present = _grow(degree, size), _grow(present, size)
+        degree[:size] += np.bincount(sources, minlength=size)
+        present[sources] = True
+        present[targets] = True
+
+        order = np.argsort(targets, kind="stable")
+        name = SHARD_FILE.format(len(shards))
+        np.save(os.path.join(shard_dir, name), np.stack([sources[order], targets[order]]))
+        shards.append(name)
+        num_edges += len(sources)
+
+    if deduplicate:
+        if not os.path.isfile(edges_file_path):
+            raise FileNotFoundError(f"File not found: {edges_file_path}")
+        with tempfile.TemporaryDirectory(dir=shard_dir) as bucket_dir:
+            for path in _bucket_edges(edges_file_path, bucket_dir, shard_size):
+                if os.path.exists(path):
+                    counts = {}
+                    write_shard(deduplicate_edges(np.fromfile(path, dtype=np.int64).reshape(-1, 2), stats=counts))
+                    duplicate_edges += counts["duplicate_edges"]
+    else:
+        for edges in _edge_chunks(edges_file_path, shard_size):
+            write_shard(edges)
+
+    num_ids = int(np.flatnonzero(present)[-1]) + 1 if present.any() else 0
+    np.save(os.path.join(shard_dir, DEGREE_FILE), degree[:num_ids])
+    np.save(os.path.join(shard_dir, PRESENT_FILE), present[:num_ids])
+    metadata = {"num_ids": num_ids, "num_nodes": int(present.sum()), "num_edges": num_edges,
+                "duplicate_edges": duplicate_edges, "shards": shards}
+    with open(os.path.join(shard_dir, METADATA_FILE), "w") as file:
+        json.dump(metadata, file)
+    return metadata
+
+
+def _l1_distance(a: np.ndarray, b: np.ndarray) -> float:
+    """
+    L1 distance of two rank vectors, block by block so no full-size temporary is allocated.
+    """
+    return float(sum(np.abs(a[start:start + BLOCK_SIZE] - b[start:start + BLOCK_SIZE]).sum()
+                     for start in range(0, len(a), BLOCK_SIZE)))
+
+
+def _rank_vector(num_ids: int, rank_dir: str, name: str) -> np.ndarray:
+    if rank_dir is None:
+        return np.zeros(num_ids, dtype=np.float64)
+    return np.lib.format.open_memmap(os.path.join(rank_dir, name), mode="w+", dtype=np.float64,
+                                     shape=(num_ids,))
+
+
+def out_of_core_page_rank(shard_dir: str, damping_factor: float=DEFAULT_FACTOR,
+                          max_iterations: int=DEFAULT_MAX_ITERATIONS,
+                          convergence_threshold: float=DEFAULT_CONVERGENCE_THRESHOLD,
+                          rank_dir: str=None, stats: dict=None) -> tuple:
+    """
+    Compute PageRank by streaming the shards written by shard_edge_file once per iteration.
+
+    Uses the same iteration as page_rank_centrality: the rank of dangling nodes is spread over all nodes,
+    and the iteration stops once the L1 change of the ranks falls below the convergence threshold.
+
+    Args:
+        shard_dir (str): Directory written by shard_edge_file.
+        damping_factor (float): Probability of following a link (default: 0.85).
+        max_iterations (int): Maximum number of iterations for power iteration (default: 100).
+        convergence_threshold (float): Threshold for convergence (default: 1e-06).
+        rank_dir (str): Optional directory for memory-mapped rank vectors; None keeps them in RAM.
+        stats (dict): Optional dictionary filled with the number of "iterations" and the final L1 "residual".
+
+    Returns:
+        tuple: (node_ids, ranks) NumPy arrays of the nodes that appear in the edge file and their scores.
+    """
+    if not isinstance(damping_factor, (float, int)) or not (0 < damping_factor < 1):
+        raise ValueError("Damping factor must be a float between 0 and 1")
+    if not isinstance(max_iterations, int) or max_iterations <= 0:
+        raise ValueError("Maximum iterations must be a positive integer")
+    if not isinstance(convergence_threshold, (float, int)) or convergence_threshold <= 0:
+        raise ValueError("Convergence threshold must be a positive float")
+
+    with open(os.path.join(shard_dir, METADATA_FILE)) as file:
+        metadata = json.load(file)
+    num_ids, num_nodes = metadata["num_ids"], metadata["num_nodes"]
+    paths = [os.path.join(shard_dir, name) for name in metadata["shards"]]
+    present = np.load(os.path.join(shard_dir, PRESENT_FILE))
+    node_ids = np.flatnonzero(present)
+    if num_nodes == 0:
+        return node_ids, np.zeros(0, dtype=np.float64)
+    degree = np.load(os.path.join(shard_dir, DEGREE_FILE), mmap_mode=None if rank_dir is None else "r")
+    dangling = present & (degree == 0)
+    if rank_dir is not None:
+        os.makedirs(rank_dir, exist_ok=True)
+
+    ranks = _rank_vector(num_ids, rank_dir, "ranks.npy")
+    new_ranks = _rank_vector(num_ids, rank_dir, "new_ranks.npy")
+    ranks[present] = 1 / num_nodes
+    # Share of its rank that every node sends along each edge; stays 0 for dangling nodes
+    contribution = _rank_vector(num_ids, rank_dir, "contribution.npy")
+    has_edges = degree > 0
+
+    iteration = 0
+    diff = float('inf')
+    with ThreadPoolExecutor(max_workers=1) as reader:
+        while iteration < max_iterations and diff >= convergence_threshold:
+            np.divide(ranks, degree, out=contribution, where=has_edges)
+            new_ranks[:] = 0.0
+
+            # Read shard i + 1 on the reader thread while shard i is accumulated
+            pending = reader.submit(np.load, paths[0]) if paths else None
+            for i in range(len(paths)):
+                shard = pending.result()
+                pending = reader.submit(np.load, paths[i + 1]) if i + 1 < len(paths) else None
+                sources, targets = shard
+                # Targets are sorted, so the accumulation only touches the slice they span
+                low, high = int(targets[0]), int(targets[-1]) + 1
+                new_ranks[low:high] += np.bincount(targets - low, weights=contribution[sources], minlength=high - low)
+
+            dangling_share = ranks[dangling].sum() / num_nodes
+            new_ranks *= damping_factor
+            np.add(new_ranks, damping_factor * dangling_share + (1 - damping_factor) / num_nodes,
+                   out=new_ranks, where=present)
+
+            diff = _l1_distance(new_ranks, ranks)
+            ranks, new_ranks = new_ranks, ranks
+            iteration += 1
+
+    if stats is not None:
+        stats["iterations"] = iteration
+        stats["residual"] = diff
+
+    return node_ids, np.array(ranks[node_ids])
+
+
+def out_of_core_page_rank_centrality(edges_file_path: str, shard_dir: str, shard_size: int=DEFAULT_SHARD_SIZE,
+                                     deduplicate: bool=True, **kwargs) -> dict:
+    """
+    Shard an edge file and compute its PageRank out of core.
+
+    Args:
+        edges_file_path (str): Path to the file containing edges.
+        shard_dir (str): Directory the shards are written to.
+        shard_size (int): Number of edge lines per shard.
+        deduplicate (bool): Whether to store each undirected edge once, see shard_edge_file.
+        **kwargs: Keyword arguments passed to out_of_core_page_rank.
+
+    Returns:
+        dict: A dictionary mapping each node to its PageRank score.
+    """
+    shard_edge_file(edges_file_path, shard_dir, shard_size, deduplicate)
+    node_ids, ranks = out_of_core_page_rank(shard_dir, **kwargs)
+    return dict(zip(node_ids.tolist(), ranks.tolist()))
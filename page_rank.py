@@ -1,4 +1,8 @@
 from collections import defaultdict
+import numpy as np
+from backends import resolve_backend, csr_page_rank
+from block_parallel import block_page_rank
+from rank_stability import TopKStopping, DEFAULT_STABLE_ITERATIONS
 
 DEFAULT_FACTOR = 0.85
 DEFAULT_MAX_ITERATIONS = 100
@@ -7,7 +11,9 @@ DEFAULT_CONVERGENCE_THRESHOLD = 1e-06
 
 def page_rank_centrality(graph: dict, damping_factor: float=DEFAULT_FACTOR,
               max_iterations: int=DEFAULT_MAX_ITERATIONS, 
-              convergence_threshold: float=DEFAULT_CONVERGENCE_THRESHOLD) -> dict:
+              convergence_threshold: float=DEFAULT_CONVERGENCE_THRESHOLD, stats: dict=None,
+              backend: str=None, threads: int=None, top_k: int=None,
+              stable_iterations: int=DEFAULT_STABLE_ITERATIONS) -> dict:
     """
     Computes the PageRank scores for all nodes in a graph using the power iteration method.
 
@@ -17,6 +23,15 @@ def page_rank_centrality(graph: dict, damping_factor: float=DEFAULT_FACTOR,
         damping_factor (float): Probability of following a link (default: 0.85).
         max_iterations (int): Maximum number of iterations for power iteration (default: 100).
         convergence_threshold (float): Threshold for convergence (default: 1e-06).
+        stats (dict): Optional dictionary filled with the number of "iterations" and the final L1 "residual".
+        backend (str): Kernel backend ('python', 'numba' or 'auto'); None uses the global backend.
+        threads (int): Number of threads of the block-parallel iteration over row blocks of the
+                       sparse matrix; None or 1 keeps the single-threaded path.
+        top_k (int): Optional number of top nodes the caller consumes. The iteration then also stops once
+                     the top_k set and order have been stable for stable_iterations iterations and the
+                     L1 error bound residual * d / (1 - d) cannot reorder them, and stats gets whether it
+                     "stopped_early" and the estimated "iterations_saved". Runs the python iteration.
+        stable_iterations (int): Iterations the top_k must stay unchanged before stopping (default: 3).
 
     Returns:
         dict: A dictionary mapping each node to its PageRank score.
@@ -35,6 +50,23 @@ def page_rank_centrality(graph: dict, damping_factor: float=DEFAULT_FACTOR,
     if num_nodes == 0:
         return {}
 
+    stopping = TopKStopping(top_k, stable_iterations) if top_k is not None else None
+
+    if stopping is None and threads is not None and threads > 1:
+        ranks, iteration, diff = block_page_rank(graph, damping_factor, max_iterations, convergence_threshold,
+                                                 threads)
+        if stats is not None:
+            stats["iterations"] = iteration
+            stats["residual"] = diff
+        return ranks
+
+    if stopping is None and resolve_backend(backend) == "numba":
+        ranks, iteration, diff = csr_page_rank(graph, damping_factor, max_iterations, convergence_threshold)
+        if stats is not None:
+            stats["iterations"] = iteration
+            stats["residual"] = diff
+        return ranks
+
     # Initialize PageRank scores to 1/N for all nodes
     ranks = {node: 1 / num_nodes for node in graph}
 
@@ -45,6 +77,7 @@ def page_rank_centrality(graph: dict, damping_factor: float=DEFAULT_FACTOR,
     # Step 2: Power iteration
     iteration = 0
     diff = float('inf')
+    stopped_early = False
     while iteration < max_iterations and diff >= convergence_threshold:
         new_ranks = defaultdict(float)
 
@@ -72,4 +105,18 @@ def page_rank_centrality(graph: dict, damping_factor: float=DEFAULT_FACTOR,
         ranks = new_ranks
         iteration += 1
 
+        # Every score is within d / (1 - d) times the last L1 change of its converged value
+        if stopping is not None and diff >= convergence_threshold and stopping.update(
+                np.fromiter((ranks[node] for node in graph), dtype=float, count=num_nodes),
+                diff * damping_factor / (1 - damping_factor), diff):
+            stopped_early = True
+            break
+
+    if stats is not None:
+        stats["iterations"] = iteration
+        stats["residual"] = diff
+        if stopping is not None:
+            stats["stopped_early"] = stopped_early
+            stats["iterations_saved"] = stopping.iterations_saved(convergence_threshold, iteration, max_iterations)
+
     return dict(ranks)
@@ -0,0 +1,116 @@
+import os
+import sys
+import json
+import time
+import cProfile
+from contextlib import contextmanager, nullcontext
+
+try:
+    import resource
+except ImportError:  # resource is not available on Windows
+    resource = None
+
+PROFILE_SUFFIX = ".prof"
+
+
+def peak_rss() -> int:
+    """
+    Return the peak resident set size of the current process in bytes, or None if unavailable.
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+class PhaseProfiler:
+    """
+    Records per-phase wall time, CPU time, peak RSS and algorithm counters.
+
+    Usage:
+        profiler = PhaseProfiler()
+        with profiler.phase("pagerank") as counters:
+            page_rank_centrality(graph, stats=counters)
+        profiler.save_report("profile.json")
+
+    Counters filled in by the phase (e.g. "iterations", "residual", "sources") are stored with the
+    timings; a "sources" counter is also turned into "sources_per_second".
+
+    Args:
+        cprofile_dir (str): If set, every phase runs under cProfile and its stats are dumped to
+                            <cprofile_dir>/<phase>.prof.
+        profile_hook (callable): Optional factory called with the phase name that returns a context
+                                 manager wrapped around the phase, e.g. to attach a sampling profiler.
+    """
+
+    def __init__(self, cprofile_dir: str=None, profile_hook=None):
+        self.cprofile_dir = cprofile_dir
+        self.profile_hook = profile_hook
+        self.phases = []
+
+    @contextmanager
+    def phase(self, name: str):
+        counters = {}
+        hook = self.profile_hook(name) if self.profile_hook else nullcontext()
+        profiler = cProfile.Profile() if self.cprofile_dir else None
+
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            with hook:
+                if profiler:
+                    profiler.enable()
+                try:
+                    yield counters
+                finally:
+                    if profiler:
+                        profiler.disable()
+        finally:
+            wall_time = time.perf_counter() - wall_start
+            cpu_time = time.process_time() - cpu_start
+            record = {
+                "phase": name,
+                "wall_time": wall_time,
+                "cpu_time": cpu_time,
+                "peak_rss": peak_rss(),
+                "counters": counters,
+            }
+            if "sources" in counters and wall_time > 0:
+                counters["sources_per_second"] = counters["sources"] / wall_time
+            if profiler:
+                os.makedirs(self.cprofile_dir, exist_ok=True)
+                record["profile"] = os.path.join(self.cprofile_dir, name + PROFILE_SUFFIX)
+                profiler.dump_stats(record["profile"])
+            self.phases.append(record)
+
+    def report(self) -> dict:
+        """
+        Return the structured report of all recorded phases.
+        """
+        return {
+            "total_wall_time": sum(record["wall_time"] for record in self.phases),
+            "total_cpu_time": sum(record["cpu_time"] for record in self.phases),
+            "peak_rss": peak_rss(),
+            "phases": self.phases,
+        }
+
+    def save_report(self, output_path: str) -> None:
+        """
+        Write the report as JSON.
+        """
+        directory = os.path.dirname(output_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(output_path, "w") as file:
+            json.dump(self.report(), file, indent=2)
+        print(f"Profile report saved as {output_path}")
+
+    def print_summary(self) -> None:
+        print(f"\n{'phase':<30} {'wall (s)':>10} {'cpu (s)':>10} {'peak RSS MB':>12}  counters")
+        for record in self.phases:
+            rss = record["peak_rss"] / 1e6 if record["peak_rss"] is not None else float("nan")
+            counters = ", ".join(f"{key}={value:.4g}" if isinstance(value, float) else f"{key}={value}"
+                                 for key, value in record["counters"].items())
+            print(f"{record['phase']:<30} {record['wall_time']:>10.3f} {record['cpu_time']:>10.3f} "
+                  f"{rss:>12.1f}  {counters}")
@@ -0,0 +1,113 @@
+import os
+import time
+import pickle
+import hashlib
+import tempfile
+
+PROGRESS_INTERVAL = 5.0  # seconds between two progress lines
+CHECKPOINT_INTERVAL = 500  # processed sources between two checkpoints
+
+
+class ProgressReporter:
+    """
+    Prints the progress, throughput and ETA of a loop over a known number of items.
+
+    Args:
+        total (int): Total number of items.
+        label (str): Label printed in front of every progress line.
+        initial (int): Number of items already done, e.g. when resuming from a checkpoint.
+        interval (float): Minimum number of seconds between two progress lines.
+    """
+
+    def __init__(self, total: int, label: str, initial: int=0, interval: float=PROGRESS_INTERVAL):
+        self.total = total
+        self.label = label
+        self.initial = initial
+        self.interval = interval
+        self.start = time.perf_counter()
+        self.last_report = self.start
+
+    def update(self, done: int, force: bool=False) -> None:
+        now = time.perf_counter()
+        if not force and now - self.last_report < self.interval:
+            return
+        self.last_report = now
+        elapsed = now - self.start
+        rate = (done - self.initial) / elapsed if elapsed > 0 else 0.0
+        remaining = (self.total - done) / rate if rate > 0 else float("inf")
+        percent = 100.0 * done / self.total if self.total else 100.0
+        print(f"{self.label}: {done}/{self.total} ({percent:.1f}%), "
+              f"{rate:.1f} sources/s, ETA {format_duration(remaining)}")
+
+
+def format_duration(seconds: float) -> str:
+    if seconds == float("inf"):
+        return "--:--:--"
+    seconds = int(seconds)
+    return f"{seconds // 3600:02d}:{seconds % 3600 // 60:02d}:{seconds % 60:02d}"
+
+
+def graph_signature(graph: dict) -> str:
+    """
+    Content hash used to check that a checkpoint belongs to the graph being processed.
+
+    The nodes and their neighbor lists are hashed in order, since checkpointed edge scores are
+    indexed by CSR edge position.
+
+    Args:
+        graph (dict): Adjacency list representation of the graph.
+
+    Returns:
+        str: Hex SHA-256 digest of the adjacency list.
+    """
+    digest = hashlib.sha256()
+    for node, neighbors in graph.items():
+        digest.update(f"{node!r}:{list(neighbors)!r}\n".encode())
+    return digest.hexdigest()
+
+
+def save_checkpoint(checkpoint_path: str, state: dict) -> None:
+    """
+    Atomically write a checkpoint, so that a crash during the write keeps the previous one intact.
+
+    Args:
+        checkpoint_path (str): Path of the checkpoint file.
+        state (dict): Picklable state (accumulators, completed sources, parameters).
+    """
+    directory = os.path.dirname(checkpoint_path) or "."
+    os.makedirs(directory, exist_ok=True)
+    file_descriptor, temp_path = tempfile.mkstemp(dir=directory)
+    with os.fdopen(file_descriptor, 'wb') as file:
+        pickle.dump(state, file, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(temp_path, checkpoint_path)
+
+
+def load_checkpoint(checkpoint_path: str, measure: str, graph: dict, params: dict=None):
+    """
+    Load a checkpoint written for the same measure, graph and parameters.
+
+    Args:
+        checkpoint_path (str): Path of the checkpoint file.
+        measure (str): Name of the measure the checkpoint must belong to.
+        graph (dict): Adjacency list being processed.
+        params (dict): Parameters that must match the ones of the checkpoint.
+
+    Returns:
+        dict or None: The saved state, or None if there is no checkpoint.
+
+    Raises:
+        ValueError: If the checkpoint was written for another measure, graph or parameters.
+    """
+    if checkpoint_path is None or not os.path.exists(checkpoint_path):
+        return None
+    with open(checkpoint_path, 'rb') as file:
+        state = pickle.load(file)
+    if (state.get("measure") != measure or state.get("graph") != graph_signature(graph)
+            or state.get("params") != (params or {})):
+        raise ValueError(f"Checkpoint {checkpoint_path} does not match the current {measure} computation")
+    return state
+
+
+def remove_checkpoint(checkpoint_path: str) -> None:
+    if checkpoint_path is not None and os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
@@ -0,0 +1,103 @@
+import math
+import numpy as np
+
+DEFAULT_STABLE_ITERATIONS = 3
+
+
+def top_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    """
+    Indices of the k highest scores, best first; ties go to the lower index.
+
+    Args:
+        scores (np.ndarray): Score vector.
+        k (int): Number of indices wanted; all of them when k >= len(scores).
+
+    Returns:
+        np.ndarray: The indices, sorted by decreasing score.
+    """
+    if k < len(scores):
+        candidates = np.argpartition(-scores, k - 1)[:k]
+        # argpartition breaks ties arbitrarily, so take every score tied with the k-th one before sorting
+        candidates = np.flatnonzero(scores >= scores[candidates].min())
+    else:
+        candidates = np.arange(len(scores))
+    return candidates[np.lexsort((candidates, -scores[candidates]))][:k]
+
+
+class TopKStopping:
+    """
+    Stopping rule for power iterations whose consumer only needs the top k nodes.
+
+    The iteration may stop once the top k set and its order have not changed for stable_iterations
+    iterations, and every gap between consecutive scores of the top k + 1 exceeds twice the error bound
+    of the scores, so that no remaining iteration can swap two of them or bring a node into the top k.
+    The error bound must be a guaranteed one, as PageRank's: residuals alone do not bound the error of
+    eigenvector centrality, whose slow mode can stay hidden for many iterations behind a small
+    contraction rate, so it does not offer this rule.
+
+    Args:
+        k (int): Number of top nodes that must be settled.
+        stable_iterations (int): Number of consecutive iterations the top k must stay unchanged.
+
+    Raises:
+        ValueError: If k or stable_iterations is not a positive integer.
+    """
+
+    def __init__(self, k: int, stable_iterations: int=DEFAULT_STABLE_ITERATIONS):
+        if not isinstance(k, int) or k <= 0:
+            raise ValueError("top_k must be a positive integer")
+        if not isinstance(stable_iterations, int) or stable_iterations <= 0:
+            raise ValueError("stable_iterations must be a positive integer")
+        self.k = k
+        self.stable_iterations = stable_iterations
+        self.top = None
+        self.stable = 0
+        self.residuals = []
+
+    def update(self, scores: np.ndarray, error_bound: float, residual: float) -> bool:
+        """
+        Record the scores of one iteration.
+
+        Args:
+            scores (np.ndarray): Scores after the iteration.
+            error_bound (float): Bound on the distance of every score to its converged value.
+            residual (float): Residual of the iteration, used to estimate the iterations saved.
+
+        Returns:
+            bool: Whether the iteration can stop.
+        """
+        self.residuals.append(float(residual))
+        top = top_indices(scores, self.k + 1)
+        head = tuple(top[:self.k].tolist())
+        self.stable = self.stable + 1 if head == self.top else 0
+        self.top = head
+        if self.stable < self.stable_iterations:
+            return False
+        values = scores[top]
+        return bool(np.all(values[:-1] - values[1:] > 2 * error_bound))
+
+    def iterations_saved(self, threshold: float, iterations: int, max_iterations: int) -> int:
+        """
+        Estimate the iterations the norm criterion would still have run, from the observed convergence rate.
+
+        Args:
+            threshold (float): Residual below which the norm criterion stops.
+            iterations (int): Iterations run so far.
+            max_iterations (int): Iteration limit of the measure.
+
+        Returns:
+            int: Estimated number of iterations saved, at most max_iterations - iterations.
+        """
+        remaining = max_iterations - iterations
+        residual = self.residuals[-1] if self.residuals else 0.0
+        if residual < threshold or remaining <= 0:
+            return 0
+        window = min(len(self.residuals) - 1, self.stable_iterations)
+        if window <= 0 or self.residuals[-1 - window] <= 0:
+            return remaining
+        rate = (residual / self.residuals[-1 - window]) ** (1 / window)
+        if rate <= 0:
+            return 1
+        if rate >= 1:
+            return remaining
+        return min(remaining, math.ceil(math.log(threshold / residual) / math.log(rate)))
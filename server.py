@@ -0,0 +1,341 @@
+"""
+Long-running local query server that keeps the graph and the centrality scores in memory.
+
+The graph is loaded once; centrality jobs run in a process pool so that queries keep being answered
+while they compute, and finished results stay in memory (and in the on-disk cache while the graph
+still matches its edge file). Edge updates bump the graph version and invalidate the results.
+
+Endpoints (JSON responses):
+    GET  /health                         graph size and version
+    GET  /jobs                           status of every measure
+    POST /jobs?measure=pagerank          start computing a measure
+    GET  /score?measure=pagerank&node=0  score of one node
+    GET  /top?measure=pagerank&k=10      top-k nodes of a measure
+    POST /edges  {"add": [[u, v], ...], "remove": [[u, v], ...]}
+
+Run with `python server.py --data facebook_data/facebook_combined.txt` from root directory.
+"""
+import json
+import asyncio
+import argparse
+import multiprocessing
+from urllib.parse import urlsplit, parse_qs
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from utils import create_adjacency_list, create_csr
+from cache import CACHE_DIR, graph_fingerprint, cache_key, load_cached_centrality, store_cached_centrality
+from closeness import closeness_centrality
+from betweenness_centrality import betweenness_centrality
+from eigenvector import eigenvector_centrality
+from page_rank import page_rank_centrality
+from k_core import core_numbers, degree_centrality
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+DEFAULT_TOP_K = 10
+MAX_BODY_BYTES = 16 * 1024 * 1024
+# Workers must not be forked from the event loop: they would inherit the open client sockets
+START_METHOD = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+MEASURES = ("degree", "core", "closeness", "betweenness", "eigenvector", "pagerank")
+STATUS_TEXT = {200: "OK", 202: "Accepted", 400: "Bad Request", 404: "Not Found",
+               405: "Method Not Allowed", 409: "Conflict", 413: "Payload Too Large"}
+
+
+class HTTPError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+def compute_measure(measure: str, graph: dict) -> dict:
+    """
+    Compute one measure with its default parameters; runs in a worker process.
+
+    Args:
+        measure (str): One of MEASURES.
+        graph (dict): Adjacency list of the graph.
+
+    Returns:
+        dict: A dictionary mapping each node to its score.
+    """
+    match measure:
+        case "degree":
+            return degree_centrality(graph)
+        case "core":
+            return core_numbers(graph)
+        case "closeness":
+            return closeness_centrality(graph)
+        case "betweenness":
+            return betweenness_centrality(graph)
+        case "eigenvector":
+            nodes, indptr, indices = create_csr(graph)
+            matrix = np.zeros((len(nodes), len(nodes)))
+            matrix[np.repeat(np.arange(len(nodes)), np.diff(indptr)), indices] = 1
+            scores = eigenvector_centrality(matrix)
+            return {node: scores[i] for i, node in enumerate(nodes)}
+        case "pagerank":
+            return page_rank_centrality(graph)
+        case _:
+            raise ValueError(f"Unknown centrality measure: {measure}")
+
+
+class CentralityServer:
+    """
+    Serve centrality queries over HTTP (TCP or Unix socket) from an in-memory graph.
+
+    Args:
+        graph (dict): Adjacency list of the graph; loaded from edges_file_path when None.
+        edges_file_path (str): Edge file of the graph, also used as the on-disk cache fingerprint.
+        workers (int): Number of worker processes for the centrality jobs; None uses the CPU count.
+        cache_dir (str): Directory of the on-disk cache; None disables it.
+    """
+
+    def __init__(self, graph: dict=None, edges_file_path: str=None, workers: int=None,
+                 cache_dir: str=CACHE_DIR):
+        if graph is None:
+            if edges_file_path is None:
+                raise ValueError("Either graph or edges_file_path is required")
+            graph = create_adjacency_list(edges_file_path)
+        self.graph = graph
+        self.edges_file_path = edges_file_path
+        self.cache_dir = cache_dir if edges_file_path else None
+        self.fingerprint = graph_fingerprint(edges_file_path) if self.cache_dir else None
+        self.version = 0
+        self.results = {}  # measure -> {"version", "scores", "ranking"}
+        self.jobs = {}  # measure -> asyncio.Task of the running job
+        self.stale_jobs = set()  # jobs of an old graph version, kept referenced until they finish
+        self.executor = ProcessPoolExecutor(max_workers=workers,
+                                            mp_context=multiprocessing.get_context(START_METHOD))
+        self.server = None
+
+    async def start(self, host: str=DEFAULT_HOST, port: int=DEFAULT_PORT, unix_path: str=None):
+        """
+        Start listening; port 0 picks a free port, see the port attribute.
+        """
+        if unix_path:
+            self.server = await asyncio.start_unix_server(self._handle_connection, path=unix_path)
+        else:
+            self.server = await asyncio.start_server(self._handle_connection, host, port)
+        return self
+
+    @property
+    def port(self) -> int:
+        return self.server.sockets[0].getsockname()[1]
+
+    async def close(self):
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+        for task in (*self.jobs.values(), *self.stale_jobs):
+            task.cancel()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    # ---- jobs ----
+
+    def job_status(self, measure: str) -> str:
+        if measure in self.results:
+            return "done"
+        task = self.jobs.get(measure)
+        if task is None or task.cancelled():
+            return "idle"
+        if not task.done():
+            return "running"
+        return "failed" if task.exception() is not None else "idle"
+
+    def submit(self, measure: str) -> str:
+        """
+        Start computing measure for the current graph version unless it is computed or running.
+
+        Returns:
+            str: The job status after the call.
+        """
+        if measure not in MEASURES:
+            raise HTTPError(400, f"Unknown measure: {measure}. Choose one of {MEASURES}.")
+        if self.job_status(measure) in ("idle", "failed"):
+            # The pool pickles queued calls lazily, so the job gets a copy that edge updates cannot change
+            snapshot = {node: list(neighbors) for node, neighbors in self.graph.items()}
+            self.jobs[measure] = asyncio.create_task(self._run_job(measure, self.version, snapshot))
+        return self.job_status(measure)
+
+    async def _run_job(self, measure: str, version: int, graph: dict):
+        key = cache_key(self.fingerprint, measure) if self.cache_dir and version == 0 else None
+        scores = load_cached_centrality(key, self.cache_dir) if key else None
+        if scores is None:
+            loop = asyncio.get_running_loop()
+            scores = await loop.run_in_executor(self.executor, compute_measure, measure, graph)
+            # Only the scores of the unmodified graph match the edge file fingerprint
+            if key and version == self.version:
+                store_cached_centrality(key, scores, self.cache_dir)
+        # The graph changed while computing: the result describes an old version
+        if version != self.version:
+            return
+        ranking = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+        self.results[measure] = {"version": version, "scores": scores, "ranking": ranking}
+
+    # ---- graph updates ----
+
+    def _node(self, value):
+        """
+        Map a node id from a query string or JSON body to a graph key (ids from edge files are ints).
+        """
+        if value in self.graph:
+            return value
+        try:
+            number = int(value)
+        except (TypeError, ValueError):
+            return value
+        return number if number in self.graph else value
+
+    def update_edges(self, add=(), remove=()) -> dict:
+        """
+        Add and remove undirected edges, then invalidate every result.
+
+        Returns:
+            dict: Number of edges "added" and "removed", and the new graph "version".
+        """
+        added = removed = 0
+        for u, v in remove:
+            u, v = self._node(u), self._node(v)
+            if u in self.graph and v in self.graph.get(u, []):
+                self.graph[u].remove(v)
+                if u != v:
+                    self.graph[v].remove(u)
+                removed += 1
+        for u, v in add:
+            u, v = self._node(u), self._node(v)
+            if v in self.graph.get(u, []):
+                continue
+            self.graph.setdefault(u, []).append(v)
+            if u != v:
+                self.graph.setdefault(v, []).append(u)
+            added += 1
+
+        if added or removed:
+            self.version += 1
+            self.results.clear()
+            # Running jobs see the version change and drop their result
+            for task in self.jobs.values():
+                if not task.done():
+                    self.stale_jobs.add(task)
+                    task.add_done_callback(self.stale_jobs.discard)
+            self.jobs.clear()
+        return {"added": added, "removed": removed, "version": self.version}
+
+    # ---- queries ----
+
+    def _result(self, measure: str) -> dict:
+        if measure not in MEASURES:
+            raise HTTPError(400, f"Unknown measure: {measure}. Choose one of {MEASURES}.")
+        if measure not in self.results:
+            raise HTTPError(409, f"{measure} is {self.job_status(measure)}; POST /jobs?measure={measure} first")
+        return self.results[measure]
+
+    def route(self, method: str, path: str, query: dict, body: bytes):
+        """
+        Answer one request.
+
+        Returns:
+            tuple: (status, payload) with a JSON-serializable payload.
+        """
+        match (method, path):
+            case ("GET", "/health"):
+                return 200, {"nodes": len(self.graph), "version": self.version}
+            case ("GET", "/jobs"):
+                return 200, {measure: self.job_status(measure) for measure in MEASURES}
+            case ("POST", "/jobs"):
+                measure = query.get("measure")
+                status = self.submit(measure)
+                return (200 if status == "done" else 202), {"measure": measure, "status": status}
+            case ("GET", "/score"):
+                result = self._result(query.get("measure"))
+                node = self._node(query.get("node"))
+                if node not in result["scores"]:
+                    raise HTTPError(404, f"Unknown node: {query.get('node')}")
+                return 200, {"node": node, "score": result["scores"][node], "version": result["version"]}
+            case ("GET", "/top"):
+                result = self._result(query.get("measure"))
+                try:
+                    k = int(query.get("k", DEFAULT_TOP_K))
+                except ValueError:
+                    raise HTTPError(400, "k must be an integer")
+                if k <= 0:
+                    raise HTTPError(400, "k must be a positive integer")
+                return 200, {"top": result["ranking"][:k], "version": result["version"]}
+            case ("POST", "/edges"):
+                try:
+                    update = json.loads(body or b"{}")
+                    return 200, self.update_edges(update.get("add", ()), update.get("remove", ()))
+                except (json.JSONDecodeError, AttributeError, TypeError, ValueError):
+                    raise HTTPError(400, 'Body must be {"add": [[u, v], ...], "remove": [[u, v], ...]}')
+            case (_, "/health" | "/jobs" | "/score" | "/top" | "/edges"):
+                raise HTTPError(405, f"{method} is not allowed on {path}")
+            case _:
+                raise HTTPError(404, f"Unknown path: {path}")
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            try:
+                request_line = (await reader.readline()).decode("latin-1").split()
+                if len(request_line) != 3:
+                    raise HTTPError(400, "Malformed request line")
+                method, target, _ = request_line
+                headers = {}
+                while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                length = int(headers.get("content-length", 0))
+                if length > MAX_BODY_BYTES:
+                    raise HTTPError(413, "Request body too large")
+                body = await reader.readexactly(length) if length else b""
+
+                url = urlsplit(target)
+                query = {name: values[-1] for name, values in parse_qs(url.query).items()}
+                status, payload = self.route(method.upper(), url.path, query, body)
+            except HTTPError as error:
+                status, payload = error.status, {"error": str(error)}
+            except ValueError as error:
+                status, payload = 400, {"error": str(error)}
+
+            content = json.dumps(payload, default=str).encode()
+            writer.write(f"HTTP/1.1 {status} {STATUS_TEXT.get(status, '')}\r\n"
+                         f"Content-Type: application/json\r\nContent-Length: {len(content)}\r\n"
+                         "Connection: close\r\n\r\n".encode() + content)
+            await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+
+async def serve(args):
+    server = CentralityServer(edges_file_path=args.data, workers=args.workers,
+                              cache_dir=None if args.no_cache else CACHE_DIR)
+    await server.start(args.host, args.port, args.unix)
+    for measure in args.measures:
+        server.submit(measure)
+    print(f"Serving {len(server.graph)} nodes on {args.unix or f'http://{args.host}:{server.port}'}")
+    try:
+        await server.server.serve_forever()
+    finally:
+        await server.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--data", default="facebook_data/facebook_combined.txt", help="edge file of the graph")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--unix", help="listen on this Unix socket path instead of TCP")
+    parser.add_argument("--workers", type=int, help="worker processes for centrality jobs")
+    parser.add_argument("--measures", nargs="*", default=[], choices=MEASURES,
+                        help="measures to start computing at startup")
+    parser.add_argument("--no-cache", action="store_true", help="do not use the on-disk cache")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
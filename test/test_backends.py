@@ -0,0 +1,110 @@
+"""
+Test cases for the kernel backends.
+Run with `python -m unittest -v test/test_backends.py` from root directory.
+
+Without Numba installed, the kernels run as plain Python functions, which still checks their logic.
+"""
+import warnings
+from unittest import TestCase, main, skipIf
+from unittest.mock import patch
+import networkx as nx
+import backends
+from backends import set_backend, get_backend, resolve_backend, numba_available, \
+    csr_betweenness, csr_distance_sums, csr_page_rank, DEFAULT_BACKEND
+from betweenness_centrality import betweenness_centrality
+from closeness import closeness_centrality
+from page_rank import page_rank_centrality
+
+PLACES = 10
+GRAPH = {
+    'A': ['B', 'D'],
+    'B': ['A', 'C', 'E'],
+    'C': ['B', 'F'],
+    'D': ['A', 'E'],
+    'E': ['B', 'D', 'F'],
+    'F': ['C', 'E'],
+    'G': []
+}
+DIRECTED_GRAPH = {'A': ['B'], 'B': ['C', 'D'], 'C': ['A'], 'D': []}
+
+
+class TestBackends(TestCase):
+    def tearDown(self):
+        set_backend(DEFAULT_BACKEND)
+
+    def assert_scores_equal(self, result, expected):
+        self.assertEqual(set(result), set(expected))
+        for node in expected:
+            self.assertAlmostEqual(result[node], expected[node], places=PLACES)
+
+    def test_set_backend(self):
+        set_backend("auto")
+        self.assertEqual(get_backend(), "auto")
+        with self.assertRaises(ValueError):
+            set_backend("cuda")
+        with self.assertRaises(ValueError):
+            resolve_backend("cuda")
+        self.assertEqual(resolve_backend("python"), "python")
+
+    @skipIf(numba_available(), "Numba is installed")
+    def test_fallback_without_numba(self):
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            self.assertEqual(resolve_backend("numba"), "python")
+        self.assertEqual(len(caught), 1)
+        self.assertEqual(resolve_backend("auto"), "python")
+
+    def test_betweenness_kernel(self):
+        for graph, directed in ((GRAPH, False), (DIRECTED_GRAPH, True)):
+            expected = betweenness_centrality(graph, normalized=False, directed=directed, backend="python")
+            scale = 1 if directed else 0.5
+            result = {node: score * scale for node, score in csr_betweenness(graph).items()}
+            self.assert_scores_equal(result, expected)
+
+    def test_closeness_kernel(self):
+        nodes, distance_sums, reachable = csr_distance_sums(GRAPH)
+        self.assertEqual(nodes, list(GRAPH))
+        self.assertEqual(list(distance_sums), [9, 7, 9, 9, 7, 9, 0])
+        self.assertEqual(list(reachable), [5, 5, 5, 5, 5, 5, 0])
+
+    def test_page_rank_kernel(self):
+        for graph in (GRAPH, DIRECTED_GRAPH):
+            stats = {}
+            expected = page_rank_centrality(graph, backend="python", stats=stats)
+            ranks, iterations, residual = csr_page_rank(graph, 0.85, 100, 1e-06)
+            self.assert_scores_equal(ranks, expected)
+            self.assertEqual(iterations, stats["iterations"])
+            self.assertAlmostEqual(residual, stats["residual"], places=PLACES)
+
+    def test_numba_dispatch_matches_python(self):
+        """
+        Pretend Numba is installed so that the functions dispatch to the (uncompiled) kernels.
+        """
+        with patch.object(backends, "numba", object()):
+            set_backend("numba")
+            self.assertEqual(resolve_backend(), "numba")
+            for graph, directed in ((GRAPH, False), (DIRECTED_GRAPH, True)):
+                self.assert_scores_equal(betweenness_centrality(graph, directed=directed),
+                                         betweenness_centrality(graph, directed=directed, backend="python"))
+                nodes, edge_scores = betweenness_centrality(graph, directed=directed, edge_betweenness=True)
+                expected_nodes, expected_edges = betweenness_centrality(graph, directed=directed,
+                                                                        edge_betweenness=True, backend="python")
+                self.assert_scores_equal(nodes, expected_nodes)
+                for score, expected in zip(edge_scores, expected_edges):
+                    self.assertAlmostEqual(score, expected, places=PLACES)
+                self.assert_scores_equal(closeness_centrality(graph),
+                                         closeness_centrality(graph, backend="python"))
+                self.assert_scores_equal(page_rank_centrality(graph),
+                                         page_rank_centrality(graph, backend="python"))
+
+    def test_numba_backend_matches_networkx(self):
+        nx_graph = nx.karate_club_graph()
+        graph = {node: list(nx_graph[node]) for node in nx_graph}
+        expected = nx.betweenness_centrality(nx_graph)
+        result = betweenness_centrality(graph, backend="auto")
+        for node in expected:
+            self.assertAlmostEqual(result[node], expected[node], places=PLACES)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""
+Test cases for the batch pipeline over many graphs.
+Run with `python -m unittest -v test/test_batch.py` from root directory.
+"""
+import os
+import csv
+import json
+import shutil
+import tempfile
+from unittest import TestCase, main
+from unittest.mock import patch
+from batch import discover_graphs, run_batch, DEFAULT_MEASURES
+from server import compute_measure
+from export import METADATA_SUFFIX
+from utils import create_adjacency_list
+
+PATH = "test/test_files/"
+GRAPHS = ("small_graph", "disconnected_graph", "self_loop", "single_edge")
+PLACES = 10
+
+
+def exit_on_single_edge(measure, graph):
+    """
+    compute_measure that kills its worker process on the two-node graph, like an out-of-memory kill.
+    """
+    if len(graph) == 2:
+        os._exit(1)
+    return compute_measure(measure, graph)
+
+
+class TestBatch(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.graph_dir = os.path.join(self.directory.name, "graphs")
+        os.makedirs(self.graph_dir)
+        for name in GRAPHS:
+            shutil.copy(PATH + name + ".txt", os.path.join(self.graph_dir, name + ".edges"))
+        self.output = os.path.join(self.directory.name, "results", "scores.csv")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def read_output(self):
+        with open(self.output, newline="") as file:
+            rows = list(csv.DictReader(file))
+        with open(self.output + METADATA_SUFFIX) as file:
+            return rows, json.load(file)
+
+    def assert_matches_direct(self, rows):
+        for name in GRAPHS:
+            graph = create_adjacency_list(PATH + name + ".txt")
+            graph_rows = {int(row["node"]): row for row in rows if row["graph"] == name}
+            self.assertEqual(set(graph_rows), set(graph))
+            for measure in DEFAULT_MEASURES:
+                expected = compute_measure(measure, graph)
+                for node, row in graph_rows.items():
+                    self.assertAlmostEqual(float(row[measure]), expected[node], places=PLACES)
+
+    def test_discover_graphs(self):
+        graphs = discover_graphs(self.graph_dir)
+        self.assertEqual([name for name, _ in graphs], sorted(GRAPHS))
+        manifest = os.path.join(self.graph_dir, "manifest.lst")
+        with open(manifest, "w") as file:
+            file.write("# ego networks\nsmall_graph.edges\n\nself_loop.edges\n")
+        self.assertEqual(discover_graphs(manifest), [("small_graph", os.path.join(self.graph_dir, "small_graph.edges")),
+                                                     ("self_loop", os.path.join(self.graph_dir, "self_loop.edges"))])
+        with self.assertRaises(FileNotFoundError):
+            discover_graphs(PATH + "missing.lst")
+
+    def test_serial_and_parallel(self):
+        for workers, max_pending in ((None, None), (2, 1), (3, None)):
+            summary = run_batch(discover_graphs(self.graph_dir), self.output, workers=workers,
+                                max_pending=max_pending)
+            rows, metadata = self.read_output()
+            self.assertEqual(summary["completed"], len(GRAPHS))
+            self.assertEqual(summary["failed"], 0)
+            self.assertGreater(summary["graphs_per_second"], 0)
+            self.assertEqual(metadata["completed"], len(GRAPHS))
+            self.assertEqual(list(rows[0]), ["graph", "node"] + list(DEFAULT_MEASURES))
+            self.assert_matches_direct(rows)
+            records = {record["graph"]: record for record in summary["graphs"]}
+            self.assertEqual(records["small_graph"]["nodes"], 5)
+            self.assertEqual(records["small_graph"]["edges"], 6)
+
+    def test_failed_graphs(self):
+        shutil.copy(PATH + "invalid_line.txt", os.path.join(self.graph_dir, "invalid.edges"))
+        graphs = discover_graphs(self.graph_dir) + [("missing", PATH + "missing.txt")]
+        for workers in (None, 2):
+            summary = run_batch(graphs, self.output, measures=["degree"], workers=workers)
+            rows, _ = self.read_output()
+            self.assertEqual(summary["completed"], len(GRAPHS))
+            self.assertEqual(summary["failed"], 2)
+            failed = {record["graph"] for record in summary["graphs"] if "error" in record}
+            self.assertEqual(failed, {"invalid", "missing"})
+            self.assertEqual({row["graph"] for row in rows}, set(GRAPHS))
+        with self.assertRaises(ValueError):
+            run_batch(graphs, self.output, measures=["unknown"])
+
+    def test_serial_records_any_failure(self):
+        with patch("batch.compute_measure", side_effect=RuntimeError("simulated crash")):
+            summary = run_batch(discover_graphs(self.graph_dir), self.output, measures=["degree"], workers=1)
+        self.assertEqual(summary["completed"], 0)
+        self.assertEqual(summary["failed"], len(GRAPHS))
+        self.assertEqual({record["error"] for record in summary["graphs"]}, {"simulated crash"})
+
+    def test_worker_death(self):
+        # Workers are forked, so they see the patched compute_measure
+        with patch("batch.compute_measure", exit_on_single_edge):
+            summary = run_batch(discover_graphs(self.graph_dir), self.output, measures=["degree"], workers=2,
+                                max_pending=1)
+        rows, metadata = self.read_output()
+        failed = {record["graph"] for record in summary["graphs"] if "error" in record}
+        self.assertEqual(failed, {"single_edge"})
+        self.assertEqual(summary["completed"], len(GRAPHS) - 1)
+        self.assertEqual(metadata["failed"], 1)
+        self.assertEqual({row["graph"] for row in rows}, set(GRAPHS) - {"single_edge"})
+
+
+if __name__ == "__main__":
+    main()
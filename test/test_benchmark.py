@@ -0,0 +1,75 @@
+"""
+Unit tests for the benchmark graph generators and baseline comparison.
+Run with `python -m unittest -v test/test_benchmark.py` from root directory.
+"""
+import os
+import tempfile
+from unittest import TestCase, main
+import numpy as np
+from benchmark import erdos_renyi_edges, barabasi_albert_edges, grid_edges, \
+    write_edges, benchmark_graph, compare_with_baseline, import_time, benchmark_imports
+from utils import create_adjacency_list
+
+
+class TestBenchmark(TestCase):
+    def assert_simple_graph(self, edges):
+        self.assertTrue(np.all(edges[:, 0] != edges[:, 1]))
+        canonical = {tuple(sorted(edge)) for edge in edges.tolist()}
+        self.assertEqual(len(canonical), len(edges))
+
+    def test_erdos_renyi_edges(self):
+        edges = erdos_renyi_edges(1000, average_degree=10)
+        self.assert_simple_graph(edges)
+        self.assertLessEqual(edges.max(), 999)
+        self.assertAlmostEqual(2 * len(edges) / 1000, 10, delta=0.5)
+
+    def test_barabasi_albert_edges(self):
+        edges = barabasi_albert_edges(500, attachment_edges=3)
+        self.assert_simple_graph(edges)
+        self.assertEqual(len(np.unique(edges)), 500)
+        degrees = np.bincount(edges.ravel())
+        self.assertGreater(degrees.max(), 5 * np.median(degrees))
+
+    def test_grid_edges(self):
+        edges = grid_edges(16)
+        self.assert_simple_graph(edges)
+        self.assertEqual(len(edges), 2 * 4 * 3)
+
+    def test_benchmark_graph_records(self):
+        with tempfile.TemporaryDirectory() as directory:
+            edges_file_path = os.path.join(directory, "grid.txt")
+            write_edges(grid_edges(25), edges_file_path)
+            self.assertEqual(len(create_adjacency_list(edges_file_path)), 25)
+            records = benchmark_graph("grid", edges_file_path,
+                                      functions=["create_adjacency_list", "page_rank_centrality"])
+        self.assertEqual([record["function"] for record in records],
+                         ["create_adjacency_list", "page_rank_centrality"])
+        for record in records:
+            self.assertEqual(record["nodes"], 25)
+            self.assertEqual(record["edges"], 40)
+            self.assertGreater(record["wall_time"], 0)
+            self.assertGreater(record["peak_memory"], 0)
+
+    def test_import_time(self):
+        """
+        Loading and ranking must not import the plotting libraries.
+        """
+        for module in ("utils", "page_rank", "closeness"):
+            self.assertEqual(import_time(module)["loaded"], [], module)
+        self.assertNotIn("matplotlib.pyplot", import_time("visualization")["loaded"])
+        records = benchmark_imports(["utils"])
+        self.assertEqual(records[0]["function"], "import_utils")
+        self.assertGreater(records[0]["wall_time"], 0)
+
+    def test_compare_with_baseline(self):
+        baseline = [{"name": "a", "wall_time": 1.0}, {"name": "b", "wall_time": 1.0}]
+        records = [
+            {"name": "a", "wall_time": 1.1},
+            {"name": "b", "wall_time": 2.0},
+            {"name": "c", "wall_time": 5.0},
+        ]
+        self.assertEqual(compare_with_baseline(records, baseline, threshold=1.25), [("b", 1.0, 2.0)])
+
+
+if __name__ == "__main__":
+    main()
@@ -3,7 +3,7 @@ Test cases for the betweenness_centrality function.
 Run with `python -m unittest -v test/test_betweeness.py` from root directory.
 """
 from unittest import TestCase, main
-from betweenness_centrality import betweenness_centrality
+from betweenness_centrality import betweenness_centrality, edge_betweenness_dict
 import networkx as nx
 
 PLACES = 5  # Number of decimal places for comparison
@@ -194,6 +194,48 @@ class TestBetweennessCentrality(TestCase):
         for node in expected:
             self.assertAlmostEqual(result[node], expected[node], places=PLACES)
 
+    def assert_edge_betweenness(self, graph, nx_graph, directed):
+        for normalized in (True, False):
+            expected_nodes = nx.betweenness_centrality(nx_graph, normalized=normalized)
+            expected = nx.edge_betweenness_centrality(nx_graph, normalized=normalized)
+            nodes, edge_scores = betweenness_centrality(graph, normalized=normalized, directed=directed,
+                                                        edge_betweenness=True)
+            result = edge_betweenness_dict(graph, edge_scores, directed=directed)
+            self.assertEqual(len(result), len(expected))
+            for (u, v), score in expected.items():
+                edge = (u, v) if (u, v) in result else (v, u)
+                self.assertAlmostEqual(result[edge], score, places=PLACES)
+            for node in expected_nodes:
+                self.assertAlmostEqual(nodes[node], expected_nodes[node], places=PLACES)
+
+    def test_edge_betweenness_grid_graph(self):
+        nx_graph = nx.convert_node_labels_to_integers(nx.grid_2d_graph(3, 4))
+        graph = {node: list(nx_graph[node]) for node in nx_graph}
+        self.assert_edge_betweenness(graph, nx_graph, directed=False)
+
+    def test_edge_betweenness_bridge(self):
+        """
+        Test Case: Two triangles joined by the bridge C -- D, which carries all paths between them
+        """
+        graph = {
+            'A': ['B', 'C'],
+            'B': ['A', 'C'],
+            'C': ['A', 'B', 'D'],
+            'D': ['C', 'E', 'F'],
+            'E': ['D', 'F'],
+            'F': ['D', 'E']
+        }
+        _, edge_scores = betweenness_centrality(graph, normalized=False, edge_betweenness=True)
+        result = edge_betweenness_dict(graph, edge_scores)
+        self.assertEqual(max(result, key=result.get), ('C', 'D'))
+        self.assertAlmostEqual(result[('C', 'D')], 9.0, places=PLACES)
+        self.assert_edge_betweenness(graph, nx.Graph(graph), directed=False)
+
+    def test_edge_betweenness_directed_graph(self):
+        nx_graph = nx.gnp_random_graph(12, 0.25, seed=3, directed=True)
+        graph = {node: list(nx_graph[node]) for node in nx_graph}
+        self.assert_edge_betweenness(graph, nx_graph, directed=True)
+
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
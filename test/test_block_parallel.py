@@ -0,0 +1,53 @@
+"""
+Test cases for the block-parallel PageRank and eigenvector iterations.
+Run with `python -m unittest -v test/test_block_parallel.py` from root directory.
+"""
+from unittest import TestCase, main
+import numpy as np
+import networkx as nx
+from block_parallel import row_blocks, MIN_BLOCK_ROWS
+from page_rank import page_rank_centrality
+from eigenvector import eigenvector_centrality
+
+PLACES = 10
+NUM_NODES = 3 * MIN_BLOCK_ROWS
+
+
+class TestBlockParallel(TestCase):
+    def test_row_blocks(self):
+        degrees = np.random.default_rng(0).integers(0, 50, size=10 * MIN_BLOCK_ROWS)
+        indptr = np.concatenate([[0], np.cumsum(degrees)])
+        blocks = row_blocks(indptr, 4)
+        self.assertEqual(len(blocks), 4)
+        self.assertEqual(blocks[0][0], 0)
+        self.assertEqual(blocks[-1][1], len(degrees))
+        for (_, stop), (start, _) in zip(blocks, blocks[1:]):
+            self.assertEqual(stop, start)
+        work = [indptr[stop] - indptr[start] + stop - start for start, stop in blocks]
+        self.assertLess(max(work) / min(work), 1.1)
+        self.assertEqual(row_blocks(np.arange(11), 8), [(0, 10)])
+
+    def test_page_rank_matches_single_thread(self):
+        nx_graph = nx.gnp_random_graph(NUM_NODES, 4 / NUM_NODES, seed=2, directed=True)
+        graph = {node: list(nx_graph[node]) for node in nx_graph}
+        graph[0].append(1)  # a parallel edge
+        expected_stats, stats = {}, {}
+        expected = page_rank_centrality(graph, stats=expected_stats)
+        result = page_rank_centrality(graph, stats=stats, threads=3)
+        self.assertEqual(stats["iterations"], expected_stats["iterations"])
+        for node in graph:
+            self.assertAlmostEqual(result[node], expected[node], places=PLACES)
+
+    def test_eigenvector_matches_single_thread(self):
+        nx_graph = nx.barabasi_albert_graph(NUM_NODES, 3, seed=2)
+        matrix = nx.to_numpy_array(nx_graph, nodelist=range(NUM_NODES), dtype=int)
+        expected_stats, stats = {}, {}
+        expected = eigenvector_centrality(matrix, stats=expected_stats)
+        result = eigenvector_centrality(matrix, stats=stats, threads=4)
+        self.assertEqual(stats["iterations"], expected_stats["iterations"])
+        for node in expected:
+            self.assertAlmostEqual(result[node], expected[node], places=PLACES)
+
+
+if __name__ == "__main__":
+    main()
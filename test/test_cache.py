@@ -0,0 +1,79 @@
+"""
+Unit tests for the centrality result cache.
+Run with `python -m unittest -v test/test_cache.py` from root directory.
+"""
+import os
+import shutil
+import tempfile
+from unittest import TestCase, main
+from cache import graph_fingerprint, cache_key, cached_centrality, \
+    store_cached_centrality, load_cached_centrality, evict_cache
+
+PATH = "test/test_files/"
+
+
+class TestCentralityCache(TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.cache_dir = os.path.join(self.directory, "cache")
+        self.edges_file = os.path.join(self.directory, "graph.txt")
+        shutil.copy(PATH + "small_graph.txt", self.edges_file)
+        self.calls = 0
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def compute(self):
+        self.calls += 1
+        return {0: 0.5, 1: 0.25, 2: 0.125}
+
+    def test_cache_hit_returns_stored_result(self):
+        params = {"normalized": True}
+        first = cached_centrality(self.edges_file, "betweenness", params, self.compute, self.cache_dir)
+        second = cached_centrality(self.edges_file, "betweenness", params, self.compute, self.cache_dir)
+        self.assertEqual(first, second)
+        self.assertEqual(self.calls, 1)
+
+    def test_parameters_are_part_of_the_key(self):
+        cached_centrality(self.edges_file, "pagerank", {"damping_factor": 0.85}, self.compute, self.cache_dir)
+        cached_centrality(self.edges_file, "pagerank", {"damping_factor": 0.9}, self.compute, self.cache_dir)
+        cached_centrality(self.edges_file, "eigenvector", {"damping_factor": 0.85}, self.compute, self.cache_dir)
+        self.assertEqual(self.calls, 3)
+
+    def test_edge_file_change_invalidates(self):
+        cached_centrality(self.edges_file, "closeness", {}, self.compute, self.cache_dir)
+        with open(self.edges_file, 'a') as file:
+            file.write("\n1 3")
+        cached_centrality(self.edges_file, "closeness", {}, self.compute, self.cache_dir)
+        self.assertEqual(self.calls, 2)
+
+    def test_fingerprint_depends_on_content(self):
+        self.assertEqual(graph_fingerprint(self.edges_file), graph_fingerprint(PATH + "small_graph.txt"))
+        self.assertNotEqual(graph_fingerprint(self.edges_file), graph_fingerprint(PATH + "single_edge.txt"))
+        with self.assertRaises(FileNotFoundError):
+            graph_fingerprint("non_existent_file.txt")
+
+    def test_string_nodes(self):
+        key = cache_key("graph", "closeness")
+        store_cached_centrality(key, {'A': 1.0, 'B': 0.5}, self.cache_dir)
+        self.assertEqual(load_cached_centrality(key, self.cache_dir), {'A': 1.0, 'B': 0.5})
+        self.assertIsNone(load_cached_centrality(cache_key("graph", "pagerank"), self.cache_dir))
+
+    def test_least_recently_used_entries_are_evicted(self):
+        keys = [cache_key("graph", f"measure_{i}") for i in range(3)]
+        for i, key in enumerate(keys):
+            store_cached_centrality(key, {node: float(node) for node in range(100)}, self.cache_dir)
+            os.utime(os.path.join(self.cache_dir, key + ".npz"), (i, i))
+        entry_size = os.path.getsize(os.path.join(self.cache_dir, keys[0] + ".npz"))
+
+        # Reading the oldest entry makes it the most recently used one
+        self.assertIsNotNone(load_cached_centrality(keys[0], self.cache_dir))
+        evicted = evict_cache(self.cache_dir, max_bytes=2 * entry_size)
+        self.assertEqual(evicted, 1)
+        self.assertIsNotNone(load_cached_centrality(keys[0], self.cache_dir))
+        self.assertIsNone(load_cached_centrality(keys[1], self.cache_dir))
+        self.assertIsNotNone(load_cached_centrality(keys[2], self.cache_dir))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Test cases for the compact numeric mode.
+Run with `python -m unittest -v test/test_compact.py` from root directory.
+"""
+import os
+import tempfile
+from unittest import TestCase, main
+import numpy as np
+import networkx as nx
+from compact import compact_page_rank, compact_closeness, compact_betweenness, compact_eigenvector, \
+    accuracy_report, SCORE_DTYPE, COMPACT_RTOL
+from closeness import closeness_centrality
+from utils import create_csr, create_adjacency_matrix
+
+PATH = "test/test_files/"
+
+
+class TestCompact(TestCase):
+    def setUp(self):
+        nx_graph = nx.powerlaw_cluster_graph(150, 3, 0.2, seed=4)
+        nx_graph.add_edge(300, 301)
+        self.graph = {node: list(nx_graph[node]) for node in nx_graph}
+
+    def test_compact_csr(self):
+        nodes, indptr, indices = create_csr(self.graph, compact=True)
+        _, expected_indptr, expected_indices = create_csr(self.graph)
+        self.assertEqual(indptr.dtype, np.int32)
+        self.assertEqual(indices.dtype, np.int32)
+        np.testing.assert_array_equal(indptr, expected_indptr)
+        np.testing.assert_array_equal(indices, expected_indices)
+
+    def test_compact_matrix(self):
+        matrix = create_adjacency_matrix(PATH + "small_graph.txt", dtype=np.uint8)
+        self.assertEqual(matrix.dtype, np.uint8)
+        np.testing.assert_array_equal(matrix, create_adjacency_matrix(PATH + "small_graph.txt"))
+
+    def test_scores_are_float32(self):
+        for function in (compact_page_rank, compact_closeness, compact_betweenness):
+            nodes, scores = function(self.graph)
+            self.assertEqual(nodes, list(self.graph))
+            self.assertEqual(scores.dtype, SCORE_DTYPE)
+
+    def test_accuracy_against_float64(self):
+        with tempfile.TemporaryDirectory() as directory:
+            edges_file = os.path.join(directory, "edges.txt")
+            with open(edges_file, "w") as file:
+                file.writelines(f"{u} {v}\n" for u, neighbors in self.graph.items() for v in neighbors if u < v)
+            report = accuracy_report(self.graph, edges_file)
+        self.assertEqual(set(report), {"pagerank", "closeness", "betweenness", "eigenvector"})
+        for measure, error in report.items():
+            self.assertLess(error, COMPACT_RTOL, measure)
+
+    def test_isolated_and_empty(self):
+        graph = {'A': ['B'], 'B': ['A'], 'C': []}
+        nodes, scores = compact_closeness(graph)
+        expected = closeness_centrality(graph)
+        np.testing.assert_allclose(scores, [expected[node] for node in nodes], rtol=COMPACT_RTOL)
+        nodes, ranks = compact_page_rank({})
+        self.assertEqual((nodes, len(ranks)), ([], 0))
+
+    def test_eigenvector_stats(self):
+        stats = {}
+        nodes, scores = compact_eigenvector(PATH + "small_graph.txt", stats=stats)
+        self.assertEqual(nodes, list(range(5)))
+        self.assertAlmostEqual(float(np.linalg.norm(scores)), 1.0, places=5)
+        self.assertGreater(stats["iterations"], 0)
+
+
+if __name__ == "__main__":
+    main()
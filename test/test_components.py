@@ -0,0 +1,109 @@
+"""
+Unit tests for the connected-component decomposition and per-component centrality.
+Run with `python -m unittest -v test/test_components.py` from root directory.
+"""
+from unittest import TestCase, main
+import numpy as np
+import networkx as nx
+from components import connected_components, component_centrality
+from closeness import closeness_centrality
+from betweenness_centrality import betweenness_centrality
+from eigenvector import eigenvector_centrality
+from utils import create_adjacency_list
+
+PLACES = 5
+PATH = "test/test_files/"
+
+# Triangle with a tail, a path of three nodes, a single edge and an isolated node
+GRAPH = {
+    0: [1, 2],
+    1: [0, 2],
+    2: [0, 1, 3],
+    3: [2],
+    4: [5],
+    5: [4, 6],
+    6: [5],
+    7: [8],
+    8: [7],
+    9: [],
+}
+
+
+class TestConnectedComponents(TestCase):
+    def test_components_sorted_by_size(self):
+        components = connected_components(GRAPH)
+        self.assertEqual([sorted(component) for component in components], [[0, 1, 2, 3], [4, 5, 6], [7, 8], [9]])
+
+    def test_file_graph(self):
+        components = connected_components(create_adjacency_list(PATH + "disconnected_graph.txt"))
+        self.assertEqual(sorted(sorted(component) for component in components), [[0, 1], [2, 3], [4, 5]])
+
+    def test_empty_graph(self):
+        self.assertEqual(connected_components({}), [])
+
+    def test_directed_graph_uses_weak_components(self):
+        components = connected_components({'A': ['B'], 'B': [], 'C': ['B'], 'D': []})
+        self.assertEqual([sorted(component) for component in components], [['A', 'B', 'C'], ['D']])
+
+
+class TestComponentCentrality(TestCase):
+    def assert_scores_equal(self, result, expected):
+        self.assertEqual(list(result), list(expected))
+        for node in expected:
+            self.assertAlmostEqual(result[node], expected[node], places=PLACES)
+
+    def test_closeness_matches_whole_graph(self):
+        self.assert_scores_equal(component_centrality(GRAPH, "closeness"), closeness_centrality(GRAPH))
+
+    def test_closeness_wasserman_faust(self):
+        expected = nx.closeness_centrality(nx.Graph(GRAPH), wf_improved=True)
+        result = component_centrality(GRAPH, "closeness", closeness_normalization="wasserman_faust")
+        for node in expected:
+            self.assertAlmostEqual(result[node], expected[node], places=PLACES)
+
+    def test_closeness_per_component(self):
+        expected = nx.closeness_centrality(nx.Graph(GRAPH), wf_improved=False)
+        result = component_centrality(GRAPH, "closeness", closeness_normalization="component")
+        for node in expected:
+            self.assertAlmostEqual(result[node], expected[node], places=PLACES)
+
+    def test_betweenness_matches_whole_graph(self):
+        for normalized in (True, False):
+            self.assert_scores_equal(component_centrality(GRAPH, "betweenness", normalized=normalized),
+                                     betweenness_centrality(GRAPH, normalized=normalized))
+
+    def test_directed_betweenness(self):
+        graph = {'A': ['B'], 'B': ['C'], 'C': ['D'], 'D': [], 'E': ['F'], 'F': ['G'], 'G': []}
+        self.assert_scores_equal(component_centrality(graph, "betweenness", directed=True),
+                                 betweenness_centrality(graph, directed=True))
+
+    def test_eigenvector_connected_graph(self):
+        graph = {0: [1, 2, 3], 1: [0, 2], 2: [0, 1, 3], 3: [0, 2]}
+        matrix = np.array([[0, 1, 1, 1], [1, 0, 1, 0], [1, 1, 0, 1], [1, 0, 1, 0]])
+        self.assert_scores_equal(component_centrality(graph, "eigenvector"), eigenvector_centrality(matrix))
+
+    def test_eigenvector_disconnected_graph(self):
+        result = component_centrality(GRAPH, "eigenvector")
+        # Every component contributes size / n to the squared norm, except the isolated node
+        self.assertAlmostEqual(np.linalg.norm(list(result.values())), np.sqrt(9 / 10), places=PLACES)
+        self.assertEqual(result[9], 0.0)
+        self.assertAlmostEqual(result[7], result[8], places=PLACES)
+        self.assertGreater(result[5], result[4])
+        self.assertGreater(result[2], result[3])
+
+    def test_parallel_matches_serial(self):
+        for measure in ("closeness", "betweenness", "eigenvector"):
+            self.assert_scores_equal(component_centrality(GRAPH, measure, workers=2),
+                                     component_centrality(GRAPH, measure))
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            component_centrality(GRAPH, "pagerank")
+        with self.assertRaises(ValueError):
+            component_centrality(GRAPH, "closeness", closeness_normalization="unknown")
+        with self.assertRaises(TypeError):
+            component_centrality([], "closeness")
+
+
+if __name__ == "__main__":
+    main()
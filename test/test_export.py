@@ -0,0 +1,78 @@
+"""
+Unit tests for the centrality export functions.
+Run with `python -m unittest -v test/test_export.py` from root directory.
+"""
+import os
+import tempfile
+from unittest import TestCase, main
+import numpy as np
+from export import export_centrality, load_centrality
+
+PLACES = 12
+
+
+class TestExportCentrality(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.centralities = {
+            "closeness": {0: 0.5, 1: 0.25, 2: 0.75},
+            "pagerank": {0: 0.2, 1: 0.3, 2: 0.5},
+        }
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def path(self, name):
+        return os.path.join(self.directory.name, name)
+
+    def test_npy_round_trip(self):
+        path = export_centrality(self.centralities, self.path("scores.npy"), metadata={"data_file": "x.txt"})
+        columns, metadata = load_centrality(path)
+        np.testing.assert_array_equal(columns["node"], [0, 1, 2])
+        np.testing.assert_array_almost_equal(columns["closeness"], [0.5, 0.25, 0.75], decimal=PLACES)
+        np.testing.assert_array_almost_equal(columns["pagerank"], [0.2, 0.3, 0.5], decimal=PLACES)
+        self.assertEqual(metadata["measures"], ["closeness", "pagerank"])
+        self.assertEqual(metadata["num_nodes"], 3)
+        self.assertEqual(metadata["data_file"], "x.txt")
+
+    def test_csv_round_trip(self):
+        path = export_centrality(self.centralities, self.path("scores.csv"))
+        columns, metadata = load_centrality(path)
+        np.testing.assert_array_equal(columns["node"], [0, 1, 2])
+        np.testing.assert_array_almost_equal(columns["pagerank"], [0.2, 0.3, 0.5], decimal=PLACES)
+        self.assertEqual(metadata["num_nodes"], 3)
+
+    def test_chunked_write_matches_single_chunk(self):
+        scores = {"betweenness": {node: node / 7 for node in range(23)}}
+        chunked, _ = load_centrality(export_centrality(scores, self.path("chunked.npy"), chunk_size=5))
+        single, _ = load_centrality(export_centrality(scores, self.path("single.npy")))
+        np.testing.assert_array_equal(chunked["node"], single["node"])
+        np.testing.assert_array_equal(chunked["betweenness"], single["betweenness"])
+
+    def test_string_nodes_and_missing_scores(self):
+        centralities = {
+            "closeness": {'A': 1.0, 'B': 0.5},
+            "eigenvector": {'B': 0.7, 'C': 0.1},
+        }
+        columns, _ = load_centrality(export_centrality(centralities, self.path("scores.npy")))
+        self.assertEqual(list(columns["node"]), ['A', 'B', 'C'])
+        self.assertTrue(np.isnan(columns["closeness"][2]))
+        self.assertTrue(np.isnan(columns["eigenvector"][0]))
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            export_centrality(self.centralities, self.path("scores.txt"))
+        with self.assertRaises(ValueError):
+            export_centrality({}, self.path("scores.npy"))
+        with self.assertRaises(ValueError):
+            export_centrality(self.centralities, self.path("scores.npy"), chunk_size=0)
+        with self.assertRaises(TypeError):
+            export_centrality([("closeness", {})], self.path("scores.npy"))
+
+    def test_file_not_found(self):
+        with self.assertRaises(FileNotFoundError):
+            load_centrality(self.path("missing.npy"))
+
+
+if __name__ == "__main__":
+    main()
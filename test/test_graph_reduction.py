@@ -0,0 +1,102 @@
+"""
+Test cases for the graph reduction preprocessing of betweenness centrality.
+Run with `python -m unittest -v test/test_graph_reduction.py` from root directory.
+"""
+from unittest import TestCase, main
+import networkx as nx
+from graph_reduction import reduced_betweenness_centrality, simple_neighbors, \
+    fold_degree_one_nodes, merge_identical_nodes
+from betweenness_centrality import betweenness_centrality
+
+PLACES = 9
+
+
+class TestGraphReduction(TestCase):
+    def assert_matches_networkx(self, graph):
+        nx_graph = nx.Graph(graph)
+        for normalized in (True, False):
+            expected = nx.betweenness_centrality(nx_graph, normalized=normalized)
+            result = reduced_betweenness_centrality(graph, normalized=normalized)
+            for node in expected:
+                self.assertAlmostEqual(result[node], expected[node], places=PLACES)
+
+    def test_fold_tree(self):
+        """
+        A -- B -- C
+             |
+             D -- E
+        The whole tree folds into a single node.
+        """
+        neighbors = simple_neighbors({'A': ['B'], 'B': ['A', 'C', 'D'], 'C': ['B'], 'D': ['B', 'E'], 'E': ['D']})
+        weight, _, folded = fold_degree_one_nodes(neighbors)
+        remaining = set(neighbors) - folded
+        self.assertEqual(len(remaining), 1)
+        self.assertEqual(weight[remaining.pop()], 5)
+
+    def test_tree(self):
+        graph = {'A': ['B'], 'B': ['A', 'C', 'D'], 'C': ['B'], 'D': ['B', 'E'], 'E': ['D']}
+        self.assert_matches_networkx(graph)
+
+    def test_cycle_with_pendant_trees(self):
+        """
+        A -- B -- C -- D -- A, with E -- F hanging from A and G hanging from C
+        """
+        graph = {
+            'A': ['B', 'D', 'E'],
+            'B': ['A', 'C'],
+            'C': ['B', 'D', 'G'],
+            'D': ['C', 'A'],
+            'E': ['A', 'F'],
+            'F': ['E'],
+            'G': ['C']
+        }
+        self.assert_matches_networkx(graph)
+
+    def test_merge_identical_nodes(self):
+        """
+        Complete bipartite graph K(2, 3): both sides are non-adjacent twin classes.
+        """
+        graph = {0: [2, 3, 4], 1: [2, 3, 4], 2: [0, 1], 3: [0, 1], 4: [0, 1]}
+        neighbors = simple_neighbors(graph)
+        weight, _, _ = fold_degree_one_nodes(neighbors)
+        multiplicity, representative, open_twins = merge_identical_nodes(neighbors, weight)
+        self.assertEqual(sorted(multiplicity.values()), [2, 3])
+        self.assertEqual(len(open_twins), 2)
+        self.assertEqual(representative[1], representative[0])
+        self.assert_matches_networkx(graph)
+
+    def test_adjacent_twins(self):
+        """
+        Two triangles sharing node C; A and B (and D and E) have the same closed neighborhood.
+        """
+        graph = {'A': ['B', 'C'], 'B': ['A', 'C'], 'C': ['A', 'B', 'D', 'E'], 'D': ['C', 'E'], 'E': ['C', 'D']}
+        self.assert_matches_networkx(graph)
+
+    def test_random_graphs_with_trees_and_twins(self):
+        for seed in range(20):
+            nx_graph = nx.gnp_random_graph(15, 0.2, seed=seed)
+            nx_graph.add_edges_from([(0, 100), (100, 101), (100, 102), (5, 103)])
+            nx_graph.add_edges_from((200, neighbor) for neighbor in list(nx_graph[1]))
+            graph = {node: list(nx_graph[node]) for node in nx_graph}
+            expected = betweenness_centrality(graph)
+            result = reduced_betweenness_centrality(graph)
+            for node in expected:
+                self.assertAlmostEqual(result[node], expected[node], places=PLACES)
+
+    def test_without_twin_merging(self):
+        graph = {0: [2, 3, 4], 1: [2, 3, 4], 2: [0, 1, 5], 3: [0, 1], 4: [0, 1], 5: [2]}
+        expected = betweenness_centrality(graph)
+        result = reduced_betweenness_centrality(graph, merge_twins=False)
+        for node in expected:
+            self.assertAlmostEqual(result[node], expected[node], places=PLACES)
+
+    def test_disconnected_graph_and_self_loops(self):
+        graph = {0: [0, 1], 1: [0, 2], 2: [1], 3: [4], 4: [3], 5: []}
+        expected = nx.betweenness_centrality(nx.Graph(graph), normalized=True)
+        result = reduced_betweenness_centrality(graph)
+        for node in expected:
+            self.assertAlmostEqual(result[node], expected[node], places=PLACES)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Test cases for the HyperBall approximate closeness and harmonic centrality.
+Run with `python -m unittest -v test/test_hyperball.py` from root directory.
+"""
+from unittest import TestCase, main
+import numpy as np
+import networkx as nx
+from hyperball import hyperball, initial_counters, estimate_counts, \
+    approximate_closeness_centrality, approximate_harmonic_centrality
+from closeness import closeness_centrality
+from utils import create_csr
+
+RELATIVE_ERROR = 0.1
+
+
+class TestHyperBall(TestCase):
+    def assert_close(self, result, expected):
+        for node in expected:
+            self.assertLessEqual(abs(result[node] - expected[node]), RELATIVE_ERROR * expected[node] + 1e-12)
+
+    def test_estimate_counts(self):
+        counters = initial_counters(5000, registers=256)
+        self.assertEqual(counters.dtype, np.uint8)
+        np.testing.assert_allclose(estimate_counts(counters[:3]), 1.0, rtol=0.01)
+        merged = counters.max(axis=0, keepdims=True)
+        self.assertAlmostEqual(estimate_counts(merged)[0] / 5000, 1.0, delta=0.15)
+
+    def test_path_graph(self):
+        """
+        A -- B -- C -- D -- E
+        """
+        graph = {'A': ['B'], 'B': ['A', 'C'], 'C': ['B', 'D'], 'D': ['C', 'E'], 'E': ['D']}
+        stats = {}
+        result = approximate_closeness_centrality(graph, registers=1024, stats=stats)
+        self.assertEqual(stats["iterations"], 4)
+        self.assert_close(result, closeness_centrality(graph))
+        self.assert_close(approximate_harmonic_centrality(graph, registers=1024),
+                          nx.harmonic_centrality(nx.Graph(graph)))
+
+    def test_random_graph(self):
+        nx_graph = nx.gnp_random_graph(300, 0.02, seed=6)
+        graph = {node: list(nx_graph[node]) for node in nx_graph}
+        expected = closeness_centrality(graph)
+        result = approximate_closeness_centrality(graph, registers=256)
+        errors = [abs(result[node] - expected[node]) / expected[node] for node in graph if expected[node] > 0]
+        self.assertLess(np.mean(errors), 0.05)
+
+    def test_directed_and_isolated_nodes(self):
+        graph = {0: [1], 1: [2], 2: [], 3: []}
+        distance_sums, reachable, harmonic_sums = hyperball(*create_csr(graph)[1:], registers=1024)
+        np.testing.assert_allclose(reachable, [2, 1, 0, 0], atol=0.05)
+        np.testing.assert_allclose(distance_sums, [3, 1, 0, 0], atol=0.1)
+        np.testing.assert_allclose(harmonic_sums, [1.5, 1, 0, 0], atol=0.05)
+        self.assertEqual(approximate_closeness_centrality(graph)[3], 0.0)
+
+    def test_max_iterations(self):
+        graph = {i: [j for j in (i - 1, i + 1) if 0 <= j < 10] for i in range(10)}
+        stats = {}
+        hyperball(*create_csr(graph)[1:], max_iterations=3, stats=stats)
+        self.assertEqual(stats["iterations"], 3)
+
+    def test_invalid_registers(self):
+        _, indptr, indices = create_csr({0: [1], 1: [0]})
+        for registers in (8, 100, 1 << 17):
+            with self.assertRaises(ValueError):
+                hyperball(indptr, indices, registers=registers)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Test cases for the incremental closeness centrality under edge insertions.
+Run with `python -m unittest -v test/test_incremental_closeness.py` from root directory.
+"""
+import random
+from unittest import TestCase, main
+import networkx as nx
+from incremental_closeness import IncrementalCloseness
+from closeness import closeness_centrality
+
+PLACES = 10
+
+
+class TestIncrementalCloseness(TestCase):
+    def assert_matches_recomputation(self, incremental):
+        expected = closeness_centrality(incremental.graph, backend="python")
+        result = incremental.centrality()
+        self.assertEqual(set(result), set(expected))
+        for node in expected:
+            self.assertAlmostEqual(result[node], expected[node], places=PLACES)
+
+    def test_path_shortcut(self):
+        """
+        Closing the path A -- B -- C -- D -- E into a cycle changes the sums of A, B, D and E only.
+        """
+        graph = {'A': ['B'], 'B': ['A', 'C'], 'C': ['B', 'D'], 'D': ['C', 'E'], 'E': ['D']}
+        incremental = IncrementalCloseness(graph)
+        self.assertEqual(incremental.add_edge('A', 'E'), {'A', 'B', 'D', 'E'})
+        self.assertEqual(incremental.stats["skipped"], 1)
+        self.assertEqual(graph['A'], ['B'])
+        self.assert_matches_recomputation(incremental)
+
+    def test_random_insertions(self):
+        nx_graph = nx.gnp_random_graph(80, 0.03, seed=11)
+        graph = {node: list(nx_graph[node]) for node in nx_graph}
+        incremental = IncrementalCloseness(graph)
+        rng = random.Random(4)
+        for _ in range(60):
+            incremental.add_edge(rng.randrange(90), rng.randrange(90))  # includes new nodes and self-loops
+            self.assert_matches_recomputation(incremental)
+        self.assertGreater(incremental.stats["merges"], 0)
+        self.assertGreater(incremental.stats["skipped"], 0)
+
+    def test_components_and_duplicates(self):
+        incremental = IncrementalCloseness({0: [1], 1: [0], 2: [3], 3: [2], 4: []})
+        self.assertEqual(incremental.add_edges([(1, 2), (3, 4)]), {0, 1, 2, 3, 4})
+        self.assertEqual(incremental.stats["merges"], 2)
+        self.assertEqual(incremental.add_edge(2, 1), set())
+        self.assertEqual(incremental.add_edge(0, 0), set())
+        self.assertEqual(incremental.graph[1], [0, 2])
+        self.assertEqual(incremental.distance_sums[0], 10)
+        self.assert_matches_recomputation(incremental)
+        self.assertEqual(incremental.top(1)[0][0], 2)
+
+
+if __name__ == "__main__":
+    main()
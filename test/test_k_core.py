@@ -0,0 +1,80 @@
+"""
+Test cases for the k-core decomposition, degree centrality and the prefilter.
+Run with `python -m unittest -v test/test_k_core.py` from root directory.
+"""
+from unittest import TestCase, main
+import networkx as nx
+from k_core import core_numbers, degree_centrality, select_candidates, prefilter_recall, prefiltered_top_k
+from closeness import closeness_centrality
+from betweenness_centrality import betweenness_centrality
+
+PLACES = 9
+
+
+class TestKCore(TestCase):
+    def test_core_numbers(self):
+        """
+        Triangle A, B, C with the path C -- D -- E, and the isolated node F
+        """
+        graph = {'A': ['B', 'C'], 'B': ['A', 'C'], 'C': ['A', 'B', 'D'], 'D': ['C', 'E'], 'E': ['D'], 'F': []}
+        self.assertEqual(core_numbers(graph), {'A': 2, 'B': 2, 'C': 2, 'D': 1, 'E': 1, 'F': 0})
+        self.assertEqual(core_numbers({}), {})
+
+    def test_core_numbers_match_networkx(self):
+        for seed in range(5):
+            nx_graph = nx.powerlaw_cluster_graph(300, 4, 0.3, seed=seed)
+            graph = {node: list(nx_graph[node]) for node in nx_graph}
+            self.assertEqual(core_numbers(graph), nx.core_number(nx_graph))
+
+    def test_self_loops_and_duplicates_ignored(self):
+        graph = {0: [0, 1, 1, 2], 1: [0, 0, 2], 2: [0, 1]}
+        self.assertEqual(core_numbers(graph), {0: 2, 1: 2, 2: 2})
+
+    def test_degree_centrality(self):
+        nx_graph = nx.karate_club_graph()
+        graph = {node: list(nx_graph[node]) for node in nx_graph}
+        expected = nx.degree_centrality(nx_graph)
+        result = degree_centrality(graph)
+        for node in expected:
+            self.assertAlmostEqual(result[node], expected[node], places=PLACES)
+        self.assertEqual(degree_centrality({'A': []}), {'A': 1.0})
+
+    def test_select_candidates(self):
+        scores = {'A': 3, 'B': 2, 'C': 2, 'D': 1, 'E': 0}
+        self.assertEqual(select_candidates(scores, fraction=0.4), ['A', 'B', 'C'])
+        self.assertEqual(select_candidates(scores, min_score=1), ['A', 'B', 'C', 'D'])
+        self.assertEqual(select_candidates(scores, min_score=3, minimum=2), ['A', 'B'])
+        with self.assertRaises(ValueError):
+            select_candidates(scores, fraction=0)
+
+    def test_prefiltered_closeness_is_exact_for_candidates(self):
+        nx_graph = nx.barabasi_albert_graph(300, 3, seed=1)
+        graph = {node: list(nx_graph[node]) for node in nx_graph}
+        expected = closeness_centrality(graph)
+        stats = {}
+        top = prefiltered_top_k(graph, "closeness", k=5, fraction=0.2, reference=expected, stats=stats)
+        self.assertEqual(stats["candidates"], 60)
+        self.assertEqual(stats["recall"], 1.0)
+        self.assertEqual([node for node, _ in top],
+                         [node for node, _ in sorted(expected.items(), key=lambda item: -item[1])[:5]])
+        for node, score in top:
+            self.assertAlmostEqual(score, expected[node], places=PLACES)
+
+    def test_prefiltered_betweenness(self):
+        nx_graph = nx.barabasi_albert_graph(200, 2, seed=3)
+        graph = {node: list(nx_graph[node]) for node in nx_graph}
+        expected = betweenness_centrality(graph)
+        stats = {}
+        top = prefiltered_top_k(graph, "betweenness", k=5, by="core", min_score=2,
+                                reference=expected, stats=stats)
+        self.assertEqual(len(top), 5)
+        self.assertEqual(stats["recall"], prefilter_recall([n for n, s in core_numbers(graph).items() if s >= 2],
+                                                           expected, 5))
+        with self.assertRaises(ValueError):
+            prefiltered_top_k(graph, "pagerank")
+        with self.assertRaises(ValueError):
+            prefiltered_top_k(graph, "closeness", by="eigenvector")
+
+
+if __name__ == "__main__":
+    main()
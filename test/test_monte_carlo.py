@@ -0,0 +1,66 @@
+"""
+Test cases for the Monte Carlo random-walk PageRank.
+Run with `python -m unittest -v test/test_monte_carlo.py` from root directory.
+"""
+from unittest import TestCase, main
+import numpy as np
+import networkx as nx
+from monte_carlo import monte_carlo_page_rank, monte_carlo_top_k, random_walk_visits
+from page_rank import page_rank_centrality
+from utils import create_csr, get_top_centrality
+
+ABSOLUTE_ERROR = 2e-3
+
+
+class TestMonteCarlo(TestCase):
+    def setUp(self):
+        nx_graph = nx.barabasi_albert_graph(300, 2, seed=5)
+        self.graph = {node: list(nx_graph[node]) for node in nx_graph}
+        self.expected = page_rank_centrality(self.graph)
+
+    def test_estimates_close_to_power_iteration(self):
+        result = monte_carlo_page_rank(self.graph, walks_per_round=20, max_rounds=5, stable_rounds=5)
+        self.assertEqual(set(result), set(self.graph))
+        self.assertAlmostEqual(sum(result.values()), 1.0)
+        for node in self.graph:
+            self.assertAlmostEqual(result[node], self.expected[node], delta=ABSOLUTE_ERROR)
+
+    def test_top_k(self):
+        stats = {}
+        top = monte_carlo_top_k(self.graph, k=3, walks_per_round=10, stats=stats)
+        expected = get_top_centrality(self.expected, top_n=3)
+        self.assertEqual(top[0][0], expected[0][0])
+        self.assertGreaterEqual(len({node for node, _ in top} & {node for node, _ in expected}), 2)
+        self.assertGreaterEqual(stats["rounds"], 3)
+        self.assertEqual(stats["walks"], stats["rounds"] * 10 * len(self.graph))
+
+    def test_seeded_and_parallel(self):
+        first = monte_carlo_page_rank(self.graph, max_rounds=4, seed=1)
+        self.assertEqual(first, monte_carlo_page_rank(self.graph, max_rounds=4, seed=1))
+        parallel = monte_carlo_page_rank(self.graph, max_rounds=4, stable_rounds=4, workers=2, seed=1)
+        self.assertEqual(parallel, monte_carlo_page_rank(self.graph, max_rounds=4, stable_rounds=4,
+                                                         workers=2, seed=1))
+        self.assertNotEqual(parallel, first)
+
+    def test_dangling_nodes(self):
+        graph = {'A': ['B'], 'B': ['C'], 'C': []}
+        result = monte_carlo_page_rank(graph, walks_per_round=2000, max_rounds=5, stable_rounds=5)
+        expected = page_rank_centrality(graph)
+        for node in graph:
+            self.assertAlmostEqual(result[node], expected[node], delta=0.01)
+
+    def test_random_walk_visits(self):
+        _, indptr, indices = create_csr({0: [1], 1: [0]})
+        visits, steps = random_walk_visits(indptr, indices, 10, rng=np.random.default_rng(0))
+        self.assertEqual(visits.sum(), 20 + steps)
+
+    def test_invalid_arguments(self):
+        self.assertEqual(monte_carlo_page_rank({}), {})
+        with self.assertRaises(ValueError):
+            monte_carlo_page_rank(self.graph, damping_factor=1.0)
+        with self.assertRaises(ValueError):
+            monte_carlo_page_rank(self.graph, k=0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Test cases for the bit-parallel multi-source BFS.
+Run with `python -m unittest -v test/test_multi_source_bfs.py` from root directory.
+"""
+from unittest import TestCase, main
+import numpy as np
+import networkx as nx
+from multi_source_bfs import multi_source_bfs, transpose_csr, \
+    bit_parallel_closeness_centrality, bit_parallel_harmonic_centrality
+from closeness import closeness_centrality
+from utils import create_csr
+
+PLACES = 10
+
+
+class TestMultiSourceBFS(TestCase):
+    def test_grid_graph(self):
+        """
+        A -- B -- C
+        |    |    |
+        D -- E -- F
+        """
+        graph = {
+            'A': ['B', 'D'],
+            'B': ['A', 'C', 'E'],
+            'C': ['B', 'F'],
+            'D': ['A', 'E'],
+            'E': ['B', 'D', 'F'],
+            'F': ['C', 'E']
+        }
+        result = bit_parallel_closeness_centrality(graph)
+        expected = nx.closeness_centrality(nx.Graph(graph))
+        for node in expected:
+            self.assertAlmostEqual(result[node], expected[node], places=PLACES)
+
+    def test_more_sources_than_one_batch(self):
+        """
+        A 150-node random graph needs three batches of 64 sources with one word per node.
+        """
+        nx_graph = nx.gnp_random_graph(150, 0.03, seed=7)
+        graph = {node: list(nx_graph[node]) for node in nx_graph}
+        expected = closeness_centrality(graph)
+        for words in (1, 2, 3):
+            result = bit_parallel_closeness_centrality(graph, words=words)
+            for node in expected:
+                self.assertAlmostEqual(result[node], expected[node], places=PLACES)
+
+    def test_harmonic_centrality(self):
+        nx_graph = nx.barabasi_albert_graph(100, 2, seed=3)
+        nx_graph.add_edges_from([(200, 201)])
+        graph = {node: list(nx_graph[node]) for node in nx_graph}
+        expected = nx.harmonic_centrality(nx_graph)
+        result = bit_parallel_harmonic_centrality(graph)
+        for node in expected:
+            self.assertAlmostEqual(result[node], expected[node], places=PLACES)
+
+    def test_directed_graph(self):
+        graph = {'A': ['B'], 'B': ['C'], 'C': [], 'D': ['A']}
+        self.assertEqual(bit_parallel_closeness_centrality(graph), closeness_centrality(graph))
+
+    def test_distance_sums(self):
+        # Path 0 - 1 - 2 - 3 with a self-loop on 0 and an isolated node 4
+        nodes, indptr, indices = create_csr({0: [0, 1], 1: [0, 2], 2: [1, 3], 3: [2], 4: []})
+        distance_sums, reachable, harmonic_sums = multi_source_bfs(indptr, indices, [0, 2, 4])
+        np.testing.assert_array_equal(distance_sums, [6, 4, 0])
+        np.testing.assert_array_equal(reachable, [3, 3, 0])
+        np.testing.assert_array_almost_equal(harmonic_sums, [1 + 1 / 2 + 1 / 3, 2.5, 0.0])
+
+    def test_transpose_csr(self):
+        _, indptr, indices = create_csr({0: [1, 2], 1: [2], 2: []})
+        transposed_indptr, transposed_indices = transpose_csr(indptr, indices)
+        np.testing.assert_array_equal(transposed_indptr, [0, 0, 1, 3])
+        np.testing.assert_array_equal(transposed_indices, [0, 0, 1])
+
+    def test_empty_graph(self):
+        self.assertEqual(bit_parallel_closeness_centrality({}), {})
+
+    def test_invalid_words(self):
+        with self.assertRaises(ValueError):
+            bit_parallel_closeness_centrality({'A': ['B'], 'B': ['A']}, words=0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Test cases for the out-of-core PageRank over edge shards.
+Run with `python -m unittest -v test/test_out_of_core.py` from root directory.
+"""
+import os
+import tempfile
+from unittest import TestCase, main
+import numpy as np
+import networkx as nx
+from out_of_core import shard_edge_file, out_of_core_page_rank, out_of_core_page_rank_centrality
+from page_rank import page_rank_centrality
+from utils import create_adjacency_list
+
+PATH = "test/test_files/"
+PLACES = 10
+
+
+class TestOutOfCore(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.edges_file = os.path.join(self.directory.name, "edges.txt")
+        nx_graph = nx.barabasi_albert_graph(200, 3, seed=1)
+        edges = list(nx_graph.edges()) + [(500, 501), (7, 7), (3, 4)]
+        with open(self.edges_file, "w") as file:
+            file.writelines(f"{u} {v}\n" for u, v in edges)
+        self.shard_dir = os.path.join(self.directory.name, "shards")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def assert_matches_page_rank(self, edges_file, result):
+        expected = page_rank_centrality(create_adjacency_list(edges_file))
+        self.assertEqual(set(result), set(expected))
+        for node in expected:
+            self.assertAlmostEqual(result[node], expected[node], places=PLACES)
+
+    def test_shards(self):
+        metadata = shard_edge_file(self.edges_file, self.shard_dir, shard_size=100)
+        graph = create_adjacency_list(self.edges_file)
+        self.assertEqual(len(metadata["shards"]), 6)
+        self.assertEqual(metadata["num_nodes"], len(graph))
+        self.assertEqual(metadata["num_ids"], 502)
+        self.assertEqual(metadata["num_edges"], sum(len(neighbors) for neighbors in graph.values()))
+        for name in metadata["shards"]:
+            sources, targets = np.load(os.path.join(self.shard_dir, name))
+            self.assertTrue(np.all(np.diff(targets) >= 0))
+
+    def test_matches_in_memory_page_rank(self):
+        for shard_size in (1, 64, 10_000):
+            result = out_of_core_page_rank_centrality(self.edges_file, self.shard_dir, shard_size=shard_size)
+            self.assert_matches_page_rank(self.edges_file, result)
+
+    def test_memory_mapped_ranks(self):
+        shard_edge_file(self.edges_file, self.shard_dir, shard_size=50)
+        stats = {}
+        node_ids, ranks = out_of_core_page_rank(self.shard_dir, rank_dir=os.path.join(self.directory.name, "ranks"),
+                                                stats=stats)
+        self.assert_matches_page_rank(self.edges_file, dict(zip(node_ids.tolist(), ranks.tolist())))
+        self.assertAlmostEqual(ranks.sum(), 1.0, places=PLACES)
+        self.assertLess(stats["residual"], 1e-06)
+
+    def test_small_files(self):
+        for name in ("small_graph.txt", "self_loop.txt", "disconnected_graph.txt"):
+            result = out_of_core_page_rank_centrality(PATH + name, os.path.join(self.shard_dir, name))
+            self.assert_matches_page_rank(PATH + name, result)
+        self.assertEqual(out_of_core_page_rank_centrality(PATH + "empty_graph.txt", self.shard_dir), {})
+
+    def test_duplicate_edges(self):
+        for shard_size in (1, 2, 100):
+            shard_dir = os.path.join(self.shard_dir, str(shard_size))
+            metadata = shard_edge_file(PATH + "duplicate_edges.txt", shard_dir, shard_size=shard_size)
+            self.assertEqual(metadata["duplicate_edges"], 3)
+            self.assertEqual(metadata["num_edges"], 5)
+            node_ids, ranks = out_of_core_page_rank(shard_dir)
+            self.assert_matches_page_rank(PATH + "duplicate_edges.txt", dict(zip(node_ids.tolist(), ranks.tolist())))
+        result = out_of_core_page_rank_centrality(PATH + "duplicate_edges.txt", self.shard_dir, deduplicate=False)
+        expected = page_rank_centrality(create_adjacency_list(PATH + "duplicate_edges.txt", deduplicate=False))
+        for node in expected:
+            self.assertAlmostEqual(result[node], expected[node], places=PLACES)
+
+    def test_invalid_input(self):
+        with self.assertRaises(ValueError):
+            out_of_core_page_rank_centrality(PATH + "invalid_line.txt", self.shard_dir)
+        with self.assertRaises(FileNotFoundError):
+            shard_edge_file(PATH + "missing.txt", self.shard_dir)
+        shard_edge_file(self.edges_file, self.shard_dir)
+        with self.assertRaises(ValueError):
+            out_of_core_page_rank(self.shard_dir, damping_factor=1.5)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Unit tests for the phase profiler and the iteration statistics of the centrality functions.
+Run with `python -m unittest -v test/test_profiling.py` from root directory.
+"""
+import os
+import json
+import tempfile
+from contextlib import contextmanager
+from unittest import TestCase, main
+import numpy as np
+from profiling import PhaseProfiler
+from page_rank import page_rank_centrality
+from eigenvector import eigenvector_centrality
+from closeness import closeness_centrality
+from betweenness_centrality import betweenness_centrality
+
+GRAPH = {
+    'A': ['B', 'C'],
+    'B': ['A', 'C'],
+    'C': ['A', 'B', 'D'],
+    'D': ['C']
+}
+
+
+class TestPhaseProfiler(TestCase):
+    def test_phases_are_recorded_in_order(self):
+        profiler = PhaseProfiler()
+        with profiler.phase("load"):
+            pass
+        with profiler.phase("pagerank") as stats:
+            page_rank_centrality(GRAPH, stats=stats)
+        report = profiler.report()
+        self.assertEqual([record["phase"] for record in report["phases"]], ["load", "pagerank"])
+        for record in report["phases"]:
+            self.assertGreaterEqual(record["wall_time"], 0)
+            self.assertGreaterEqual(record["cpu_time"], 0)
+        self.assertGreater(report["phases"][1]["counters"]["iterations"], 0)
+
+    def test_phase_is_recorded_on_error(self):
+        profiler = PhaseProfiler()
+        with self.assertRaises(ValueError):
+            with profiler.phase("failing"):
+                raise ValueError("boom")
+        self.assertEqual(profiler.phases[0]["phase"], "failing")
+
+    def test_sources_per_second(self):
+        profiler = PhaseProfiler()
+        with profiler.phase("closeness") as stats:
+            closeness_centrality(GRAPH, stats=stats)
+        counters = profiler.phases[0]["counters"]
+        self.assertEqual(counters["sources"], 4)
+        self.assertGreater(counters["sources_per_second"], 0)
+
+    def test_cprofile_and_hook(self):
+        entered = []
+
+        @contextmanager
+        def hook(name):
+            entered.append(name)
+            yield
+
+        with tempfile.TemporaryDirectory() as directory:
+            profiler = PhaseProfiler(cprofile_dir=directory, profile_hook=hook)
+            with profiler.phase("betweenness") as stats:
+                betweenness_centrality(GRAPH, stats=stats)
+            self.assertTrue(os.path.exists(profiler.phases[0]["profile"]))
+
+            report_path = os.path.join(directory, "profile.json")
+            profiler.save_report(report_path)
+            with open(report_path) as file:
+                report = json.load(file)
+        self.assertEqual(entered, ["betweenness"])
+        self.assertEqual(report["phases"][0]["counters"]["sources"], 4)
+
+    def test_iterative_measures_report_convergence(self):
+        stats = {}
+        page_rank_centrality(GRAPH, convergence_threshold=1e-8, stats=stats)
+        self.assertLess(stats["residual"], 1e-8)
+        self.assertLessEqual(stats["iterations"], 100)
+
+        stats = {}
+        eigenvector_centrality(np.array([[0, 1, 1], [1, 0, 1], [1, 1, 0]]), stats=stats)
+        self.assertLessEqual(stats["residual"], 1e-6)
+        self.assertGreater(stats["iterations"], 0)
+
+
+if __name__ == "__main__":
+    main()
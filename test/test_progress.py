@@ -0,0 +1,120 @@
+"""
+Unit tests for progress reporting and checkpoint/resume of the all-sources loops.
+Run with `python -m unittest -v test/test_progress.py` from root directory.
+"""
+import os
+import io
+import tempfile
+from contextlib import redirect_stdout
+from unittest import TestCase, main
+from unittest.mock import patch
+import betweenness_centrality as betweenness_module
+import closeness as closeness_module
+from betweenness_centrality import betweenness_centrality
+from closeness import closeness_centrality
+from progress import ProgressReporter, save_checkpoint, load_checkpoint, graph_signature
+
+PLACES = 10
+GRAPH = {
+    'A': ['B', 'D'],
+    'B': ['A', 'C', 'E'],
+    'C': ['B', 'F'],
+    'D': ['A', 'E'],
+    'E': ['B', 'D', 'F'],
+    'F': ['C', 'E']
+}
+
+
+def failing_after(function, calls):
+    """
+    Wrap function so that it raises RuntimeError once it has been called `calls` times.
+    """
+    count = {"calls": 0}
+
+    def wrapper(*args, **kwargs):
+        if count["calls"] == calls:
+            raise RuntimeError("simulated crash")
+        count["calls"] += 1
+        return function(*args, **kwargs)
+    return wrapper
+
+
+class TestCheckpointResume(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.checkpoint_path = os.path.join(self.directory.name, "checkpoint.pkl")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_betweenness_resumes_after_crash(self):
+        expected = betweenness_centrality(GRAPH)
+        crashing_bfs = failing_after(betweenness_module.bfs_shortest_paths, 4)
+        with patch.object(betweenness_module, "bfs_shortest_paths", crashing_bfs):
+            with self.assertRaises(RuntimeError):
+                betweenness_centrality(GRAPH, checkpoint_path=self.checkpoint_path, checkpoint_interval=2)
+
+        state = load_checkpoint(self.checkpoint_path, "betweenness", GRAPH)
+        self.assertEqual(state["completed"], {'A', 'B', 'C', 'D'})
+
+        bfs_calls = failing_after(betweenness_module.bfs_shortest_paths, 2)
+        with patch.object(betweenness_module, "bfs_shortest_paths", bfs_calls):
+            result = betweenness_centrality(GRAPH, checkpoint_path=self.checkpoint_path, checkpoint_interval=2)
+        for node in expected:
+            self.assertAlmostEqual(result[node], expected[node], places=PLACES)
+        self.assertFalse(os.path.exists(self.checkpoint_path))
+
+    def test_closeness_resumes_after_crash(self):
+        expected = closeness_centrality(GRAPH)
+        crashing_deque = failing_after(closeness_module.deque, 3)
+        with patch.object(closeness_module, "deque", crashing_deque):
+            with self.assertRaises(RuntimeError):
+                closeness_centrality(GRAPH, checkpoint_path=self.checkpoint_path, checkpoint_interval=1)
+
+        self.assertEqual(len(load_checkpoint(self.checkpoint_path, "closeness", GRAPH)["accumulator"]), 3)
+        result = closeness_centrality(GRAPH, checkpoint_path=self.checkpoint_path)
+        self.assertEqual(result.keys(), expected.keys())
+        for node in expected:
+            self.assertAlmostEqual(result[node], expected[node], places=PLACES)
+        self.assertFalse(os.path.exists(self.checkpoint_path))
+
+    def test_mismatched_checkpoint_is_rejected(self):
+        save_checkpoint(self.checkpoint_path, {"measure": "closeness", "graph": graph_signature(GRAPH),
+                                               "params": {}, "accumulator": {}})
+        with self.assertRaises(ValueError):
+            betweenness_centrality(GRAPH, checkpoint_path=self.checkpoint_path)
+        with self.assertRaises(ValueError):
+            closeness_centrality({'A': ['B'], 'B': ['A']}, checkpoint_path=self.checkpoint_path)
+
+    def test_checkpoint_of_another_graph_is_rejected(self):
+        # Same number of nodes and edges as GRAPH, but B -- E is replaced by A -- F
+        other = {'A': ['B', 'D', 'F'], 'B': ['A', 'C'], 'C': ['B', 'F'], 'D': ['A', 'E'], 'E': ['D', 'F'],
+                 'F': ['C', 'E', 'A']}
+        self.assertNotEqual(graph_signature(other), graph_signature(GRAPH))
+        save_checkpoint(self.checkpoint_path, {"measure": "closeness", "graph": graph_signature(GRAPH),
+                                               "params": {}, "accumulator": {'A': 1.0}})
+        with self.assertRaises(ValueError):
+            closeness_centrality(other, checkpoint_path=self.checkpoint_path)
+
+    def test_missing_checkpoint(self):
+        self.assertIsNone(load_checkpoint(self.checkpoint_path, "closeness", GRAPH))
+
+
+class TestProgressReporter(TestCase):
+    def test_progress_line(self):
+        output = io.StringIO()
+        with redirect_stdout(output):
+            reporter = ProgressReporter(10, "Closeness", interval=0.0)
+            reporter.update(5)
+        self.assertIn("Closeness: 5/10 (50.0%)", output.getvalue())
+        self.assertIn("ETA", output.getvalue())
+
+    def test_progress_flag_prints(self):
+        output = io.StringIO()
+        with redirect_stdout(output):
+            betweenness_centrality(GRAPH, progress=True)
+        self.assertIn("Betweenness: 6/6 (100.0%)", output.getvalue())
+
+
+if __name__ == "__main__":
+    main()
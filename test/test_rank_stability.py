@@ -0,0 +1,60 @@
+"""
+Test cases for the top-k rank-stability stopping rule of PageRank.
+Run with `python -m unittest -v test/test_rank_stability.py` from root directory.
+"""
+from unittest import TestCase, main
+import numpy as np
+import networkx as nx
+from rank_stability import top_indices, TopKStopping
+from page_rank import page_rank_centrality
+from utils import get_top_centrality
+
+TOP_K = 5
+THRESHOLD = 1e-12
+
+
+class TestRankStability(TestCase):
+    def setUp(self):
+        nx_graph = nx.barabasi_albert_graph(300, 3, seed=8)
+        self.graph = {node: list(nx_graph[node]) for node in nx_graph}
+
+    def test_top_indices(self):
+        scores = np.array([0.1, 0.5, 0.3, 0.5, 0.3, 0.0])
+        self.assertEqual(top_indices(scores, 3).tolist(), [1, 3, 2])
+        self.assertEqual(top_indices(scores, 4).tolist(), [1, 3, 2, 4])
+        self.assertEqual(top_indices(scores, 10).tolist(), [1, 3, 2, 4, 0, 5])
+
+    def test_stopping_rule(self):
+        stopping = TopKStopping(2, stable_iterations=2)
+        scores = np.array([0.5, 0.3, 0.2])
+        self.assertFalse(stopping.update(scores, 0.01, 0.1))
+        self.assertFalse(stopping.update(scores, 0.01, 0.05))
+        self.assertFalse(stopping.update(scores, 0.06, 0.025))  # gaps of 0.1 do not exceed twice the bound
+        self.assertTrue(stopping.update(scores, 0.01, 0.0125))
+        self.assertEqual(stopping.iterations_saved(1e-3, 4, 100), 4)
+        self.assertEqual(stopping.iterations_saved(1e-3, 98, 100), 2)
+        for k, stable_iterations in ((0, 1), (2, 0), (1.5, 1)):
+            with self.assertRaises(ValueError):
+                TopKStopping(k, stable_iterations)
+
+    def test_page_rank(self):
+        expected_stats, stats = {}, {}
+        expected = page_rank_centrality(self.graph, convergence_threshold=THRESHOLD, max_iterations=1000,
+                                        stats=expected_stats)
+        result = page_rank_centrality(self.graph, convergence_threshold=THRESHOLD, max_iterations=1000,
+                                      stats=stats, top_k=TOP_K)
+        self.assertTrue(stats["stopped_early"])
+        self.assertLess(stats["iterations"], expected_stats["iterations"])
+        self.assertGreater(stats["iterations_saved"], 0)
+        self.assertEqual([node for node, _ in get_top_centrality(result, TOP_K)],
+                         [node for node, _ in get_top_centrality(expected, TOP_K)])
+
+    def test_converged_before_stable(self):
+        stats = {}
+        page_rank_centrality({0: [1], 1: [0]}, stats=stats, top_k=1)
+        self.assertFalse(stats["stopped_early"])
+        self.assertEqual(stats["iterations_saved"], 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Test cases for the cache-friendly node reordering.
+Run with `python -m unittest -v test/test_reorder.py` from root directory.
+"""
+from unittest import TestCase, main
+import networkx as nx
+from reorder import node_order, reorder_graph, restore_labels, load_reordered, reordered_centrality, ORDERINGS
+from closeness import closeness_centrality
+from page_rank import page_rank_centrality
+from betweenness_centrality import betweenness_centrality
+from utils import create_adjacency_list
+
+PATH = "test/test_files/"
+PLACES = 10
+
+
+def bandwidth(graph: dict) -> int:
+    return max((abs(u - v) for u, neighbors in graph.items() for v in neighbors), default=0)
+
+
+class TestReorder(TestCase):
+    def setUp(self):
+        nx_graph = nx.relabel_nodes(nx.grid_2d_graph(12, 12), lambda node: node[0] * 1000 + node[1] * 7)
+        nx_graph.add_edge(90000, 90001)
+        nx_graph.add_node(99999)
+        # Shuffle the insertion order so the original labels are far from a good ordering
+        nodes = sorted(nx_graph, key=lambda node: (node * 7919) % 104729)
+        self.graph = {node: list(nx_graph[node]) for node in nodes}
+
+    def test_orders_are_permutations(self):
+        for method in ORDERINGS:
+            order = node_order(self.graph, method)
+            self.assertEqual(sorted(order), sorted(self.graph), method)
+        self.assertEqual(node_order({}, "rcm"), [])
+        with self.assertRaises(ValueError):
+            node_order(self.graph, "random")
+
+    def test_degree_order(self):
+        order = node_order(self.graph, "degree")
+        degrees = [len(self.graph[node]) for node in order]
+        self.assertEqual(degrees, sorted(degrees, reverse=True))
+
+    def test_rcm_reduces_bandwidth(self):
+        identity, _ = reorder_graph(self.graph, "degree")
+        relabeled, order = reorder_graph(self.graph, "rcm")
+        self.assertEqual(list(relabeled), list(range(len(self.graph))))
+        self.assertLessEqual(bandwidth(relabeled), 2 * 12)
+        self.assertLess(bandwidth(relabeled), bandwidth(identity))
+
+    def test_community_order_is_contiguous(self):
+        """
+        Two cliques joined by one edge end up in two contiguous id ranges.
+        """
+        nx_graph = nx.barbell_graph(8, 0)
+        nodes = sorted(nx_graph, key=lambda node: (node * 5) % 16)
+        graph = {node: list(nx_graph[node]) for node in nodes}
+        order = node_order(graph, "community")
+        self.assertEqual({frozenset(order[:8]), frozenset(order[8:])},
+                         {frozenset(range(8)), frozenset(range(8, 16))})
+
+    def test_scores_mapped_back(self):
+        measures = [closeness_centrality, page_rank_centrality, betweenness_centrality]
+        for method in ORDERINGS:
+            for function in measures:
+                expected = function(self.graph)
+                result = reordered_centrality(function, self.graph, method)
+                self.assertEqual(set(result), set(expected))
+                for node in expected:
+                    self.assertAlmostEqual(result[node], expected[node], places=PLACES)
+
+    def test_restore_labels(self):
+        relabeled, order = reorder_graph({'A': ['B'], 'B': ['A', 'C'], 'C': ['B']}, "degree")
+        self.assertEqual(order[0], 'B')
+        self.assertEqual(relabeled[0], [1, 2])
+        self.assertEqual(restore_labels({0: 2.0, 1: 1.0, 2: 1.0}, order), {'B': 2.0, 'A': 1.0, 'C': 1.0})
+
+    def test_load_reordered(self):
+        graph = create_adjacency_list(PATH + "small_graph.txt")
+        relabeled, order = load_reordered(PATH + "small_graph.txt", "rcm")
+        self.assertEqual(sorted(order), sorted(graph))
+        self.assertEqual(restore_labels(closeness_centrality(relabeled), order), closeness_centrality(graph))
+
+
+if __name__ == "__main__":
+    main()
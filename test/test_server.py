@@ -0,0 +1,136 @@
+"""
+Test cases for the local query server, run on localhost.
+Run with `python -m unittest -v test/test_server.py` from root directory.
+"""
+import os
+import json
+import asyncio
+import tempfile
+from unittest import IsolatedAsyncioTestCase, main
+from server import CentralityServer, compute_measure
+from page_rank import page_rank_centrality
+from closeness import closeness_centrality
+
+PATH = "test/test_files/"
+PLACES = 10
+JOB_TIMEOUT = 30
+
+
+class TestServer(IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.graph = {
+            0: [1, 3],
+            1: [0, 2, 4],
+            2: [1, 5],
+            3: [0, 4],
+            4: [1, 3, 5],
+            5: [2, 4],
+        }
+        self.server = await CentralityServer(graph={node: list(neighbors) for node, neighbors in self.graph.items()},
+                                             workers=1, cache_dir=None).start(port=0)
+
+    async def asyncTearDown(self):
+        await self.server.close()
+
+    async def request(self, method: str, target: str, body: dict=None):
+        reader, writer = await asyncio.open_connection("127.0.0.1", self.server.port)
+        content = json.dumps(body).encode() if body is not None else b""
+        writer.write(f"{method} {target} HTTP/1.1\r\nHost: localhost\r\n"
+                     f"Content-Length: {len(content)}\r\n\r\n".encode() + content)
+        await writer.drain()
+        response = await reader.read()
+        writer.close()
+        head, _, payload = response.partition(b"\r\n\r\n")
+        return int(head.split()[1]), json.loads(payload)
+
+    async def compute(self, measure: str):
+        status, payload = await self.request("POST", f"/jobs?measure={measure}")
+        self.assertIn(status, (200, 202))
+        await asyncio.wait_for(self.server.jobs[measure], JOB_TIMEOUT)
+
+    async def test_health(self):
+        status, payload = await self.request("GET", "/health")
+        self.assertEqual(status, 200)
+        self.assertEqual(payload, {"nodes": 6, "version": 0})
+
+    async def test_score_and_top(self):
+        status, payload = await self.request("GET", "/score?measure=pagerank&node=0")
+        self.assertEqual(status, 409)
+        await self.compute("pagerank")
+
+        expected = page_rank_centrality(self.graph)
+        status, payload = await self.request("GET", "/score?measure=pagerank&node=4")
+        self.assertEqual(status, 200)
+        self.assertEqual(payload["node"], 4)
+        self.assertAlmostEqual(payload["score"], expected[4], places=PLACES)
+
+        status, payload = await self.request("GET", "/top?measure=pagerank&k=2")
+        self.assertEqual(status, 200)
+        self.assertEqual([node for node, _ in payload["top"]], [1, 4])
+
+        status, payload = await self.request("GET", "/jobs")
+        self.assertEqual(payload["pagerank"], "done")
+        self.assertEqual(payload["closeness"], "idle")
+
+    async def test_queries_answered_while_job_runs(self):
+        self.server.submit("betweenness")
+        status, payload = await self.request("GET", "/health")
+        self.assertEqual(status, 200)
+        await asyncio.wait_for(self.server.jobs["betweenness"], JOB_TIMEOUT)
+        self.assertEqual(self.server.job_status("betweenness"), "done")
+
+    async def test_edge_updates_invalidate_results(self):
+        await self.compute("closeness")
+        status, payload = await self.request("POST", "/edges", {"add": [[0, 5], [5, 6]], "remove": [[1, 2]]})
+        self.assertEqual(status, 200)
+        self.assertEqual(payload, {"added": 2, "removed": 1, "version": 1})
+        self.assertIn(6, self.server.graph)
+        self.assertNotIn(2, self.server.graph[1])
+        status, _ = await self.request("GET", "/top?measure=closeness")
+        self.assertEqual(status, 409)
+
+        await self.compute("closeness")
+        expected = closeness_centrality(self.server.graph)
+        status, payload = await self.request("GET", "/score?measure=closeness&node=6")
+        self.assertEqual(payload["version"], 1)
+        self.assertAlmostEqual(payload["score"], expected[6], places=PLACES)
+
+    async def test_errors(self):
+        cases = [
+            ("GET", "/nowhere", None, 404),
+            ("DELETE", "/jobs", None, 405),
+            ("POST", "/jobs?measure=unknown", None, 400),
+            ("GET", "/top?measure=degree&k=zero", None, 409),
+            ("POST", "/edges", [1, 2], 400),
+        ]
+        for method, target, body, expected in cases:
+            status, payload = await self.request(method, target, body)
+            self.assertEqual(status, expected, target)
+            self.assertIn("error", payload)
+        await self.compute("degree")
+        status, _ = await self.request("GET", "/top?measure=degree&k=zero")
+        self.assertEqual(status, 400)
+        status, _ = await self.request("GET", "/score?measure=degree&node=42")
+        self.assertEqual(status, 404)
+
+    async def test_all_measures(self):
+        for measure in ("degree", "core", "eigenvector"):
+            scores = compute_measure(measure, self.graph)
+            self.assertEqual(set(scores), set(self.graph))
+
+
+class TestServerFromFile(IsolatedAsyncioTestCase):
+    async def test_disk_cache(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            server = await CentralityServer(edges_file_path=PATH + "small_graph.txt", workers=1,
+                                            cache_dir=cache_dir).start(port=0)
+            try:
+                server.submit("degree")
+                await asyncio.wait_for(server.jobs["degree"], JOB_TIMEOUT)
+                self.assertEqual(len(os.listdir(cache_dir)), 1)
+            finally:
+                await server.close()
+
+
+if __name__ == "__main__":
+    main()
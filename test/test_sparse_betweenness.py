@@ -0,0 +1,55 @@
+"""
+Test cases for the linear-algebraic multi-source Brandes betweenness.
+Run with `python -m unittest -v test/test_sparse_betweenness.py` from root directory.
+"""
+from unittest import TestCase, main
+import networkx as nx
+from sparse_betweenness import sparse_betweenness_centrality
+from betweenness_centrality import betweenness_centrality
+
+PLACES = 10
+
+
+class TestSparseBetweenness(TestCase):
+    def assert_matches(self, result, expected):
+        self.assertEqual(set(result), set(expected))
+        for node in expected:
+            self.assertAlmostEqual(result[node], expected[node], places=PLACES)
+
+    def test_star_graph(self):
+        graph = {0: [1, 2, 3], 1: [0], 2: [0], 3: [0]}
+        result = sparse_betweenness_centrality(graph, normalized=False)
+        self.assertEqual(result, {0: 3.0, 1: 0.0, 2: 0.0, 3: 0.0})
+
+    def test_matches_brandes(self):
+        nx_graph = nx.gnp_random_graph(120, 0.04, seed=3)
+        graph = {node: list(nx_graph[node]) for node in nx_graph}
+        expected = betweenness_centrality(graph)
+        for block_size in (1, 7, 64, 500):
+            stats = {}
+            self.assert_matches(sparse_betweenness_centrality(graph, block_size=block_size, stats=stats), expected)
+            self.assertEqual(stats["sources"], 120)
+            self.assertEqual(stats["blocks"], -(-120 // block_size))
+        self.assert_matches(sparse_betweenness_centrality(graph, normalized=False),
+                            betweenness_centrality(graph, normalized=False))
+        self.assert_matches(sparse_betweenness_centrality(graph), nx.betweenness_centrality(nx_graph))
+
+    def test_directed_and_parallel_edges(self):
+        nx_graph = nx.gnp_random_graph(60, 0.08, seed=5, directed=True)
+        graph = {node: list(nx_graph[node]) for node in nx_graph}
+        graph[0] += graph[0][:1]  # a parallel edge doubles the paths through it
+        graph[1].append(1)
+        for normalized in (True, False):
+            self.assert_matches(sparse_betweenness_centrality(graph, normalized=normalized, directed=True, block_size=16),
+                                betweenness_centrality(graph, normalized=normalized, directed=True))
+
+    def test_disconnected_and_empty(self):
+        graph = {0: [1], 1: [0, 2], 2: [1], 3: [4], 4: [3], 5: []}
+        self.assert_matches(sparse_betweenness_centrality(graph, block_size=2), betweenness_centrality(graph))
+        self.assertEqual(sparse_betweenness_centrality({}), {})
+        with self.assertRaises(ValueError):
+            sparse_betweenness_centrality(graph, block_size=0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Test cases for the query-subset centrality functions.
+Run with `python -m unittest -v test/test_subset.py` from root directory.
+"""
+from unittest import TestCase, main
+import networkx as nx
+from subset import subset_closeness_centrality, subset_betweenness_centrality, subset_page_rank
+from closeness import closeness_centrality
+from betweenness_centrality import betweenness_centrality
+from page_rank import page_rank_centrality
+
+PLACES = 9
+RELATIVE_ERROR = 1e-3
+GRAPH = {
+    'A': ['B', 'D'],
+    'B': ['A', 'C', 'E'],
+    'C': ['B', 'F'],
+    'D': ['A', 'E'],
+    'E': ['B', 'D', 'F'],
+    'F': ['C', 'E'],
+    'G': []
+}
+
+
+class TestSubset(TestCase):
+    def test_closeness(self):
+        expected = closeness_centrality(GRAPH)
+        result = subset_closeness_centrality(GRAPH, ['E', 'G', 'A'])
+        self.assertEqual(list(result), ['E', 'G', 'A'])
+        for node in result:
+            self.assertAlmostEqual(result[node], expected[node], places=PLACES)
+
+    def test_closeness_random_graph(self):
+        nx_graph = nx.gnp_random_graph(200, 0.02, seed=5)
+        graph = {node: list(nx_graph[node]) for node in nx_graph}
+        query = list(range(0, 200, 3))
+        expected = closeness_centrality(graph)
+        result = subset_closeness_centrality(graph, query)
+        for node in query:
+            self.assertAlmostEqual(result[node], expected[node], places=PLACES)
+
+    def test_unknown_node(self):
+        with self.assertRaises(ValueError):
+            subset_closeness_centrality(GRAPH, ['Z'])
+        with self.assertRaises(ValueError):
+            subset_betweenness_centrality(GRAPH, sources=['A'], targets=['Z'])
+        with self.assertRaises(TypeError):
+            subset_page_rank([], ['A'])
+
+    def test_betweenness_all_nodes(self):
+        for normalized in (True, False):
+            expected = betweenness_centrality(GRAPH, normalized=normalized)
+            result = subset_betweenness_centrality(GRAPH, normalized=normalized)
+            for node in expected:
+                self.assertAlmostEqual(result[node], expected[node], places=PLACES)
+
+    def test_betweenness_matches_networkx(self):
+        for directed in (False, True):
+            nx_graph = nx.gnp_random_graph(40, 0.1, seed=2, directed=directed)
+            graph = {node: list(nx_graph[node]) for node in nx_graph}
+            sources, targets = [0, 3, 7, 11], [1, 2, 3, 20, 30]
+            for normalized in (True, False):
+                expected = nx.betweenness_centrality_subset(nx_graph, sources, targets, normalized=normalized)
+                result = subset_betweenness_centrality(graph, sources, targets, normalized=normalized,
+                                                       directed=directed)
+                for node in expected:
+                    self.assertAlmostEqual(result[node], expected[node], places=PLACES)
+
+    def test_page_rank(self):
+        for directed in (False, True):
+            nx_graph = nx.gnp_random_graph(150, 0.03, seed=4, directed=directed)
+            nx_graph.add_node(150)
+            graph = {node: list(nx_graph[node]) for node in nx_graph}
+            expected = page_rank_centrality(graph, convergence_threshold=1e-12)
+            query = [0, 10, 42, 150]
+            result = subset_page_rank(graph, query, tolerance=1e-6, directed=directed)
+            for node in query:
+                self.assertLess(abs(result[node] - expected[node]), RELATIVE_ERROR * expected[node])
+
+    def test_page_rank_invalid_parameters(self):
+        with self.assertRaises(ValueError):
+            subset_page_rank(GRAPH, ['A'], damping_factor=1.5)
+        with self.assertRaises(ValueError):
+            subset_page_rank(GRAPH, ['A'], tolerance=0)
+
+
+if __name__ == "__main__":
+    main()
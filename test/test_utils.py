@@ -5,7 +5,7 @@ Run with `python -m unittest -v test/test_utils.py` from root directory.
 
 from unittest import TestCase, main
 import numpy as np
-from utils import create_adjacency_list, create_adjacency_matrix, get_top_centrality
+from utils import create_adjacency_list, create_adjacency_matrix, get_top_centrality, create_csr
 
 PATH = "test/test_files/"
 
@@ -56,6 +56,32 @@ class TestGraphConversionFunctions(TestCase):
         }
         self.assertEqual(adjacency_list, expected)
 
+    def test_create_adjacency_list_duplicate_edges(self):
+        stats = {}
+        adjacency_list = create_adjacency_list(PATH + "duplicate_edges.txt", stats=stats)
+        self.assertEqual(adjacency_list, {0: [1], 1: [0, 2], 2: [1, 2]})
+        self.assertEqual(stats, {"lines": 6, "self_loops": 2, "duplicate_edges": 3, "nodes": 3, "edges": 3})
+
+        adjacency_list = create_adjacency_list(PATH + "duplicate_edges.txt", deduplicate=False)
+        self.assertEqual(adjacency_list, {0: [1, 1, 1], 1: [0, 0, 0, 2], 2: [1, 2, 2]})
+
+    def test_create_adjacency_list_self_loop_policy(self):
+        adjacency_list = create_adjacency_list(PATH + "duplicate_edges.txt", self_loops="drop")
+        self.assertEqual(adjacency_list, {0: [1], 1: [0, 2], 2: [1]})
+        self.assertEqual(create_adjacency_list(PATH + "self_loop.txt", self_loops="drop"), {0: [], 1: [2], 2: [1]})
+        with self.assertRaises(ValueError):
+            create_adjacency_list(PATH + "self_loop.txt", self_loops="error")
+        with self.assertRaises(ValueError):
+            create_adjacency_list(PATH + "self_loop.txt", self_loops="ignore")
+
+    def test_adjacency_list_agrees_with_matrix(self):
+        adjacency_list = create_adjacency_list(PATH + "duplicate_edges.txt")
+        adjacency_matrix = create_adjacency_matrix(PATH + "duplicate_edges.txt")
+        for node, neighbors in adjacency_list.items():
+            self.assertEqual(sorted(neighbors), np.flatnonzero(adjacency_matrix[node]).tolist())
+        adjacency_matrix = create_adjacency_matrix(PATH + "self_loop.txt", self_loops="drop")
+        self.assertEqual(np.trace(adjacency_matrix), 0)
+
     def test_create_adjacency_matrix_small_graph(self):
         adjacency_matrix = create_adjacency_matrix(PATH + "small_graph.txt")
         expected = [
@@ -109,11 +135,29 @@ class TestGraphConversionFunctions(TestCase):
             create_adjacency_matrix("non_existent_file.txt")
 
     def test_invalid_line(self):
-        with self.assertRaises(ValueError):
+        with self.assertRaisesRegex(ValueError, "Invalid line in file: 2"):
             create_adjacency_list(PATH + "invalid_line.txt")
         with self.assertRaises(ValueError):
             create_adjacency_matrix(PATH + "invalid_line.txt")
     
+    def test_create_csr_small_graph(self):
+        nodes, indptr, indices = create_csr(create_adjacency_list(PATH + "small_graph.txt"))
+        self.assertEqual(nodes, [0, 1, 2, 3, 4])
+        np.testing.assert_array_equal(indptr, [0, 3, 5, 8, 10, 12])
+        np.testing.assert_array_equal(indices, [1, 2, 4, 0, 2, 0, 1, 3, 2, 4, 3, 0])
+
+    def test_create_csr_string_nodes(self):
+        nodes, indptr, indices = create_csr({'A': ['B'], 'B': [], 'C': ['A', 'B']})
+        self.assertEqual(nodes, ['A', 'B', 'C'])
+        np.testing.assert_array_equal(indptr, [0, 1, 1, 3])
+        np.testing.assert_array_equal(indices, [1, 0, 1])
+
+    def test_create_csr_empty_graph(self):
+        nodes, indptr, indices = create_csr({})
+        self.assertEqual(nodes, [])
+        np.testing.assert_array_equal(indptr, [0])
+        self.assertEqual(len(indices), 0)
+
     def test_get_top_centrality_basic(self):
         """
         Test basic functionality with a small centrality dictionary.
@@ -191,6 +235,19 @@ class TestGraphConversionFunctions(TestCase):
         result = get_top_centrality(centrality_dict, top_n)
         self.assertEqual(result, expected[:top_n])
 
+    def test_moved_plotting_names(self):
+        """
+        Test that the plotting names moved to visualization still resolve through utils.
+        """
+        import utils
+        import visualization
+        self.assertEqual(utils.GARPH_PATH, visualization.GARPH_PATH)
+        self.assertEqual(utils.NODE_SIZE, visualization.NODE_SIZE)
+        self.assertIs(utils.plot_social_network, visualization.plot_social_network)
+        self.assertEqual(utils.COLOR_MAP.name, visualization.COLOR_MAP)
+        with self.assertRaises(AttributeError):
+            utils.MISSING_NAME
+
 
 if __name__ == "__main__":
     main()
@@ -1,71 +1,170 @@
 import numpy as np
-import networkx as nx
-import matplotlib.pyplot as plt
-import matplotlib.cm as cm
-from matplotlib.colors import Normalize
 
 DEFLAULT_NODES = 10
-FIGURE_SIZE = 12
-LABEL_SIZE = 10
-POSITION_SEED = 42
-EDGE_COLOR = "gray"
-NODE_COLOR = "skyblue"
-EGO_NODE_COLOR = "coral"
-EDGE_WIDTH = 0.5
-NODE_EDGE_COLOR = "black"
-LABEL_FONT_COLOR = "darkorange"
-EGO_NODE_LABEL_COLOR = "black"
-LEGEND_COLOR = "white"
-TRANSPARENCY = 0.8
-DEFAULT_LAYOUT = "spring"
-NODE_SIZE = 100
-SAMLL_NODE_SIZE = 10
-HIGHLIGHT_NODE_SIZE = 360
-COLOR_MAP = cm.viridis
-GARPH_PATH = "graphs/"
-
-
-def create_adjacency_list(edges_file_path: str) -> dict:
+
+
+SELF_LOOP_POLICIES = ("keep", "drop", "error")
+MAX_PACKED_SPAN = 3_037_000_499  # largest id span whose (u, v) pairs pack into one int64
+
+
+def parse_edge_lines(lines: list) -> np.ndarray:
     """
-    Reads an undirected, unweighted graph from a file and returns its adjacency list representation.
+    Parses "u v" lines into an (m, 2) int64 array in one NumPy conversion.
 
     Args:
-        edges_file_path (str): Path to the file containing edges.
+        lines (list): Lines of an edge file.
 
     Returns:
-        dict: A dictionary where keys are vertices and values are lists of connected vertices.
+        np.ndarray: Array of the edges, one row per line.
+
+    Raises:
+        ValueError: If a line does not hold exactly two integers.
+    """
+    if not lines:
+        return np.zeros((0, 2), dtype=np.int64)
+    try:
+        edges = np.array([line.split() for line in lines], dtype=np.int64)
+        if edges.ndim == 2 and edges.shape[1] == 2:
+            return edges
+    except (ValueError, OverflowError):
+        pass
+    # Slow path, only to report the offending line
+    for line in lines:
+        try:
+            u, v = map(int, line.strip().split())
+        except ValueError:
+            raise ValueError(f"Invalid line in file: {line.strip()}")
+    raise ValueError("Node ids must fit in 64-bit integers")
+
+
+def read_edges(edges_file_path: str) -> np.ndarray:
+    """
+    Reads the edges of a file as an (m, 2) int64 array, in file order.
 
     Raises:
         FileNotFoundError: If the file does not exist.
         ValueError: If the file contains invalid data.
     """
-    adjacency_list = {}
     try:
         with open(edges_file_path, 'r') as file:
-            for line in file:
-                try:
-                    u, v = map(int, line.strip().split())
-                    if u not in adjacency_list:
-                        adjacency_list[u] = []
-                    if v not in adjacency_list:
-                        adjacency_list[v] = []
-                    adjacency_list[u].append(v)
-                    if u != v:
-                        adjacency_list[v].append(u)
-                except ValueError:
-                    raise ValueError(f"Invalid line in file: {line.strip()}")
+            lines = file.readlines()
     except FileNotFoundError:
         raise FileNotFoundError(f"File not found: {edges_file_path}")
+    return parse_edge_lines(lines)
+
+
+def _apply_self_loop_policy(edges: np.ndarray, self_loops: str) -> np.ndarray:
+    if self_loops not in SELF_LOOP_POLICIES:
+        raise ValueError(f"Unknown self-loop policy: {self_loops}. Choose one of {SELF_LOOP_POLICIES}.")
+    loops = edges[:, 0] == edges[:, 1]
+    if self_loops == "error" and loops.any():
+        node = edges[np.argmax(loops), 0]
+        raise ValueError(f"Self-loop in file: {node} {node}")
+    return edges[~loops] if self_loops == "drop" else edges
+
+
+def deduplicate_edges(edges: np.ndarray, self_loops: str="keep", stats: dict=None) -> np.ndarray:
+    """
+    Removes duplicate undirected edges, keeping the first occurrence of each in file order.
+
+    "u v" and "v u" are the same edge. Pairs are canonicalized to (min, max) and packed into one
+    int64 key when the id span allows it, so a single np.unique finds the duplicates.
+
+    Args:
+        edges (np.ndarray): (m, 2) array of edges.
+        self_loops (str): 'keep' self-loops (once), 'drop' them, or raise an 'error'.
+        stats (dict): Optional dictionary filled with the number of "lines", "self_loops" and "duplicate_edges".
+
+    Returns:
+        np.ndarray: The unique edges, in the order of their first occurrence.
+
+    Raises:
+        ValueError: If the policy is unknown, or if it is 'error' and there is a self-loop.
+    """
+    num_lines = len(edges)
+    num_loops = int(np.count_nonzero(edges[:, 0] == edges[:, 1]))
+    edges = _apply_self_loop_policy(edges, self_loops)
+    canonical = np.sort(edges, axis=1)
+    if len(canonical) == 0:
+        first = np.zeros(0, dtype=np.int64)
+    elif int(canonical.max()) - int(canonical.min()) < MAX_PACKED_SPAN:
+        low = canonical.min()
+        span = canonical.max() - low + 1
+        _, first = np.unique((canonical[:, 0] - low) * span + (canonical[:, 1] - low), return_index=True)
+    else:
+        _, first = np.unique(canonical, axis=0, return_index=True)
+    first.sort()
+    if stats is not None:
+        stats["lines"] = num_lines
+        stats["self_loops"] = num_loops
+        stats["duplicate_edges"] = len(edges) - len(first)
+    return edges[first]
+
+
+def create_adjacency_list(edges_file_path: str, deduplicate: bool=True, self_loops: str="keep",
+                          stats: dict=None) -> dict:
+    """
+    Reads an undirected, unweighted graph from a file and returns its adjacency list representation.
+
+    The edges are parsed, deduplicated and grouped by node with NumPy. Nodes and neighbors keep the order
+    in which they first appear in the file.
+
+    Args:
+        edges_file_path (str): Path to the file containing edges.
+        deduplicate (bool): Whether to store each undirected edge once, however many times and in whichever
+                            direction it is listed. Default is True; False keeps duplicates as parallel edges.
+        self_loops (str): 'keep' self-loops (once), 'drop' them, or raise an 'error'. Default is 'keep'.
+        stats (dict): Optional dictionary filled with the number of "lines", "self_loops", "duplicate_edges",
+                      "nodes" and "edges" (unique undirected edges kept).
+
+    Returns:
+        dict: A dictionary where keys are vertices and values are lists of connected vertices.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        ValueError: If the file contains invalid data.
+    """
+    edges = read_edges(edges_file_path)
+    # Node order of first appearance, taken before dropping anything so nodes of dropped self-loops remain
+    ids, first_seen = np.unique(edges.ravel(), return_index=True)
+    nodes = ids[np.argsort(first_seen, kind="stable")].tolist()
+
+    load_stats = {}
+    if deduplicate:
+        edges = deduplicate_edges(edges, self_loops, load_stats)
+    else:
+        load_stats = {"lines": len(edges), "self_loops": int(np.count_nonzero(edges[:, 0] == edges[:, 1])),
+                      "duplicate_edges": 0}
+        edges = _apply_self_loop_policy(edges, self_loops)
+
+    # Directed entries in file order: u -> v, then v -> u unless it is a self-loop
+    sources = edges.ravel()
+    targets = edges[:, ::-1].ravel()
+    keep = np.ones(len(sources), dtype=bool)
+    keep[1::2] = edges[:, 0] != edges[:, 1]
+    sources, targets = sources[keep], targets[keep]
+    order = np.argsort(sources, kind="stable")
+    sources, targets = sources[order], targets[order]
+    grouped, starts = np.unique(sources, return_index=True)
+    neighbors = dict(zip(grouped.tolist(), (group.tolist() for group in np.split(targets, starts[1:]))))
+    adjacency_list = {node: neighbors.get(node, []) for node in nodes}
+
+    if stats is not None:
+        stats.update(load_stats)
+        stats["nodes"] = len(adjacency_list)
+        stats["edges"] = len(edges)
     return adjacency_list
 
 
-def create_adjacency_matrix(edges_file_path: str) -> np.ndarray:
+def create_adjacency_matrix(edges_file_path: str, dtype=int, self_loops: str="keep") -> np.ndarray:
 
     """
     Reads an undirected, unweighted graph from a file and returns its adjacency matrix representation.
 
     Args:
         edges_file_path (str): Path to the file containing edges.
+        dtype: NumPy dtype of the matrix; np.uint8 takes an eighth of the memory of the default int.
+        self_loops (str): 'keep' self-loops, 'drop' them, or raise an 'error', as in create_adjacency_list.
 
     Returns:
         np.ndarray: A NumPy array representing the adjacency matrix of the graph.
@@ -74,30 +173,56 @@ def create_adjacency_matrix(edges_file_path: str) -> np.ndarray:
         FileNotFoundError: If the file does not exist.
         ValueError: If the file contains invalid data.
     """
-    edges = []
-    max_vertex = -1
-    try:
-        with open(edges_file_path, 'r') as file:
-            for line in file:
-                try:
-                    u, v = map(int, line.strip().split())
-                    edges.append((u, v))
-                    max_vertex = max(max_vertex, u, v)
-                except ValueError:
-                    raise ValueError(f"Invalid line in file: {line.strip()}")
-    except FileNotFoundError:
-        raise FileNotFoundError(f"File not found: {edges_file_path}")
+    edges = read_edges(edges_file_path)
+    max_vertex = int(edges.max()) if len(edges) else -1
+    edges = _apply_self_loop_policy(edges, self_loops)
 
     # Initialize a (max_vertex + 1) x (max_vertex + 1) matrix with zeros using NumPy
-    adjacency_matrix = np.zeros((max_vertex + 1, max_vertex + 1), dtype=int)
+    adjacency_matrix = np.zeros((max_vertex + 1, max_vertex + 1), dtype=dtype)
 
-    for u, v in edges:
-        adjacency_matrix[u][v] = 1
-        adjacency_matrix[v][u] = 1
+    adjacency_matrix[edges[:, 0], edges[:, 1]] = 1
+    adjacency_matrix[edges[:, 1], edges[:, 0]] = 1
 
     return adjacency_matrix
 
 
+def create_csr(adjacency_list: dict, compact: bool=False) -> tuple:
+    """
+    Converts an adjacency list into compressed sparse row (CSR) arrays.
+
+    Args:
+        adjacency_list (dict): A dictionary where keys are vertices and values are lists of connected vertices.
+        compact (bool): Whether to store indptr and indices as int32 when the graph is small enough,
+                        halving the memory of the arrays. Default is False (int64).
+
+    Returns:
+        tuple: (nodes, indptr, indices)
+            - nodes: List of vertices; vertex nodes[i] is represented by index i.
+            - indptr: NumPy array of length len(nodes) + 1; the neighbors of index i are
+              indices[indptr[i]:indptr[i + 1]], in adjacency list order.
+            - indices: NumPy array of neighbor indices.
+
+    Raises:
+        TypeError: If adjacency_list is not a dictionary.
+        KeyError: If a neighbor is not a key of the adjacency list.
+    """
+    if not isinstance(adjacency_list, dict):
+        raise TypeError("adjacency_list must be a dictionary")
+    nodes = list(adjacency_list)
+    index = {node: i for i, node in enumerate(nodes)}
+    degrees = np.fromiter((len(neighbors) for neighbors in adjacency_list.values()),
+                          dtype=np.int64, count=len(nodes))
+    indptr = np.zeros(len(nodes) + 1, dtype=np.int64)
+    np.cumsum(degrees, out=indptr[1:])
+    int32_max = np.iinfo(np.int32).max
+    index_dtype = np.int32 if compact and len(nodes) <= int32_max else np.int64
+    indices = np.fromiter((index[neighbor] for neighbors in adjacency_list.values() for neighbor in neighbors),
+                          dtype=index_dtype, count=int(indptr[-1]))
+    if compact and indptr[-1] <= int32_max:
+        indptr = indptr.astype(np.int32)
+    return nodes, indptr, indices
+
+
 def get_top_centrality(centrality, top_n: int=DEFLAULT_NODES) -> list:
     """
     Get the top N nodes based on their centrality scores.
@@ -150,206 +275,25 @@ def compare_centrality_with_egos(centrality_list: list[tuple], ego_vertices: set
         print("Missed ego vertices:", missed_ego_vertices)
 
 
-def plot_social_network_with_centrality(
-    adjacency_list,
-    centrality,
-    centrality_measure,
-    top_nodes,
-    layout_algorithm=DEFAULT_LAYOUT,
-):
-    """
-    Visualizes a social network using NetworkX and Matplotlib.
+_VISUALIZATION_NAMES = (
+    "plot_social_network", "plot_social_network_with_centrality", "FIGURE_SIZE", "LABEL_SIZE",
+    "POSITION_SEED", "EDGE_COLOR", "NODE_COLOR", "EGO_NODE_COLOR", "EDGE_WIDTH", "NODE_EDGE_COLOR",
+    "LABEL_FONT_COLOR", "EGO_NODE_LABEL_COLOR", "LEGEND_COLOR", "TRANSPARENCY", "DEFAULT_LAYOUT",
+    "NODE_SIZE", "SAMLL_NODE_SIZE", "HIGHLIGHT_NODE_SIZE", "COLOR_MAP", "GARPH_PATH",
+)
 
-    Args:
-        adjacency_list (dict): Adjacency list data as a dictionary of adjacency_list.
-        centrality (dict): Centrality measure to visualize ('betweenness', 'eigenvector', 'pagerank').
-        centrality_measure (str): The centrality measure used for visualization.
-        top_nodes (list): List of top N nodes to highlight.
-        layout_algorithm (str): Layout algorithm ('spring', 'circular', 'kamada_kawai').
-    """
-    # Load adjacency list
-    if not isinstance(adjacency_list, dict):
-        raise TypeError("adjacency_list must be a dictionary")
 
-    # Create NetworkX graph from adjacency list
-    nx_graph = nx.Graph(adjacency_list)
-    
-    # Normalize centrality values for visualization
-    min_centrality = min(centrality.values())
-    max_centrality = max(centrality.values())
-    norm = Normalize(vmin=min_centrality, vmax=max_centrality)
-    
-    # Set node sizes based on normalized centrality
-    node_sizes = [norm(centrality[node]) * NODE_SIZE for node in nx_graph.nodes()]
-    
-    # Create set of top nodes for highlighting
-    top_nodes_set = set(node for node, _ in top_nodes)
-    
-    # Choose layout based on specified algorithm
-    if layout_algorithm == "spring":
-        pos = nx.spring_layout(nx_graph, seed=POSITION_SEED)
-    elif layout_algorithm == "circular":
-        pos = nx.circular_layout(nx_graph)
-    elif layout_algorithm == "kamada_kawai":
-        pos = nx.kamada_kawai_layout(nx_graph)
-    else:
-        raise ValueError("Invalid layout_algorithm. Choose 'spring', 'circular', or 'kamada_kawai'.")
-    
-    # Create figure and axis
-    fig, ax = plt.subplots(figsize=(FIGURE_SIZE, FIGURE_SIZE))
-    
-    # Draw all nodes with color based on centrality
-    nx.draw_networkx_nodes(
-        nx_graph,
-        pos,
-        node_size=node_sizes,
-        node_color=[centrality[node] for node in nx_graph.nodes()],
-        cmap=COLOR_MAP,
-        alpha=TRANSPARENCY,
-        ax=ax
-    )
-    
-    # Draw edges
-    nx.draw_networkx_edges(
-        nx_graph,
-        pos,
-        width=EDGE_WIDTH,
-        edge_color=EDGE_COLOR,
-        alpha=TRANSPARENCY,
-        ax=ax
-    )
-    
-    # Draw the top nodes with a different border color to highlight them
-    if top_nodes_set:
-        top_node_sizes = [norm(centrality[node]) * HIGHLIGHT_NODE_SIZE for node in top_nodes_set]
-        nx.draw_networkx_nodes(
-            nx_graph,
-            pos,
-            nodelist=list(top_nodes_set),
-            node_size=top_node_sizes,
-            node_color=[centrality[node] for node in top_nodes_set],
-            cmap=COLOR_MAP,
-            edgecolors=NODE_EDGE_COLOR,
-            linewidths=EDGE_WIDTH,
-            alpha=TRANSPARENCY,
-            ax=ax
-        )
-    
-    # Add node labels for top nodes only to prevent overcrowding
-    labels = {node: str(node) for node in top_nodes_set}
-    nx.draw_networkx_labels(
-        nx_graph,
-        pos,
-        labels=labels,
-        font_size=LABEL_SIZE,
-        font_color=LABEL_FONT_COLOR,
-        font_weight='bold',
-        ax=ax
-    )
-    
-    # Add colorbar
-    sm = plt.cm.ScalarMappable(cmap=COLOR_MAP, norm=norm)
-    sm.set_array([])
-    cbar = fig.colorbar(sm, ax=ax)
-    cbar.set_label(f'{centrality_measure.capitalize()} Centrality')
-    
-    # Set title and remove axis
-    plt.title(f"Social Network Visualization - {centrality_measure.capitalize()} Centrality")
-    plt.axis('off')
-    
-    #Add legend for top influencers
-    legend_elements = [plt.Line2D([0], [0], marker='o', color=LEGEND_COLOR, 
-                                 markerfacecolor=LABEL_FONT_COLOR, markersize=LABEL_SIZE, 
-                                 label=f'Top {len(top_nodes_set)} Influencers')]
-    ax.legend(handles=legend_elements, loc='upper right')
-    
-    # Save the figure
-    output_filename = f"{centrality_measure.title()} Graph.png"
-    plt.savefig(GARPH_PATH + output_filename, bbox_inches='tight')
-    print(f"Social network visualization saved as {output_filename}")
-
-
-def plot_social_network(adjacency_list:dict, ego_nodes:set) -> None:
+def __getattr__(name: str):
     """
-    Visualizes a social network using NetworkX and Matplotlib.
-
-    Args:
-        adjacency_list (dict): Adjacency list data as a dictionary of adjacency_list.
-        ego_nodes (set): Set of ego nodes to highlight.
-
-    Returns:
-        None
+    Resolve the plotting functions and constants that used to live here from visualization on first
+    use, so importing utils for loading and ranking does not import networkx or matplotlib.
+    COLOR_MAP is still the colormap itself, as it was here; visualization keeps its name.
     """
-    # Load adjacency list
-    if not isinstance(adjacency_list, dict):
-        raise TypeError("adjacency_list must be a dictionary")
-
-    # Create NetworkX graph from adjacency list
-    nx_graph = nx.Graph(adjacency_list)
-    
-    # Choose layout based on specified algorithm
-    pos = nx.spring_layout(nx_graph, seed=POSITION_SEED)
-
-    # Create figure and axis
-    _, ax = plt.subplots(figsize=(FIGURE_SIZE, FIGURE_SIZE))
-
-    # Draw all nodes with color based on centrality
-    nx.draw_networkx_nodes(
-        nx_graph,
-        pos,
-        node_color=NODE_COLOR,
-        node_size=SAMLL_NODE_SIZE,
-        alpha=TRANSPARENCY,
-        ax=ax
-    )
-    
-    # Draw edges
-    nx.draw_networkx_edges(
-        nx_graph,
-        pos,
-        width=EDGE_WIDTH,
-        edge_color=EDGE_COLOR,
-        alpha=TRANSPARENCY,
-        ax=ax
-    )
-    
-    # Highlight ego nodes with a different node color
-    ego_node_size = [HIGHLIGHT_NODE_SIZE for _ in ego_nodes]
-    nx.draw_networkx_nodes(
-        nx_graph,
-        pos,
-        nodelist=list(ego_nodes),
-        node_size=ego_node_size,
-        node_color=EGO_NODE_COLOR,
-        edgecolors=NODE_EDGE_COLOR,
-        linewidths=EDGE_WIDTH,
-        alpha=TRANSPARENCY,
-        ax=ax
-    )
-
-    # Add node labels for ego nodes only to prevent overcrowding
-    labels = {node: str(node) for node in ego_nodes}
-    nx.draw_networkx_labels(
-        nx_graph,
-        pos,
-        labels=labels,
-        font_size=LABEL_SIZE,
-        font_color=EGO_NODE_LABEL_COLOR,
-        font_weight='bold',
-        ax=ax
-    )
-
-    # Add legend for ego nodes
-    legend_elements = [plt.Line2D([0], [0], marker='o', color=LEGEND_COLOR, 
-                                 markerfacecolor=EGO_NODE_COLOR, markersize=LABEL_SIZE, 
-                                 label=f'Ego Nodes')]
-    ax.legend(handles=legend_elements, loc='upper right')
-
-    # Set title and remove axis
-    plt.title("SNAP Facebook Social Network Visualization")
-    plt.axis('off')
-
-    # Save the figure
-    output_filename = "Facebook Dataset.png"
-    plt.savefig(GARPH_PATH + output_filename, bbox_inches='tight')
-    print(f"Social network visualization saved as {output_filename}")
\ No newline at end of file
+    if name == "COLOR_MAP":
+        import matplotlib
+        import visualization
+        return matplotlib.colormaps[visualization.COLOR_MAP]
+    if name in _VISUALIZATION_NAMES:
+        import visualization
+        return getattr(visualization, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")